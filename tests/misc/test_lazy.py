@@ -0,0 +1,41 @@
+"""
+Tests for the internal lazy optional-dependency proxy (xpytools._lazy).
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+from xpytools._lazy import LazyModule
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_lazy_module_availability_without_import():
+    missing = LazyModule("nonexistent_module_xyz")
+    assert not missing
+    assert not missing.loaded
+
+
+def test_lazy_module_imports_on_first_attribute_access():
+    mod = LazyModule("json")
+    assert mod
+    assert mod.dumps({"a": 1}) == '{"a": 1}'
+    assert mod.loaded
+
+
+def test_importing_package_does_not_load_heavy_dependencies():
+    code = (
+            "import sys, xpytools\n"
+            "from xpytools.xtype.xcheck import is_none, is_df\n"
+            "assert is_none('N/A') and not is_df([])\n"
+            "heavy = ('pandas', 'numpy', 'PIL', 'requests', 'pydantic', 'polars', 'pyarrow')\n"
+            "print(','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+            )
+    assert out.stdout.strip() == ""
@@ -4,6 +4,9 @@ Unit tests for xpytools.types.literal_enum
 Covers: LiteralEnum, StrLiteral, IntLiteral, FloatLiteral, AnyTLiteral
 """
 
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 from pydantic import BaseModel, ValidationError
 
@@ -14,6 +17,17 @@ from xpytools.xtype.choice import (
     anyChoice,
     )
 
+Species = strChoice("cat", "dog")
+
+
+class Pet(BaseModel):
+    kind: Species
+    legs: intChoice(2, 4)
+
+
+def _validate_pet(payload: dict) -> Pet:
+    return Pet(**payload)
+
 
 # ---------------------------------------------------------------------------
 # LiteralEnum Base Behavior
@@ -142,3 +156,149 @@ def test_pydantic_rejects_invalid_values():
 
     with pytest.raises(ValidationError):
         Animal(kind="fish")
+
+
+# ---------------------------------------------------------------------------
+# Interning & Pickling
+# ---------------------------------------------------------------------------
+
+def test_equal_choices_are_interned():
+    assert strChoice("a", "b") is strChoice("a", "b")
+    assert strChoice("a", "b") is not strChoice("b", "a")
+    assert intChoice(1, 2) is not floatChoice(1.0, 2.0)
+    assert intChoice(1, 2) is not anyChoice(True, 2)
+
+
+def test_unused_interned_choices_are_released():
+    import gc
+
+    from xpytools.xtype.choice._LiteralEnumType import _INTERNED
+
+    Temp = strChoice("tmp-a", "tmp-b")
+    key = (False, ("tmp-a", "tmp-b"), (str, str))
+    assert _INTERNED[key] is Temp
+    del Temp
+    gc.collect()
+    assert key not in _INTERNED
+
+
+def test_unhashable_choices_are_not_interned():
+    Mixed = anyChoice("a", {})
+    assert Mixed({}) == {}
+    assert anyChoice("a", {}) is not Mixed
+
+
+def test_choice_types_pickle_to_interned_instance():
+    Color = strChoice("red", "green")
+    assert pickle.loads(pickle.dumps(Color)) is Color
+    Code = intChoice(200, 404)
+    assert pickle.loads(pickle.dumps(Code))(404) == 404
+
+
+def test_models_with_choices_work_in_process_pool():
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        pet = pool.submit(_validate_pet, {"kind": "dog", "legs": 4}).result()
+        with pytest.raises(ValidationError):
+            pool.submit(_validate_pet, {"kind": "fish", "legs": 4}).result()
+    assert pet == Pet(kind="dog", legs=4)
+    assert pickle.loads(pickle.dumps(Pet.model_fields)).keys() == Pet.model_fields.keys()
+
+
+# ---------------------------------------------------------------------------
+# Indexed validation & casefold
+# ---------------------------------------------------------------------------
+
+def test_string_input_is_coerced_through_index():
+    Code = intChoice(200, 404)
+    assert Code("404") == 404 and isinstance(Code("404"), int)
+    assert Code(" 200 ") == 200  # base-type coercion fallback still applies
+    Ratio = floatChoice(0.5, 1.0)
+    assert Ratio("0.5") == 0.5
+    assert Ratio("1") == 1.0
+
+
+def test_casefold_is_opt_in():
+    Method = strChoice("GET", "POST")
+    with pytest.raises(ValueError):
+        Method("get")
+    Loose = strChoice("GET", "POST", casefold=True)
+    assert Loose("get") == "GET"
+    assert Loose("Post") == "POST"
+    assert Loose is not Method
+    assert pickle.loads(pickle.dumps(Loose)) is Loose
+
+
+def test_any_choice_does_not_coerce_across_types():
+    Mixed = anyChoice("1", 2)
+    assert Mixed("1") == "1"
+    with pytest.raises(ValueError):
+        Mixed(1)
+    assert anyChoice("Yes", 1, casefold=True)("YES") == "Yes"
+
+
+def test_unhashable_values_are_rejected_cleanly():
+    Color = strChoice("red")
+    with pytest.raises(ValueError):
+        Color(["red"])
+
+
+# ---------------------------------------------------------------------------
+# Column-wise validation & categorical encoding
+# ---------------------------------------------------------------------------
+
+def test_validate_array_masks():
+    pd = pytest.importorskip("pandas")
+    np = pytest.importorskip("numpy")
+    Status = strChoice("open", "closed")
+    s = pd.Series(["open", "closed", "Open", None], index=list("abcd"))
+    mask = Status.validate_array(s)
+    assert isinstance(mask, pd.Series)
+    assert mask.index.tolist() == list("abcd")
+    assert mask.tolist() == [True, True, False, False]
+    arr = Status.validate_array(np.array(["open", "x"], dtype=object))
+    assert isinstance(arr, np.ndarray) and arr.tolist() == [True, False]
+    assert intChoice(1, 2).validate_array([1, 2, 3]).tolist() == [True, True, False]
+
+
+def test_validate_array_raise_errors_names_positions():
+    pd = pytest.importorskip("pandas")
+    Status = strChoice("open", "closed")
+    assert Status.validate_array(pd.Series(["open"]), raise_errors=True).all()
+    with pytest.raises(ValueError, match=r"2 invalid value\(s\) at positions \[1, 3\]"):
+        Status.validate_array(pd.Series(["open", "x", "closed", "y"]), raise_errors=True)
+
+
+def test_validate_array_casefold():
+    pd = pytest.importorskip("pandas")
+    Status = strChoice("open", "closed", casefold=True)
+    assert Status.validate_array(pd.Series(["OPEN", "Closed", "x"])).tolist() == [True, True, False]
+
+
+def test_to_categorical_series_and_codes():
+    pd = pytest.importorskip("pandas")
+    Status = strChoice("open", "closed", "pending")
+    s = pd.Series(["closed", "open", None, "closed"], name="status")
+    cat = Status.to_categorical(s)
+    assert isinstance(cat.dtype, pd.CategoricalDtype)
+    assert cat.cat.categories.tolist() == ["open", "closed", "pending"]
+    assert cat.name == "status"
+    codes = Status.to_categorical(s, codes=True)
+    assert codes.tolist() == [1, 0, -1, 1]
+    plain = Status.to_categorical(["pending", "open"])
+    assert isinstance(plain, pd.Categorical)
+    assert Status.to_categorical(["pending", "open"], codes=True).tolist() == [2, 0]
+
+
+def test_to_categorical_invalid_values():
+    pd = pytest.importorskip("pandas")
+    Status = strChoice("open", "closed")
+    with pytest.raises(ValueError, match="positions \\[1\\]"):
+        Status.to_categorical(pd.Series(["open", "bogus"]))
+    lenient = Status.to_categorical(pd.Series(["open", "bogus"]), raise_errors=False)
+    assert lenient.isna().tolist() == [False, True]
+
+
+def test_vectorized_helpers_require_hashable_choices():
+    pytest.importorskip("pandas")
+    with pytest.raises(TypeError):
+        anyChoice("a", {}).validate_array(["a"])
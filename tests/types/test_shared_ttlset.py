@@ -0,0 +1,85 @@
+"""
+Unit tests for xpytools.xtype.SharedTTLSet
+------------------------------------------
+Tests TTL expiration, slot reuse, and cross-process deduplication.
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from xpytools.xtype import SharedTTLSet
+
+
+@pytest.fixture
+def shared():
+    s = SharedTTLSet(ttl=5, maxsize=64)
+    yield s
+    s.unlink()
+
+
+def test_add_and_contains(shared):
+    assert "a" not in shared
+    assert shared.add("a") is True
+    assert "a" in shared
+    assert shared.add("a") is False  # already live, only refreshed
+    assert len(shared) == 1
+
+
+def test_entries_expire():
+    with SharedTTLSet(ttl=0.2, maxsize=16) as s:
+        s.add("a")
+        assert "a" in s
+        time.sleep(0.3)
+        assert "a" not in s
+        assert s.add("a") is True  # expired slot is claimed again
+
+
+def test_discard_and_clear(shared):
+    shared.add("a")
+    shared.add("b")
+    shared.discard("a")
+    assert "a" not in shared and "b" in shared
+    shared.clear()
+    assert "b" not in shared
+    assert len(shared) == 0
+
+
+def test_full_table_evicts_oldest():
+    with SharedTTLSet(ttl=5, maxsize=4) as s:
+        for i in range(10):
+            s.add(f"k{i}")
+        assert len(s) == 4
+        assert "k9" in s
+
+
+def test_attach_by_name_requires_lock(shared):
+    with pytest.raises(ValueError):
+        SharedTTLSet(name=shared.name, create=False)
+
+    other = SharedTTLSet(name=shared.name, create=False, lock=shared._lock)
+    shared.add("x")
+    assert "x" in other
+    other.close()
+
+
+def _claim(shared, keys, out):
+    out.put([k for k in keys if shared.add(k)])
+
+
+def test_processes_deduplicate_concurrently():
+    ctx = multiprocessing.get_context()
+    keys = [f"job-{i}" for i in range(300)]
+    with SharedTTLSet(ttl=30, maxsize=2048) as shared:
+        out = ctx.Queue()
+        procs = [ctx.Process(target=_claim, args=(shared, keys, out)) for _ in range(4)]
+        for p in procs:
+            p.start()
+        claimed = [out.get(timeout=30) for _ in procs]
+        for p in procs:
+            p.join(timeout=30)
+
+        flat = [k for batch in claimed for k in batch]
+        assert sorted(flat) == sorted(keys)  # every key claimed exactly once
+        assert all(k in shared for k in keys)
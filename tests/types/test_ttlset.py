@@ -79,3 +79,266 @@ def test_thread_safety_during_concurrent_adds():
 
     # Should not raise any exceptions and still contain some keys
     assert any(f"k{i}" in s for i in range(5))
+
+
+# ---------------------------------------------------------------------------
+# Snapshot / warm restart
+# ---------------------------------------------------------------------------
+
+def test_dump_and_load_roundtrip(tmp_path):
+    path = tmp_path / "seen.ttl"
+    s = TTLSet(ttl=5, maxsize=10)
+    for key in ("a", "b", "ünïcødé"):
+        s.add(key)
+
+    assert s.dump(path) == 3
+
+    restored = TTLSet(ttl=5, maxsize=10)
+    assert restored.load(path) == 3
+    assert "a" in restored and "b" in restored and "ünïcødé" in restored
+    assert list(restored._cache) == ["a", "b", "ünïcødé"]
+
+
+def test_load_keeps_remaining_ttl(tmp_path):
+    path = tmp_path / "seen.ttl"
+    s = TTLSet(ttl=0.5)
+    s.add("short")
+    time.sleep(0.3)
+    s.dump(path)
+
+    restored = TTLSet(ttl=60)
+    restored.load(path)
+    assert "short" in restored
+    time.sleep(0.3)
+    assert "short" not in restored  # only ~0.2s were left at dump time
+
+
+def test_load_skips_expired_and_respects_maxsize(tmp_path):
+    path = tmp_path / "seen.ttl"
+    s = TTLSet(ttl=0)
+    s.add("gone")
+    assert s.dump(path) == 0
+
+    s = TTLSet(ttl=5, maxsize=10)
+    for i in range(5):
+        s.add(f"k{i}")
+    s.dump(path)
+
+    restored = TTLSet(ttl=60, maxsize=3)
+    restored.add("fresh")
+    restored.load(path)
+    assert len(restored._cache) == 3
+    assert "fresh" in restored  # expires last, so it survives the maxsize cut
+    assert "k4" in restored and "k0" not in restored
+
+
+def test_load_rejects_foreign_files(tmp_path):
+    path = tmp_path / "bogus.ttl"
+    path.write_bytes(b"not a snapshot at all, definitely not" * 2)
+    with pytest.raises(ValueError):
+        TTLSet().load(path)
+
+
+def test_checkpoint_written_on_close(tmp_path):
+    path = tmp_path / "checkpoint.ttl"
+    with TTLSet(ttl=5, checkpoint_path=path, checkpoint_interval=30) as s:
+        s.add("job-1")
+    assert path.exists()
+
+    restored = TTLSet(ttl=5)
+    restored.load(path)
+    assert "job-1" in restored
+
+
+def test_background_checkpoint_runs_periodically(tmp_path):
+    path = tmp_path / "checkpoint.ttl"
+    s = TTLSet(ttl=5, checkpoint_path=path, checkpoint_interval=0.05)
+    try:
+        s.add("job-1")
+        deadline = time.monotonic() + 2
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert path.exists()
+    finally:
+        s.close()
+
+
+def test_failing_background_checkpoint_is_logged(tmp_path, caplog):
+    path = tmp_path / "missing-dir" / "checkpoint.ttl"
+    s = TTLSet(ttl=5, checkpoint_path=path, checkpoint_interval=0.05)
+    try:
+        s.add("job-1")
+        deadline = time.monotonic() + 2
+        while not caplog.records and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert any("_checkpoint failed" in r.getMessage() and r.exc_info for r in caplog.records)
+        assert s._workers[0]._thread.is_alive()
+    finally:
+        with pytest.raises(OSError):
+            s.close()
+
+
+# ---------------------------------------------------------------------------
+# Background sweeper
+# ---------------------------------------------------------------------------
+
+def test_background_sweeper_purges_without_calls():
+    s = TTLSet(ttl=0.1, maxsize=1000, background_sweep=0.05, sweep_batch=7)
+    try:
+        for i in range(100):
+            s.add(f"k{i}")
+        deadline = time.monotonic() + 2
+        while s._cache and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert len(s._cache) == 0
+    finally:
+        s.close()
+
+
+@pytest.mark.parametrize("options", [
+    {"background_sweep": 0.05, "checkpoint_interval": 0},
+    {"background_sweep": -1},
+])
+def test_invalid_intervals_start_no_threads(tmp_path, options):
+    before = set(threading.enumerate())
+    with pytest.raises(ValueError, match="must be positive"):
+        TTLSet(ttl=1, checkpoint_path=tmp_path / "c.ttl", **options)
+    assert set(threading.enumerate()) <= before
+
+
+def test_concurrent_dumps_to_one_path(tmp_path):
+    path = tmp_path / "seen.ttl"
+    s = TTLSet(ttl=60, maxsize=10_000)
+    for i in range(5_000):
+        s.add(f"key-{i}")
+    threads = [threading.Thread(target=s.dump, args=(path,)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    restored = TTLSet(ttl=60, maxsize=10_000)
+    assert restored.load(path) == 5_000
+    assert [p.name for p in tmp_path.iterdir()] == ["seen.ttl"]
+
+
+@pytest.mark.parametrize("batch", [0, -1])
+def test_sweep_batch_must_be_positive(batch):
+    with pytest.raises(ValueError, match="sweep_batch"):
+        TTLSet(ttl=1, background_sweep=0.05, sweep_batch=batch)
+
+
+def test_background_sweeper_keeps_add_inline_free(monkeypatch):
+    s = TTLSet(ttl=5, sweep_interval=1, background_sweep=60)
+    try:
+        monkeypatch.setattr(s, "_sweep_locked", lambda *a: pytest.fail("inline sweep ran"))
+        for i in range(10):
+            s.add(f"k{i}")
+        assert "k9" in s
+    finally:
+        s.close()
+
+
+def test_close_stops_sweeper_thread():
+    s = TTLSet(ttl=1, background_sweep=0.01)
+    threads = [w._thread for w in s._workers]
+    s.close()
+    assert all(not t.is_alive() for t in threads)
+    s.close()  # idempotent
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+
+def test_stats_disabled_by_default():
+    s = TTLSet()
+    s.add("a")
+    assert s.stats() is None
+
+
+def test_stats_count_hits_misses_and_refreshes():
+    s = TTLSet(ttl=5, stats=True)
+    s.add("a")
+    s.add("a")
+    assert "a" in s
+    assert "b" not in s
+
+    st = s.stats()
+    assert st["inserts"] == 1
+    assert st["refreshes"] == 1
+    assert st["hits"] == 1
+    assert st["misses"] == 1
+    assert st["size"] == 1
+    assert st["lock_wait_time"] >= 0
+
+
+def test_stats_separate_evictions_from_expirations():
+    s = TTLSet(ttl=5, maxsize=2, stats=True)
+    for key in ("a", "b", "c"):
+        s.add(key)
+    assert s.stats()["evictions"] == 1  # "a" dropped while still live
+
+    s = TTLSet(ttl=0, sweep_interval=2, stats=True)
+    s.add("a")
+    s.add("b")
+    st = s.stats(reset=True)
+    assert st["expirations"] == 2
+    assert st["evictions"] == 0
+    assert st["sweeps"] == 1
+    assert s.stats()["expirations"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Injectable clock / event time
+# ---------------------------------------------------------------------------
+
+class FakeClock:
+    def __init__(self, t: float = 0.0):
+        self.t = t
+
+    def __call__(self) -> float:
+        return self.t
+
+
+def test_custom_clock_drives_expiry():
+    clock = FakeClock(100.0)
+    s = TTLSet(ttl=10, clock=clock)
+    s.add("a")
+    clock.t = 109.9
+    assert "a" in s
+    clock.t = 110.0
+    assert "a" not in s
+
+
+def test_explicit_event_time():
+    s = TTLSet(ttl=60, maxsize=100)
+    s.add("evt-1", now=1_000.0)
+    assert s.contains("evt-1", now=1_030.0)
+    assert not s.contains("evt-1", now=1_060.0)
+
+    s.add("evt-2", now=2_000.0)
+    s.add("evt-3", now=2_050.0)
+    s.sweep(now=2_070.0)
+    assert list(s._cache) == ["evt-3"]
+
+
+def test_background_sweep_handles_out_of_order_event_times():
+    t = [100.0]
+    s = TTLSet(ttl=10, maxsize=100, clock=lambda: t[0])
+    s.add("live", now=100.0)
+    s.add("late-event", now=85.0)  # already expired, stored behind a live key
+    s._sweep_background()
+    assert list(s._cache) == ["live"]
+    assert s._ordered
+
+    t[0] = 111.0
+    s._sweep_background()
+    assert not s._cache
+
+
+def test_sweep_at_time_zero_is_respected():
+    clock = FakeClock(0.0)
+    s = TTLSet(ttl=5, clock=clock)
+    s.add("a")
+    s.sweep(now=0.0)
+    assert "a" in s
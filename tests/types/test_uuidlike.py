@@ -4,6 +4,7 @@ Unit tests for xpytools.types.uuidlike
 Tests standalone validation and Pydantic model integration.
 """
 
+import pickle
 from uuid import UUID
 
 import pytest
@@ -47,3 +48,12 @@ def test_uuidlike_works_in_pydantic_model():
 
     with pytest.raises(ValidationError):
         Example(run_id="not-a-uuid")
+
+
+def test_uuidlike_is_picklable_singleton():
+    assert pickle.loads(pickle.dumps(UUIDLike)) is UUIDLike
+
+    class Example(BaseModel):
+        run_id: UUIDLike
+
+    assert pickle.loads(pickle.dumps(Example.model_fields["run_id"])).annotation is UUIDLike
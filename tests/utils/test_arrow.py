@@ -0,0 +1,143 @@
+import datetime as dt
+import decimal
+
+import pytest
+
+pa = pytest.importorskip("pyarrow", reason="pyarrow required for arrow backend tests")
+pytest.importorskip("pandas", reason="pandas required for df tests")
+
+
+def _data_address(table, name):
+    return table.column(name).chunks[0].buffers()[1].address
+
+
+class TestArrowCheck:
+    """Tests for is_df / to_primitives with pyarrow"""
+
+    def test_is_df(self):
+        from xpytools.xtype.xcheck import is_df
+
+        table = pa.table({"a": [1]})
+        assert is_df(table)
+        assert is_df(table.to_batches()[0])
+        assert not is_df(table.column("a"))
+
+    def test_to_primitives(self):
+        from xpytools.xtype.xcast import to_primitives
+
+        table = pa.table({"a": [1, None], "b": [float("nan"), 2.0]})
+        assert to_primitives(table) == [{"a": 1, "b": None}, {"a": None, "b": 2.0}]
+
+    def test_unsupported_functions_raise(self):
+        from xpytools.xtool.df import lookup
+
+        table = pa.table({"id": [1], "v": ["a"]})
+        with pytest.raises(ValueError, match="pyarrow"):
+            lookup(table, "id", 1, "v")
+
+
+class TestArrowReplaceNoneLike:
+    """Tests for replace_none_like on pyarrow tables"""
+
+    @staticmethod
+    def _table():
+        return pa.table({
+                "s": [" NULL", "n/a", "ok", "N.A.", None],
+                "f": [1.0, float("nan"), None, 2.0, 3.0],
+                "d": pa.array(["nan", "a", "a", "b", "b"]).dictionary_encode(),
+                "ls": pa.array(["A", "", "c", "d", "e"], type=pa.large_string()),
+                "i": [1, 2, 3, 4, 5],
+                })
+
+    def test_replace(self):
+        from xpytools.xtool.df import replace_none_like
+
+        table = self._table()
+        result = replace_none_like(table)
+        assert result.schema == table.schema
+        assert result.to_pydict() == {
+                "s": [None, None, "ok", None, None],
+                "f": [1.0, None, None, 2.0, 3.0],
+                "d": [None, "a", "a", "b", "b"],
+                "ls": ["A", None, "c", "d", "e"],
+                "i": [1, 2, 3, 4, 5],
+                }
+
+    def test_unchanged_columns_zero_copy(self):
+        from xpytools.xtool.df import replace_none_like
+
+        table = self._table()
+        result = replace_none_like(table)
+        assert _data_address(result, "i") == _data_address(table, "i")
+
+        clean = pa.table({"a": ["x", "y"], "b": [1.5, 2.0]})
+        assert replace_none_like(clean) is clean
+
+    def test_record_batch_and_empty(self):
+        from xpytools.xtool.df import replace_none_like
+
+        batch = self._table().to_batches()[0]
+        result = replace_none_like(batch)
+        assert isinstance(result, pa.RecordBatch)
+        assert result.column(0).to_pylist() == [None, None, "ok", None, None]
+        with pytest.raises(ValueError):
+            replace_none_like(pa.table({"a": pa.array([], type=pa.string())}))
+
+
+class TestArrowNormalize:
+    """Tests for normalize_column_names on pyarrow tables"""
+
+    def test_rename(self):
+        from xpytools.xtool.df import normalize_column_names
+
+        table = pa.table({"User ID": [1], "user id": [2], "Score.1": [3]})
+        result = normalize_column_names(table)
+        assert result.schema.names == ["user_id", "user_id_1", "score_1"]
+        assert _data_address(result, "user_id") == _data_address(table, "User ID")
+
+
+class TestArrowPrepareDataframe:
+    """Tests for prepare_dataframe on pyarrow tables"""
+
+    def test_prepare(self):
+        from xpytools.xtool.sql import prepare_dataframe
+
+        table = pa.table({
+                "tags": [[1, 2], [], None],
+                "val": [1, None, 3],
+                "ts": [dt.datetime(2024, 1, 1), None, None],
+                "dec": [decimal.Decimal("1.5"), None, None],
+                "s": ["a", "null", ""],
+                })
+        result = prepare_dataframe(table)
+        assert result.column("tags").to_pylist() == ["{1,2}", "{}", None]
+        assert result.column("ts")[0].as_py() == "2024-01-01 00:00:00"
+        assert result.column("dec").to_pylist() == ["1.5", None, None]
+        assert result.column("s").to_pylist() == ["a", None, None]
+        assert _data_address(result, "val") == _data_address(table, "val")
+
+    def test_temporal_matches_pandas(self):
+        import pandas as pd
+
+        from xpytools.xtool.sql import prepare_dataframe
+
+        values = [dt.datetime(2020, 1, 1, 5, 30), dt.datetime(1969, 12, 31, 23, 59, 59, 5), None]
+        pdf = pd.DataFrame({
+                "ts": values,
+                "tz": pd.to_datetime(values).tz_localize("Asia/Kolkata"),
+                "d": [dt.date(2020, 1, 1), None, None],
+                "t": [dt.time(5, 30), dt.time(0, 0, 1, 5), None],
+                })
+        expected = prepare_dataframe(pdf).to_dict("list")
+        assert expected["ts"][1] == "1969-12-31 23:59:59.000005"
+        table = pa.Table.from_pandas(pdf, preserve_index=False)
+        assert prepare_dataframe(table).to_pydict() == expected
+
+        durations = prepare_dataframe(pa.table({"td": [dt.timedelta(seconds=5)]}))
+        assert pa.types.is_duration(durations.schema.field("td").type)
+
+    def test_nothing_to_change(self):
+        from xpytools.xtool.sql import prepare_dataframe
+
+        table = pa.table({"a": [1, 2], "b": ["x", "y"]})
+        assert prepare_dataframe(table) is table
@@ -1,8 +1,8 @@
 import pytest
 
 pandas = pytest.importorskip("pandas", reason="pandas required for df tests")
-import pandas as pd
 import numpy as np
+import pandas as pd
 
 
 class TestLookup:
@@ -44,6 +44,85 @@ class TestLookup:
         assert result is None
 
 
+    def test_lookup_cached_matches_scan(self):
+        from xpytools.xtool.df import lookup
+
+        df = pd.DataFrame({
+                "category": ["A", "A", "B", None],
+                "value": [10, 20, 30, 40]
+                })
+        for key in ["A", "B", "missing", None]:
+            for i in [0, -1]:
+                assert lookup(df, "category", key, "value", index=i, cached=True) == \
+                       lookup(df, "category", key, "value", index=i)
+        with pytest.raises(IndexError):
+            lookup(df, "category", "B", "value", index=1, cached=True)
+        assert lookup(df, "category", "B", "value", index=1, cached=True, safe=True) is None
+
+    def test_lookup_cache_invalidated_on_modification(self):
+        from xpytools.xtool.df import clear_lookup_cache, lookup
+
+        df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+        assert lookup(df, "id", 3, "name", cached=True) is None
+        df.loc[len(df)] = [3, "c"]                      # new row → shape changes
+        assert lookup(df, "id", 3, "name", cached=True) == "c"
+        df["id"] = [10, 20, 30]                         # column replaced
+        assert lookup(df, "id", 10, "name", cached=True) == "a"
+        df.loc[0, "id"] = 99                            # in-place cell edit
+        clear_lookup_cache(df)
+        assert lookup(df, "id", 99, "name", cached=True) == "a"
+
+
+class TestLookupIndex:
+    """Tests for LookupIndex"""
+
+    def test_get_single_key(self):
+        from xpytools.xtool.df import LookupIndex
+
+        df = pd.DataFrame({"k": [3, 1, 2, 1], "v": ["c", "a", "b", "a2"]})
+        idx = LookupIndex(df, "k")
+        assert idx.get(1, "v") == "a"
+        assert idx.get(1, "v", n=1) == "a2"
+        assert idx.get(1, "v", n=-1) == "a2"
+        assert idx.get(1, "v", n=5, default="?") == "?"
+        assert idx.get(9, "v") is None
+        assert 2 in idx and 9 not in idx
+        assert len(idx) == 3
+
+    def test_get_many_preserves_order_and_marks_missing(self):
+        from xpytools.xtool.df import LookupIndex
+
+        df = pd.DataFrame({"k": [3, 1, 2, 1], "v": [30, 10, 20, 11], "w": list("cabd")})
+        idx = LookupIndex(df, "k")
+        values = idx.get_many([2, 9, 1], "v")
+        assert values.iloc[0] == 20 and values.iloc[2] == 10
+        assert np.isnan(values.iloc[1])
+        frame = idx.get_many(pd.Series([1, 3]), ["v", "w"])
+        assert frame.to_dict("list") == {"v": [10, 30], "w": ["a", "c"]}
+        assert idx.positions([3, 1, 7]).tolist() == [0, 1, -1]
+
+    def test_composite_keys(self):
+        from xpytools.xtool.df import LookupIndex
+
+        df = pd.DataFrame({
+                "country": ["NL", "NL", "BE"],
+                "year"   : [2023, 2024, 2024],
+                "gdp"    : [1.0, 1.1, 0.6],
+                })
+        idx = LookupIndex(df, ["country", "year"])
+        assert idx.get(("NL", 2024), "gdp") == 1.1
+        assert idx.get(("BE", 2023), "gdp") is None
+        assert idx.get_many([("BE", 2024), ("NL", 2023)], "gdp").tolist() == [0.6, 1.0]
+        keys = pd.DataFrame({"year": [2024], "country": ["NL"]})
+        assert idx.get_many(keys, "gdp").tolist() == [1.1]
+
+    def test_rejects_non_dataframe(self):
+        from xpytools.xtool.df import LookupIndex
+
+        with pytest.raises(ValueError):
+            LookupIndex([1, 2, 3], "k")
+
+
 class TestMergeFill:
     """Tests for merge_fill"""
 
@@ -74,6 +153,175 @@ class TestMergeFill:
         result = merge_fill(left, right, on="id", prefer_right=True, fill_only_if_none=False)
         assert result["val"].iloc[0] == 20
 
+    def test_merge_fill_keeps_left_when_not_preferring_right(self):
+        from xpytools.xtool.df import merge_fill
+
+        left = pd.DataFrame({"id": [1, 2], "val": [None, 5.0]})
+        right = pd.DataFrame({"id": [1, 2], "val": [7.0, 8.0], "extra": ["a", "b"]})
+        result = merge_fill(left, right, on="id", prefer_right=False)
+        assert result.columns.tolist() == ["id", "val", "extra"]
+        assert result["val"].isna().tolist() == [True, False]
+
+    def test_merge_fill_multi_key(self):
+        from xpytools.xtool.df import merge_fill
+
+        left = pd.DataFrame({"country": ["NL", "NL", "BE"], "year": [2023, 2024, 2024],
+                             "gdp": [None, 1.1, None]})
+        right = pd.DataFrame({"country": ["NL", "BE"], "year": [2023, 2024], "gdp": [1.0, 0.6],
+                              "pop": [17, 11]})
+        result = merge_fill(left, right, on=["country", "year"])
+        assert result["gdp"].tolist() == [1.0, 1.1, 0.6]
+        assert result.columns.tolist() == ["country", "year", "gdp", "pop"]
+
+    def test_merge_fill_many_columns_mixed_dtypes(self):
+        from xpytools.xtool.df import merge_fill
+
+        left = pd.DataFrame({"id": [1, 2, 3], "a": [None, 2.0, None], "b": ["x", None, None],
+                             "c": [1, 2, 3]})
+        right = pd.DataFrame({"id": [1, 3], "a": [10.0, 30.0], "b": ["X", "Z"], "c": [7.5, 9.5]})
+        result = merge_fill(left, right, on="id")
+        assert result["a"].tolist() == [10.0, 2.0, 30.0]
+        assert result["b"].tolist()[::2] == ["x", "Z"] and pd.isna(result["b"].iloc[1])
+        assert result["c"].tolist() == [1, 2, 3]
+        assert not any(c.endswith("_right") for c in result.columns)
+
+
+class TestMergeFillMany:
+    """Tests for merge_fill_many"""
+
+    @staticmethod
+    def _frames():
+        left = pd.DataFrame({"id": [3, 1, 2, 4], "name": [None, "one", None, None],
+                             "score": [None, 1.0, None, 4.0]},
+                            index=[10, 11, 12, 13])
+        crm = pd.DataFrame({"id": [1, 2, 3], "name": ["ONE", "TWO", None], "tier": ["a", "b", "c"]})
+        legacy = pd.DataFrame({"id": [3, 2], "name": ["three", "two"], "score": [3.0, 2.0]})
+        return left, crm, legacy
+
+    @pytest.mark.parametrize("fill_only_if_none", [True, False])
+    @pytest.mark.parametrize("prefer_right", [True, False])
+    def test_matches_chained_merge_fill(self, prefer_right, fill_only_if_none):
+        from xpytools.xtool.df import merge_fill, merge_fill_many
+
+        left, crm, legacy = self._frames()
+        kwargs = dict(on="id", prefer_right=prefer_right, fill_only_if_none=fill_only_if_none)
+        chained = merge_fill(merge_fill(left, crm, **kwargs), legacy, **kwargs)
+        result = merge_fill_many(left, [crm, legacy], **kwargs)
+        pd.testing.assert_frame_equal(result, chained)
+
+    def test_fill_priority(self):
+        from xpytools.xtool.df import merge_fill_many
+
+        left, crm, legacy = self._frames()
+        result = merge_fill_many(left, [crm, legacy], on="id")
+        assert result["name"].tolist()[:3] == ["three", "one", "TWO"]
+        assert pd.isna(result["name"].iloc[3])
+        assert result["score"].tolist()[:3] == [3.0, 1.0, 2.0]
+        assert result["tier"].tolist()[:3] == ["c", "a", "b"]
+
+    def test_duplicate_right_keys_fall_back_to_merges(self):
+        from xpytools.xtool.df import merge_fill, merge_fill_many
+
+        left = pd.DataFrame({"id": [1, 2], "v": [None, None]})
+        dup = pd.DataFrame({"id": [1, 1], "v": [5.0, 6.0]})
+        result = merge_fill_many(left, [dup], on="id")
+        pd.testing.assert_frame_equal(result, merge_fill(left, dup, on="id"))
+        assert len(result) == 3
+
+
+class TestIterMergeFill:
+    """Tests for iter_merge_fill"""
+
+    @staticmethod
+    def _frames():
+        left = pd.DataFrame({"id": [3, 1, 2, 4, 1, 9],
+                             "name": [None, "one", None, None, None, "nine"],
+                             "score": [None, 1.0, None, 4.0, None, 9.0]})
+        right = pd.DataFrame({"id": [1, 2, 3], "name": ["ONE", "TWO", None],
+                              "tier": ["a", "b", "c"]})
+        return left, right
+
+    @staticmethod
+    def _chunks(df, size):
+        return (df.iloc[i:i + size] for i in range(0, len(df), size))
+
+    @pytest.mark.parametrize("how", ["left", "inner"])
+    @pytest.mark.parametrize("fill_only_if_none", [True, False])
+    @pytest.mark.parametrize("prefer_right", [True, False])
+    def test_matches_merge_fill(self, how, prefer_right, fill_only_if_none):
+        from xpytools.xtool.df import iter_merge_fill, merge_fill
+
+        left, right = self._frames()
+        kwargs = dict(on="id", how=how, prefer_right=prefer_right,
+                      fill_only_if_none=fill_only_if_none)
+        parts = list(iter_merge_fill(self._chunks(left, 4), right, **kwargs))
+        assert len(parts) == 2
+        result = pd.concat(parts).reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, merge_fill(left, right, **kwargs))
+
+    def test_keeps_chunk_index_and_input(self):
+        from xpytools.xtool.df import iter_merge_fill
+
+        left, right = self._frames()
+        left.index = range(100, 106)
+        original = left.copy()
+        parts = list(iter_merge_fill(self._chunks(left, 4), right, on="id"))
+        assert parts[0].index.tolist() == [100, 101, 102, 103]
+        assert parts[1].index.tolist() == [104, 105]
+        assert parts[1]["name"].tolist() == ["ONE", "nine"]
+        pd.testing.assert_frame_equal(left, original)
+
+    def test_lazy_consumption(self):
+        from xpytools.xtool.df import iter_merge_fill
+
+        left, right = self._frames()
+        consumed = []
+
+        def chunks():
+            for chunk in self._chunks(left, 2):
+                consumed.append(len(chunk))
+                yield chunk
+
+        it = iter_merge_fill(chunks(), right, on="id")
+        next(it)
+        assert consumed == [2]
+
+    def test_composite_keys_and_dtype_mismatch(self):
+        from xpytools.xtool.df import iter_merge_fill, merge_fill
+
+        left = pd.DataFrame({"a": [1, 1, 2], "b": ["x", "y", "x"], "v": [None, 2.0, None]})
+        right = pd.DataFrame({"a": [1, 2], "b": ["x", "x"], "v": [10.0, 20.0]})
+        result = pd.concat(iter_merge_fill(self._chunks(left, 2), right, on=["a", "b"]))
+        pd.testing.assert_frame_equal(result, merge_fill(left, right, on=["a", "b"]))
+
+        floats = left.astype({"a": "float64"})
+        result = pd.concat(iter_merge_fill(self._chunks(floats, 2), right, on=["a", "b"]))
+        assert result["v"].tolist() == [10.0, 2.0, 20.0]
+
+    def test_duplicate_right_keys(self):
+        from xpytools.xtool.df import iter_merge_fill
+
+        left = pd.DataFrame({"id": [1, 2], "v": [None, None]})
+        dup = pd.DataFrame({"id": [1, 1], "v": [5.0, 6.0]})
+        parts = list(iter_merge_fill(self._chunks(left, 1), dup, on="id"))
+        assert [len(p) for p in parts] == [2, 1]
+
+    def test_duplicate_chunk_labels(self):
+        from xpytools.xtool.df import iter_merge_fill, merge_fill
+
+        left = pd.DataFrame({"id": [1, 2], "v": [None, "a"]}, index=[0, 0])
+        right = pd.DataFrame({"id": [1, 2], "v": [1.5, 2.5]})
+        (part,) = iter_merge_fill([left], right, on="id")
+        assert part.index.tolist() == [0, 0]
+        assert part["v"].tolist() == merge_fill(left, right, on="id")["v"].tolist() == [1.5, "a"]
+
+    def test_rejects_non_streamable_join(self):
+        from xpytools.xtool.df import iter_merge_fill
+
+        left, right = self._frames()
+        with pytest.raises(ValueError):
+            next(iter_merge_fill([left], right, on="id", how="outer"))
+
 
 class TestNormalizeColumnNames:
     """Tests for normalize_column_names"""
@@ -118,6 +366,33 @@ class TestNormalizeColumnNames:
         normalize_column_names(df, inplace=True)
         assert list(df.columns) == ["user_name"]
 
+    def test_normalize_suffix_collisions(self):
+        from xpytools.xtool.df import normalize_column_names
+
+        df = pd.DataFrame(columns=["a", "A", "a_1", "a", "a.1", "b", 1, "1"])
+        result = normalize_column_names(df.copy())
+        assert list(result.columns) == ["a", "a_1", "a_1_1", "a_2", "a_1_2", "b", "1", "1_1"]
+
+    def test_normalize_many_duplicates(self):
+        from xpytools.xtool.df import normalize_column_names
+
+        df = pd.DataFrame(columns=["x"] * 2000)
+        cols = list(normalize_column_names(df).columns)
+        assert cols[:3] == ["x", "x_1", "x_2"]
+        assert cols[-1] == "x_1999"
+
+    def test_normalize_cached_schema(self):
+        from xpytools.xtool.df import normalize_column_names
+        from xpytools.xtool.df.normalize_column_names import _normalize_columns
+
+        first = pd.DataFrame(columns=["Cached Col", "Other-Col"])
+        second = pd.DataFrame({"Cached Col": [1], "Other-Col": [2]})
+        normalize_column_names(first)
+        hits = _normalize_columns.cache_info().hits
+        normalize_column_names(second)
+        assert _normalize_columns.cache_info().hits == hits + 1
+        assert list(second.columns) == ["cached_col", "other_col"]
+
 
 class TestReplaceNoneLike:
     """Tests for replace_none_like"""
@@ -143,3 +418,198 @@ class TestReplaceNoneLike:
         df = pd.DataFrame()
         with pytest.raises(ValueError, match="Invalid DataFrame"):
             replace_none_like(df)
+
+
+class TestIterReplaceNoneLike:
+    """Tests for iter_replace_none_like"""
+
+    @staticmethod
+    def _chunks():
+        return [
+                pd.DataFrame({"i": [1, 2], "f": [1.0, 2.0], "s": ["a", "null"]}),
+                pd.DataFrame({"i": [3, None], "f": [3, 4], "s": ["N/A", "b"]}),
+                pd.DataFrame({"i": [5, 6], "f": [np.nan, 0.5], "s": [None, None]}),
+                ]
+
+    def test_matches_per_chunk_values(self):
+        from xpytools.xtool.df import iter_replace_none_like, replace_none_like
+
+        cleaned_chunks = iter_replace_none_like(self._chunks(), force=True)
+        for chunk, cleaned in zip(self._chunks(), cleaned_chunks):
+            expected = replace_none_like(chunk, force=True)
+            assert cleaned.astype(object).where(cleaned.notna(), None).values.tolist() == \
+                   expected.astype(object).where(expected.notna(), None).values.tolist()
+
+    def test_dtypes_fixed_by_first_chunk(self):
+        from xpytools.xtool.df import iter_replace_none_like
+
+        parts = list(iter_replace_none_like(self._chunks()))
+        assert parts[1]["f"].dtype == np.float64  # int chunk cast to the first chunk's float
+        assert parts[1]["i"].dtype == object  # nulls in an int column: lossless object fallback
+        assert parts[1]["i"].tolist() == [3.0, None]
+        assert parts[2]["i"].dtype == np.int64
+        assert [p["s"].tolist() for p in parts] == [["a", None], [None, "b"], [None, None]]
+
+    def test_lazy_and_schema_checks(self):
+        from xpytools.xtool.df import iter_replace_none_like
+
+        consumed = []
+
+        def chunks():
+            for chunk in self._chunks():
+                consumed.append(chunk)
+                yield chunk
+
+        it = iter_replace_none_like(chunks())
+        next(it)
+        assert len(consumed) == 1
+
+        with pytest.raises(ValueError, match="differ"):
+            list(iter_replace_none_like([pd.DataFrame({"a": [1]}), pd.DataFrame({"b": [1]})]))
+        with pytest.raises(ValueError, match="not a DataFrame"):
+            list(iter_replace_none_like([{"a": [1]}]))
+
+    def test_empty_chunks_pass_through(self):
+        from xpytools.xtool.df import iter_replace_none_like
+
+        empty = pd.DataFrame({"a": []})
+        parts = list(iter_replace_none_like([empty, pd.DataFrame({"a": ["null"]})]))
+        assert parts[0] is empty
+        assert parts[1]["a"].tolist() == [None]
+
+
+class TestReadCsvClean:
+    """Tests for read_csv_clean"""
+
+    CSV = "User ID,Score,Status\n1,NULL,ok\n2,n/a,Missing\n3,4.5,\n4,None,N.A.\n5,#N/A,x\n"
+
+    def test_null_tokens_parsed(self):
+        import io
+
+        from xpytools.xtool.df import read_csv_clean
+
+        df = read_csv_clean(io.StringIO(self.CSV))
+        assert df["Status"].isna().tolist() == [False, True, True, True, False]
+        # "#N/A" is not in the is_none vocabulary (pandas default NA only)
+        assert df["Score"].tolist()[-1] == "#N/A"
+
+        df = read_csv_clean(io.StringIO(self.CSV), keep_default_na=True)
+        assert df["Score"].dtype == np.float64
+        assert df["Score"].isna().tolist() == [True, True, False, True, True]
+
+    def test_matches_replace_none_like(self):
+        import io
+
+        from xpytools.xtool.df import read_csv_clean, replace_none_like
+
+        parsed = read_csv_clean(io.StringIO(self.CSV))
+        raw = pd.read_csv(io.StringIO(self.CSV), keep_default_na=False, dtype=str)
+        cleaned = replace_none_like(raw)
+        assert parsed.isna().equals(cleaned.isna())
+
+        extra = read_csv_clean(io.StringIO(self.CSV), na_values="#N/A")
+        assert extra["Score"].dtype == np.float64
+
+    def test_rejects_per_column_na_values(self):
+        import io
+
+        from xpytools.xtool.df import read_csv_clean
+
+        with pytest.raises(TypeError, match="per-column"):
+            read_csv_clean(io.StringIO(self.CSV), na_values={"Score": ["#N/A"]})
+
+    def test_normalize_and_chunks(self):
+        import io
+
+        from xpytools.xtool.df import read_csv_clean
+
+        df = read_csv_clean(io.StringIO(self.CSV), normalize_columns=True)
+        assert list(df.columns) == ["user_id", "score", "status"]
+
+        chunks = list(read_csv_clean(io.StringIO(self.CSV), chunksize=2, normalize_columns=True))
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        assert all(list(c.columns) == ["user_id", "score", "status"] for c in chunks)
+        assert chunks[0]["status"].isna().tolist() == [False, True]
+
+    def test_chunks_are_timed_as_consumed(self, monkeypatch):
+        import io
+
+        from xpytools.xdeco import metrics
+        from xpytools.xtool.df import read_csv_clean
+
+        monkeypatch.setattr(metrics, "enabled", True)
+        metrics.reset()
+        reader = read_csv_clean(io.StringIO(self.CSV), chunksize=2)
+        assert "xtool.df.read_csv_clean.chunk" not in metrics.as_dict()
+        next(reader)
+        assert metrics.as_dict()["xtool.df.read_csv_clean.chunk"]["count"] == 1
+        list(reader)
+        stats = metrics.as_dict()
+        assert stats["xtool.df.read_csv_clean.chunk"]["count"] == 3
+        assert "xtool.df.read_csv_clean" not in stats
+        read_csv_clean(io.StringIO(self.CSV))
+        assert metrics.as_dict()["xtool.df.read_csv_clean"]["count"] == 1
+        metrics.reset()
+
+
+class TestMapUnique:
+    """Tests for map_unique"""
+
+    def test_matches_map(self):
+        from xpytools.xtool.df import map_unique
+        from xpytools.xtype.xcast import as_none
+
+        df = pd.DataFrame({
+            "status": ["ok", "null", "ok", None, "N/A", "ok"],
+            "score": [1.0, np.nan, 1.0, 2.5, 1.0, np.nan],
+            "count": [1, 2, 1, 2, 1, 2],
+            })
+        result = map_unique(df, as_none)
+        pd.testing.assert_frame_equal(result, df.map(as_none))
+
+        series = map_unique(df["status"], str.upper, na_action="ignore")
+        pd.testing.assert_series_equal(series, df["status"].map(str.upper, na_action="ignore"))
+
+    def test_calls_once_per_value(self):
+        from xpytools.xtool.df import map_unique
+
+        calls = []
+
+        def record(value):
+            calls.append(value)
+            return value
+
+        s = pd.Series(["a", "b", "a", "a", None, "b", None, "a"])
+        result = map_unique(s, record)
+        assert result.tolist() == s.tolist()
+        assert len(calls) == 3
+        assert set(calls) == {"a", "b", None}
+
+    def test_unhashable_and_mixed_types(self):
+        from xpytools.xtool.df import map_unique
+
+        s = pd.Series([[1, 2], 1, True, 1.0, [1, 2], (3,)], dtype=object)
+        result = map_unique(s, lambda v: type(v).__name__)
+        assert result.tolist() == ["list", "int", "bool", "float", "list", "tuple"]
+
+    @pytest.mark.parametrize("dtype", ["string", "int64", "float64", "object"])
+    def test_empty_keeps_dtype(self, dtype):
+        from xpytools.xtool.df import map_unique
+
+        s = pd.Series([], dtype=dtype, name="col")
+        result = map_unique(s, str)
+        assert result.dtype == s.map(str).dtype == s.dtype
+        assert result.name == "col"
+        empty = pd.DataFrame({"a": s})
+        assert map_unique(empty, str)["a"].dtype == s.dtype
+
+    def test_kwargs_and_invalid(self):
+        from xpytools.xtool.df import map_unique
+
+        s = pd.Series(["x", "y", "x", "x"])
+        result = map_unique(s, lambda v, width: v.ljust(width, "-"), width=3)
+        assert result.tolist() == ["x--", "y--", "x--", "x--"]
+        with pytest.raises(ValueError):
+            map_unique(s, str.upper, na_action="drop")
+        with pytest.raises(TypeError):
+            map_unique(["x"], str.upper)
@@ -0,0 +1,234 @@
+import datetime as dt
+
+import pytest
+
+pl = pytest.importorskip("polars", reason="polars required for polars backend tests")
+pytest.importorskip("pandas", reason="pandas required for df tests")
+
+
+class TestPolarsCheck:
+    """Tests for is_df / to_primitives / as_df with polars"""
+
+    def test_is_df(self):
+        from xpytools.xtype.xcheck import is_df
+
+        df = pl.DataFrame({"a": [1]})
+        assert is_df(df)
+        assert is_df(df.lazy())
+        assert not is_df(df["a"])
+
+    def test_to_primitives(self):
+        from xpytools.xtype.xcast import to_primitives
+
+        df = pl.DataFrame({"a": [1, None], "b": [float("nan"), 2.0]})
+        assert to_primitives(df) == [{"a": 1, "b": None}, {"a": None, "b": 2.0}]
+        assert to_primitives(df.lazy()) == to_primitives(df)
+        assert to_primitives(pl.Series([1, None, 3])) == [1, 3]
+
+    def test_as_df_backend(self):
+        from xpytools.xtype.xcast import as_df
+
+        df = as_df('[{"a": 1}, {"a": 2}]', backend="polars")
+        assert isinstance(df, pl.DataFrame)
+        assert df["a"].to_list() == [1, 2]
+        lazy = pl.LazyFrame({"a": [1]})
+        assert as_df(lazy) is lazy
+        with pytest.raises(ValueError):
+            as_df({"a": [1]}, backend="arrow")
+
+    def test_as_df_missing_backend_is_safe(self, monkeypatch):
+        from xpytools._lazy import LazyModule
+        from xpytools.xtype.xcast import as_df, dataframe
+
+        monkeypatch.setattr(dataframe, "pl", LazyModule("xpyt_no_such_polars"))
+        assert as_df({"a": [1]}, backend="polars") is None
+        with pytest.raises(ImportError):
+            as_df({"a": [1]}, backend="polars", safe=False)
+
+
+class TestPolarsLookup:
+    """Tests for lookup on polars frames"""
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_lookup(self, lazy):
+        from xpytools.xtool.df import lookup
+
+        df = pl.DataFrame({"id": [1, 2, 3, 2], "email": ["a", "b", "c", "d"]})
+        df = df.lazy() if lazy else df
+        assert lookup(df, "id", 2, "email") == "b"
+        assert lookup(df, "id", 2, "email", index=1) == "d"
+        assert lookup(df, "id", 2, "email", index=-1) == "d"
+        assert lookup(df, "id", 99, "email") is None
+        assert lookup(df, "id", None, "email") is None
+        with pytest.raises(IndexError):
+            lookup(df, "id", 2, "email", index=2)
+        with pytest.raises(IndexError):
+            lookup(df, "id", 2, "email", index=-3)
+        assert lookup(df, "id", 2, "email", index=2, safe=True) is None
+
+
+class TestPolarsMergeFill:
+    """Tests for merge_fill / merge_fill_many / iter_merge_fill on polars frames"""
+
+    @staticmethod
+    def _frames():
+        left = pl.DataFrame({"id": [1, 2, 3], "v": [None, 2.0, None], "name": ["x", None, None]})
+        right = pl.DataFrame({"id": [1, 3, 4], "v": [10.0, 30.0, 40.0],
+                              "name": ["X", "Z", "W"], "w": ["a", "c", "d"]})
+        return left, right
+
+    def test_fill_only_missing(self):
+        from xpytools.xtool.df import merge_fill
+
+        left, right = self._frames()
+        result = merge_fill(left, right, on="id")
+        assert result.columns == ["id", "v", "name", "w"]
+        assert result["v"].to_list() == [10.0, 2.0, 30.0]
+        assert result["name"].to_list() == ["x", None, "Z"]
+        assert result["w"].to_list() == ["a", None, "c"]
+
+    def test_overwrite_and_keep_left(self):
+        from xpytools.xtool.df import merge_fill
+
+        left, right = self._frames()
+        overwrite = merge_fill(left, right, on="id", fill_only_if_none=False)
+        assert overwrite["name"].to_list() == ["X", None, "Z"]
+        keep = merge_fill(left, right, on="id", prefer_right=False)
+        assert keep["v"].to_list() == [None, 2.0, None]
+
+    @pytest.mark.parametrize("how, ids", [
+        ("inner", [1, 3]),
+        ("outer", [1, 2, 3, 4]),
+        ("right", [1, 3, 4]),
+    ])
+    def test_join_types(self, how, ids):
+        from xpytools.xtool.df import merge_fill
+
+        left, right = self._frames()
+        result = merge_fill(left, right, on="id", how=how)
+        assert sorted(result["id"].to_list()) == ids
+
+    def test_lazy_stays_lazy(self):
+        from xpytools.xtool.df import merge_fill
+
+        left, right = self._frames()
+        result = merge_fill(left.lazy(), right, on="id")
+        assert isinstance(result, pl.LazyFrame)
+        assert result.collect().equals(merge_fill(left, right, on="id"))
+
+    def test_many_and_chunked(self):
+        from xpytools.xtool.df import iter_merge_fill, merge_fill, merge_fill_many
+
+        left, right = self._frames()
+        extra = pl.DataFrame({"id": [2], "name": ["Y"]})
+        chained = merge_fill(merge_fill(left, right, on="id"), extra, on="id")
+        assert merge_fill_many(left, [right, extra], on="id").equals(chained)
+
+        parts = list(iter_merge_fill([left[:2], left[2:]], right, on="id"))
+        assert pl.concat(parts).equals(merge_fill(left, right, on="id"))
+
+    def test_mixed_backends_rejected(self):
+        import pandas as pd
+
+        from xpytools.xtool.df import merge_fill
+
+        left, _ = self._frames()
+        with pytest.raises(ValueError):
+            merge_fill(left, pd.DataFrame({"id": [1], "v": [1.0]}), on="id")
+
+
+class TestPolarsNormalize:
+    """Tests for normalize_column_names on polars frames"""
+
+    def test_eager_inplace(self):
+        from xpytools.xtool.df import normalize_column_names
+
+        df = pl.DataFrame({"User ID": [1], "user id": [2], "Score.1": [3]})
+        result = normalize_column_names(df)
+        assert result is df
+        assert df.columns == ["user_id", "user_id_1", "score_1"]
+
+    def test_copy_and_lazy(self):
+        from xpytools.xtool.df import normalize_column_names
+
+        df = pl.DataFrame({"User ID": [1], "E-mail": ["a"]})
+        copy = normalize_column_names(df, inplace=False)
+        assert copy.columns == ["user_id", "e_mail"]
+        assert df.columns == ["User ID", "E-mail"]
+        lazy = normalize_column_names(df.lazy())
+        assert isinstance(lazy, pl.LazyFrame)
+        assert lazy.collect_schema().names() == ["user_id", "e_mail"]
+
+
+class TestPolarsReplaceNoneLike:
+    """Tests for replace_none_like on polars frames"""
+
+    def test_replace(self):
+        from xpytools.xtool.df import replace_none_like
+
+        df = pl.DataFrame({
+                "s": [" NULL", "n/a", "ok", "N.A.", None],
+                "f": [1.0, float("nan"), None, 2.0, 3.0],
+                "c": pl.Series(["nan", "a", "a", "b", "b"], dtype=pl.Categorical),
+                "i": [1, 2, 3, 4, 5],
+                })
+        result = replace_none_like(df)
+        assert result["s"].to_list() == [None, None, "ok", None, None]
+        assert result["f"].to_list() == [1.0, None, None, 2.0, 3.0]
+        assert result["c"].to_list() == [None, "a", "a", "b", "b"]
+        assert result["i"].to_list() == [1, 2, 3, 4, 5]
+
+    def test_lazy_and_empty(self):
+        from xpytools.xtool.df import replace_none_like
+
+        lazy = replace_none_like(pl.LazyFrame({"s": ["null", "x"]}))
+        assert isinstance(lazy, pl.LazyFrame)
+        assert lazy.collect()["s"].to_list() == [None, "x"]
+        with pytest.raises(ValueError):
+            replace_none_like(pl.DataFrame({"s": []}))
+
+
+class TestPolarsPrepareDataframe:
+    """Tests for prepare_dataframe on polars frames"""
+
+    def test_prepare(self):
+        from xpytools.xtool.sql import prepare_dataframe
+
+        df = pl.DataFrame({
+                "tags": [[1, 2], [], None],
+                "val": [1, None, 3],
+                "ts": [dt.datetime(2024, 1, 1), None, None],
+                "s": ["a", "null", ""],
+                })
+        result = prepare_dataframe(df)
+        assert result["tags"].to_list() == ["{1,2}", "{}", None]
+        assert result["val"].to_list() == [1, None, 3]
+        assert result["ts"].dtype == pl.String
+        assert result["ts"][0] == "2024-01-01 00:00:00"
+        assert result["s"].to_list() == ["a", None, None]
+
+    def test_temporal_matches_pandas(self):
+        import pandas as pd
+
+        from xpytools.xtool.sql import prepare_dataframe
+
+        values = [dt.datetime(2020, 1, 1, 5, 30), dt.datetime(1969, 12, 31, 23, 59, 59, 5), None]
+        pdf = pd.DataFrame({
+                "ts": values,
+                "tz": pd.to_datetime(values).tz_localize("Asia/Kolkata"),
+                "d": [dt.date(2020, 1, 1), None, None],
+                "t": [dt.time(5, 30), dt.time(0, 0, 1, 5), None],
+                })
+        expected = prepare_dataframe(pdf).to_dict("list")
+        assert expected["tz"][0] == "2020-01-01 05:30:00+05:30"
+        assert prepare_dataframe(pl.from_pandas(pdf)).to_dict(as_series=False) == expected
+
+        durations = prepare_dataframe(pl.DataFrame({"td": [dt.timedelta(seconds=5)]}))
+        assert durations["td"].dtype == pl.Duration
+
+    def test_lazy(self):
+        from xpytools.xtool.sql import prepare_dataframe
+
+        result = prepare_dataframe(pl.LazyFrame({"tags": [["a", "b"]]}))
+        assert isinstance(result, pl.LazyFrame)
+        assert result.collect()["tags"].to_list() == ["{a,b}"]
@@ -114,3 +114,49 @@ class TestPrepareDataframe:
         # Should convert to primitives
         assert isinstance(result["items"].iloc[0], dict)
         assert result["items"].iloc[0]["name"] == "a"
+
+
+class TestIterPrepareDataframe:
+    """Tests for iter_prepare_dataframe"""
+
+    def test_matches_prepare_dataframe(self):
+        from xpytools.xtool.sql import iter_prepare_dataframe, prepare_dataframe
+
+        chunks = [
+                pd.DataFrame({"tags": [[1, 2], None], "val": [1.0, np.nan], "s": ["a", "null"]}),
+                pd.DataFrame({"tags": [[], [3]], "val": [2.0, 3.0], "s": ["N/A", "b"]}),
+                ]
+        for chunk, prepared in zip(chunks, iter_prepare_dataframe(chunks)):
+            pd.testing.assert_frame_equal(prepared, prepare_dataframe(chunk))
+
+    def test_arrays_first_seen_in_later_chunk(self):
+        from xpytools.xtool.sql import iter_prepare_dataframe
+
+        chunks = [
+                pd.DataFrame({"tags": ["x", None], "name": ["a", "b"]}),
+                pd.DataFrame({"tags": [[1, 2], "y"], "name": ["c", ["d"]]}),
+                ]
+        parts = list(iter_prepare_dataframe(chunks))
+        assert parts[0]["tags"].tolist() == ["x", None]
+        assert parts[1]["tags"].tolist() == ["{1,2}", "y"]
+        assert parts[1]["name"].tolist() == ["c", "{d}"]
+
+    def test_array_columns_decided_on_first_values(self):
+        from xpytools.xtool.sql import iter_prepare_dataframe
+
+        chunks = [
+                pd.DataFrame({"tags": [None, None], "name": ["a", "b"]}),
+                pd.DataFrame({"tags": [[1, 2], None], "name": ["c", "d"]}),
+                pd.DataFrame({"tags": [(3,), [4, 5]], "name": ["e", "f"]}),
+                ]
+        parts = list(iter_prepare_dataframe(chunks))
+        assert parts[0]["tags"].tolist() == [None, None]
+        assert parts[1]["tags"].tolist() == ["{1,2}", None]
+        assert parts[2]["tags"].tolist() == ["{3}", "{4,5}"]
+
+    def test_schema_mismatch(self):
+        from xpytools.xtool.sql import iter_prepare_dataframe
+
+        with pytest.raises(ValueError, match="differ"):
+            list(iter_prepare_dataframe([pd.DataFrame({"a": [1]}),
+                                         pd.DataFrame({"a": [1], "b": [2]})]))
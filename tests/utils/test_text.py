@@ -213,3 +213,24 @@ class TestPad:
 
         result = pad(None, width=10)
         assert len(result) == 10
+
+
+class TestSeriesInput:
+    """Tests for the txt helpers applied to a pandas Series"""
+
+    def test_series_matches_scalar(self):
+        pd = pytest.importorskip("pandas")
+        from xpytools.xtool.txt import clean, pad, strip_ascii, strip_html, truncate
+
+        s = pd.Series(["<b>café</b>", "  Hello  ", None, "<b>café</b>",
+                       "a much longer piece of txt"])
+        for func, kwargs in [
+            (clean, {"lowercase": True}),
+            (strip_html, {}),
+            (strip_ascii, {"keep_basic_symbols": False}),
+            (truncate, {"limit": 6}),
+            (pad, {"width": 8, "align": "right"}),
+            ]:
+            result = func(s, **kwargs)
+            assert isinstance(result, pd.Series)
+            assert result.tolist() == [func(v, **kwargs) for v in s]
@@ -0,0 +1,160 @@
+import gc
+import threading
+import time
+
+import pytest
+
+
+class TestAsMultiton:
+    """Tests for @asMultiton decorator"""
+
+    def test_one_instance_per_key(self):
+        from xpytools.xdeco import asMultiton
+
+        @asMultiton
+        class Model:
+            def __init__(self, name):
+                self.name = name
+
+        a1, a2, b = Model("a"), Model("a"), Model("b")
+        assert a1 is a2
+        assert a1 is not b
+        assert (a1.name, b.name) == ("a", "b")
+        assert set(Model.instances()) == {("a",), ("b",)}
+
+    def test_init_runs_once_per_key(self):
+        from xpytools.xdeco import asMultiton
+
+        calls = []
+
+        @asMultiton
+        class Model:
+            def __init__(self, name, size=1):
+                calls.append((name, size))
+                self.size = size
+
+        Model("a", size=2)
+        Model("a", size=2)
+        assert calls == [("a", 2)]
+
+    def test_slots_class_keeps_no_state_on_instance(self):
+        from xpytools.xdeco import asMultiton
+
+        calls = []
+
+        @asMultiton
+        class Model:
+            __slots__ = ("name",)
+
+            def __init__(self, name):
+                calls.append(name)
+                self.name = name
+
+            def __eq__(self, other):  # unhashable instances
+                return isinstance(other, Model) and other.name == self.name
+
+            __hash__ = None
+
+        a = Model("a")
+        assert Model("a") is a
+        assert calls == ["a"]
+        assert vars(a) == {}
+
+    def test_custom_key(self):
+        from xpytools.xdeco import asMultiton
+
+        @asMultiton(key=lambda dsn, **_: dsn)
+        class Pool:
+            def __init__(self, dsn, size=10):
+                self.size = size
+
+        p1 = Pool("db", size=5)
+        p2 = Pool("db", size=50)
+        assert p1 is p2
+        assert p2.size == 5
+
+    def test_unhashable_arguments(self):
+        from xpytools.xdeco import asMultiton
+
+        @asMultiton
+        class Client:
+            def __init__(self, config):
+                self.config = config
+
+        assert Client({"host": "x", "port": 1}) is Client({"port": 1, "host": "x"})
+        assert Client({"host": "x"}) is not Client({"host": "y"})
+
+    def test_weak_instances_are_evicted(self):
+        from xpytools.xdeco import asMultiton
+
+        @asMultiton(weak=True)
+        class Model:
+            def __init__(self, name):
+                self.name = name
+
+        m = Model("a")
+        assert Model("a") is m
+        del m
+        gc.collect()
+        assert Model.instances() == {}
+        assert Model("a").name == "a"
+
+    def test_strong_instances_are_kept(self):
+        from xpytools.xdeco import asMultiton
+
+        @asMultiton
+        class Model:
+            pass
+
+        Model()
+        gc.collect()
+        assert len(Model.instances()) == 1
+        Model.clear_instances()
+        assert Model.instances() == {}
+
+    def test_concurrent_first_use_builds_once(self):
+        from xpytools.xdeco import asMultiton
+
+        calls = []
+
+        @asMultiton
+        class Pool:
+            def __init__(self, dsn):
+                calls.append(dsn)
+                time.sleep(0.05)
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def build(i):
+            barrier.wait()
+            results.append(Pool(f"db{i % 2}"))
+
+        threads = [threading.Thread(target=build, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(calls) == ["db0", "db1"]
+        assert len({id(r) for r in results}) == 2
+
+    def test_preserves_class_metadata(self):
+        from xpytools.xdeco import asMultiton
+
+        @asMultiton
+        class Model:
+            """Docs"""
+
+        assert Model.__name__ == "Model"
+        assert Model.__doc__ == "Docs"
+        assert isinstance(Model(), Model)
+
+    def test_raises_on_new_override(self):
+        from xpytools.xdeco import asMultiton
+
+        with pytest.raises(Exception, match="Multiton violation"):
+            @asMultiton
+            class BadClass:
+                def __new__(cls):
+                    pass
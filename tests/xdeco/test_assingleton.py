@@ -46,3 +46,33 @@ class TestAsSingleton:
             @asSingleton
             class BadClass:
                 __cls_instance = None
+
+    def test_singleton_concurrent_first_use_inits_once(self):
+        import threading
+        import time
+
+        from xpytools.xdeco import asSingleton
+
+        calls = []
+
+        @asSingleton
+        class Pool:
+            def __init__(self):
+                calls.append(1)
+                time.sleep(0.05)  # widen the race window
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def build():
+            barrier.wait()
+            results.append(Pool())
+
+        threads = [threading.Thread(target=build) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+class TestBatchedThreads:
+    """Tests for @batched with regular functions"""
+
+    def test_concurrent_calls_are_coalesced(self):
+        from xpytools.xdeco import batched
+
+        calls = []
+
+        @batched(max_size=100, max_wait_ms=50)
+        def double(keys):
+            calls.append(list(keys))
+            return [k * 2 for k in keys]
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            results = list(pool.map(double, range(10)))
+
+        assert results == [k * 2 for k in range(10)]
+        assert sum(len(c) for c in calls) == 10
+        assert len(calls) < 10
+
+    def test_max_size_splits_batches(self):
+        from xpytools.xdeco import batched
+
+        sizes = []
+        barrier = threading.Barrier(9)
+
+        @batched(max_size=3, max_wait_ms=200)
+        def ident(keys):
+            sizes.append(len(keys))
+            return keys
+
+        def call(k):
+            barrier.wait()
+            return ident(k)
+
+        with ThreadPoolExecutor(max_workers=9) as pool:
+            assert sorted(pool.map(call, range(9))) == list(range(9))
+        assert max(sizes) <= 3
+
+    def test_single_caller_is_flushed_after_wait(self):
+        from xpytools.xdeco import batched
+
+        @batched(max_size=10, max_wait_ms=1)
+        def ident(keys):
+            return keys
+
+        assert ident("a") == "a"
+        assert ident.batch_fn(["x", "y"]) == ["x", "y"]
+
+    def test_mapping_results_and_missing_keys(self):
+        from xpytools.xdeco import batched
+
+        @batched(max_size=1)
+        def fetch(keys):
+            return {k: k.upper() for k in keys if k != "missing"}
+
+        assert fetch("a") == "A"
+        with pytest.raises(KeyError):
+            fetch("missing")
+
+    def test_per_item_and_batch_errors(self):
+        from xpytools.xdeco import batched
+
+        @batched(max_size=1)
+        def fetch(keys):
+            return [ValueError(k) if k == "bad" else k for k in keys]
+
+        assert fetch("ok") == "ok"
+        with pytest.raises(ValueError):
+            fetch("bad")
+
+        @batched(max_size=1)
+        def broken(keys):
+            raise RuntimeError("backend down")
+
+        with pytest.raises(RuntimeError, match="backend down"):
+            broken("a")
+
+    def test_length_mismatch_raises(self):
+        from xpytools.xdeco import batched
+
+        @batched(max_size=1)
+        def short(keys):
+            return []
+
+        with pytest.raises(ValueError, match="0 results for 1 keys"):
+            short("a")
+
+    def test_invalid_max_size(self):
+        from xpytools.xdeco import batched
+
+        with pytest.raises(ValueError):
+            batched(max_size=0)
+
+
+class TestBatchedAsync:
+    """Tests for @batched with coroutine functions"""
+
+    def test_gathered_calls_share_one_batch(self):
+        from xpytools.xdeco import batched
+
+        calls = []
+
+        @batched(max_size=100, max_wait_ms=5)
+        async def fetch(keys):
+            calls.append(list(keys))
+            return {k: k * 10 for k in keys}
+
+        async def main():
+            return await asyncio.gather(*(fetch(k) for k in [1, 2, 3, 2]))
+
+        assert asyncio.run(main()) == [10, 20, 30, 20]
+        assert calls == [[1, 2, 3]]  # duplicates sent once
+
+    def test_full_batch_flushes_immediately(self):
+        from xpytools.xdeco import batched
+
+        calls = []
+
+        @batched(max_size=2, max_wait_ms=10_000)
+        async def fetch(keys):
+            calls.append(list(keys))
+            return keys
+
+        async def main():
+            return await asyncio.wait_for(asyncio.gather(fetch("a"), fetch("b")), timeout=5)
+
+        assert asyncio.run(main()) == ["a", "b"]
+        assert calls == [["a", "b"]]
+
+    def test_batch_error_propagates(self):
+        from xpytools.xdeco import batched
+
+        @batched(max_size=10, max_wait_ms=1)
+        async def fetch(keys):
+            raise RuntimeError("nope")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(fetch("a"))
@@ -0,0 +1,138 @@
+import os
+import threading
+import time
+
+import pytest
+
+from xpytools.xdeco import ItemError, parallel, parallel_map
+
+
+def square(x):
+    return x * x
+
+
+def fail_on_three(x):
+    if x == 3:
+        raise ValueError(f"bad item {x}")
+    return x
+
+
+def pid_of(_):
+    return os.getpid()
+
+
+def burn(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+@parallel(mode="thread", workers=4)
+def shout(text):
+    return text.upper()
+
+
+class TestParallelMap:
+    """Tests for parallel_map"""
+
+    @pytest.mark.parametrize("mode", ["thread", "process", "auto"])
+    def test_preserves_order(self, mode):
+        assert list(parallel_map(square, range(50), mode=mode, workers=2, chunksize=4)) == \
+               [x * x for x in range(50)]
+
+    def test_accepts_generators_and_empty_input(self):
+        assert list(parallel_map(square, (x for x in range(5)), mode="thread")) == [0, 1, 4, 9, 16]
+        assert list(parallel_map(square, [], mode="thread")) == []
+        assert list(parallel_map(square, [])) == []
+
+    def test_process_mode_uses_other_processes(self):
+        pids = set(parallel_map(pid_of, range(8), mode="process", workers=2, chunksize=2))
+        assert os.getpid() not in pids
+
+    def test_thread_mode_runs_concurrently(self):
+        def slow(x):
+            time.sleep(0.1)
+            return x
+
+        started = time.perf_counter()
+        assert list(parallel_map(slow, range(8), mode="thread", workers=8)) == list(range(8))
+        assert time.perf_counter() - started < 0.6
+
+    def test_errors_raise(self):
+        with pytest.raises(ValueError, match="bad item 3"):
+            list(parallel_map(fail_on_three, range(6), mode="thread"))
+
+    def test_errors_collect(self):
+        out = list(parallel_map(fail_on_three, range(6), mode="process", workers=2, chunksize=2,
+                                errors="collect"))
+        assert out[:3] == [0, 1, 2] and out[4:] == [4, 5]
+        err = out[3]
+        assert isinstance(err, ItemError)
+        assert (err.index, err.item) == (3, 3)
+        assert isinstance(err.error, ValueError)
+
+    def test_errors_skip(self):
+        out = parallel_map(fail_on_three, range(6), mode="thread", errors="skip")
+        assert list(out) == [0, 1, 2, 4, 5]
+
+    def test_bounded_in_flight(self):
+        consumed = []
+        lock = threading.Lock()
+
+        def source():
+            for i in range(100):
+                with lock:
+                    consumed.append(i)
+                yield i
+
+        gen = parallel_map(square, source(), mode="thread", workers=2, chunksize=1, max_in_flight=3)
+        assert next(gen) == 0
+        time.sleep(0.05)
+        assert len(consumed) <= 5
+        gen.close()
+
+    def test_auto_falls_back_to_threads_for_unpicklable_functions(self):
+        offset = 10
+        assert list(parallel_map(lambda x: burn(2000) * 0 + x + offset, range(6), chunksize=2)) == \
+               [x + 10 for x in range(6)]
+
+    def test_auto_io_bound_uses_small_probe_and_thread_chunks(self):
+        def slow(x):
+            time.sleep(0.02)
+            return x
+
+        started = time.perf_counter()
+        assert list(parallel_map(slow, (i for i in range(80)), workers=8)) == list(range(80))
+        # Serially (or with one 64-item probe chunk) this takes well over a second.
+        assert time.perf_counter() - started < 0.9
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            list(parallel_map(square, [1], mode="gpu"))
+        with pytest.raises(ValueError):
+            list(parallel_map(square, [1], errors="ignore"))
+        with pytest.raises(ValueError):
+            list(parallel_map(square, [1], workers=0))
+
+    def test_available_from_xtool(self):
+        from xpytools import xtool
+        assert xtool.parallel_map is parallel_map
+
+
+class TestParallelDecorator:
+    """Tests for @parallel"""
+
+    def test_function_is_unchanged_and_gets_map(self):
+        assert shout("a") == "A"
+        assert list(shout.map(["a", "b"])) == ["A", "B"]
+
+    def test_map_overrides(self):
+        assert list(shout.map(["a", "b"], mode="process", workers=1)) == ["A", "B"]
+
+    def test_bare_usage(self):
+        @parallel
+        def inc(x):
+            return x + 1
+
+        assert list(inc.map([1, 2], mode="thread")) == [2, 3]
@@ -65,3 +65,41 @@ class TestRequireModules:
 
         assert "fake1" in str(exc.value)
         assert "fake2" in str(exc.value)
+
+    def test_available_modules_return_function_unwrapped(self):
+        from xpytools.xdeco import requireModules
+
+        def my_func():
+            return "success"
+
+        assert requireModules(["sys", "json"])(my_func) is my_func
+
+    def test_availability_is_cached(self, monkeypatch):
+        import importlib
+
+        from xpytools.xdeco import requireModules
+
+        lazy_module = importlib.import_module("xpytools._lazy")
+
+        calls = []
+        real_find_spec = lazy_module.find_spec
+
+        def counting_find_spec(name):
+            calls.append(name)
+            return real_find_spec(name)
+
+        monkeypatch.setattr(lazy_module, "find_spec", counting_find_spec)
+        monkeypatch.setattr(lazy_module, "_AVAILABLE", {})
+
+        for _ in range(3):
+            requireModules(["nonexistent_module_cached"])(lambda: None)
+        assert calls == ["nonexistent_module_cached"]
+
+    def test_missing_parent_package_counts_as_missing(self):
+        from xpytools.xdeco import requireModules
+
+        @requireModules(["nonexistent_pkg_xyz.sub"])
+        def my_func():
+            return "should not run"
+
+        assert my_func() is None
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+class TestSingleFlightThreads:
+    """Tests for @singleFlight with regular functions"""
+
+    def test_concurrent_identical_calls_run_once(self):
+        from xpytools.xdeco import singleFlight
+
+        calls = []
+        barrier = threading.Barrier(8)
+
+        @singleFlight
+        def load(url):
+            calls.append(url)
+            time.sleep(0.1)
+            return url.upper()
+
+        def call(_):
+            barrier.wait()
+            return load("a")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(call, range(8)))
+
+        assert results == ["A"] * 8
+        assert calls == ["a"]
+
+    def test_different_keys_run_independently(self):
+        from xpytools.xdeco import singleFlight
+
+        calls = []
+
+        @singleFlight
+        def load(url):
+            calls.append(url)
+            return url
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert sorted(pool.map(load, ["a", "b", "c"])) == ["a", "b", "c"]
+        assert sorted(calls) == ["a", "b", "c"]
+
+    def test_key_is_released_after_completion(self):
+        from xpytools.xdeco import singleFlight
+
+        calls = []
+
+        @singleFlight
+        def load(url):
+            calls.append(url)
+            return url
+
+        load("a")
+        load("a")
+        assert calls == ["a", "a"]
+
+    def test_exception_is_shared(self):
+        from xpytools.xdeco import singleFlight
+
+        calls = []
+        barrier = threading.Barrier(4)
+
+        @singleFlight
+        def boom(x):
+            calls.append(x)
+            time.sleep(0.1)
+            raise ValueError("bad")
+
+        def call(_):
+            barrier.wait()
+            with pytest.raises(ValueError, match="bad"):
+                boom(1)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(call, range(4)))
+        assert calls == [1]
+
+    def test_custom_key(self):
+        from xpytools.xdeco import singleFlight
+
+        calls = []
+        barrier = threading.Barrier(2)
+
+        @singleFlight(key=lambda query, **_: query)
+        def run(query, timeout=1):
+            calls.append(timeout)
+            time.sleep(0.1)
+            return query
+
+        def call(timeout):
+            barrier.wait()
+            return run("select 1", timeout=timeout)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            assert list(pool.map(call, [1, 2])) == ["select 1"] * 2
+        assert len(calls) == 1
+
+    def test_unhashable_arguments(self):
+        from xpytools.xdeco import singleFlight
+
+        @singleFlight
+        def echo(payload):
+            return payload
+
+        assert echo({"a": [1, 2]}) == {"a": [1, 2]}
+
+
+class TestSingleFlightAsync:
+    """Tests for @singleFlight with coroutine functions"""
+
+    def test_gathered_calls_share_one_execution(self):
+        from xpytools.xdeco import singleFlight
+
+        calls = []
+
+        @singleFlight
+        async def load(url):
+            calls.append(url)
+            await asyncio.sleep(0.01)
+            return url * 2
+
+        async def main():
+            return await asyncio.gather(*(load("x") for _ in range(5)), load("y"))
+
+        assert asyncio.run(main()) == ["xx"] * 5 + ["yy"]
+        assert sorted(calls) == ["x", "y"]
+
+    def test_cancelling_one_waiter_keeps_shared_call(self):
+        from xpytools.xdeco import singleFlight
+
+        @singleFlight
+        async def load(url):
+            await asyncio.sleep(0.05)
+            return url
+
+        async def main():
+            first = asyncio.ensure_future(load("a"))
+            second = asyncio.ensure_future(load("a"))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(main()) == "a"
+
+    def test_async_exception_is_shared(self):
+        from xpytools.xdeco import singleFlight
+
+        @singleFlight
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise KeyError("k")
+
+        async def main():
+            return await asyncio.gather(boom(), boom(), return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, KeyError) for r in results)
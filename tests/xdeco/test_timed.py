@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def registry():
+    from xpytools.xdeco import MetricsRegistry
+    return MetricsRegistry(enabled=True)
+
+
+class TestTimed:
+    """Tests for @timed and the MetricsRegistry"""
+
+    def test_records_count_total_and_histogram(self, registry):
+        from xpytools.xdeco import timed
+
+        @timed("stage.a", registry=registry)
+        def f(x):
+            return x * 2
+
+        assert f(2) == 4
+        f(3)
+        st = registry.as_dict()["stage.a"]
+        assert st["count"] == 2
+        assert st["total_s"] >= st["max_s"] > 0
+        assert sum(st["histogram"].values()) == 2
+
+    def test_disabled_registry_records_nothing(self, registry):
+        from xpytools.xdeco import timed
+
+        registry.disable()
+
+        @timed("stage.a", registry=registry)
+        def f():
+            return 1
+
+        assert f() == 1
+        assert registry.as_dict() == {}
+
+    def test_bare_usage_uses_qualified_name(self, monkeypatch):
+        from xpytools.xdeco import metrics, timed
+
+        monkeypatch.setattr(metrics, "enabled", True)
+        metrics.reset()
+
+        @timed
+        def stage():
+            return "ok"
+
+        assert stage() == "ok"
+        assert stage.__name__ == "stage"
+        assert any(name.endswith("stage") for name in metrics.as_dict())
+        metrics.reset()
+
+    def test_failed_calls_are_recorded(self, registry):
+        from xpytools.xdeco import timed
+
+        @timed("boom", registry=registry)
+        def f():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            f()
+        assert registry.as_dict()["boom"]["count"] == 1
+
+    def test_async_functions(self, registry):
+        from xpytools.xdeco import timed
+
+        @timed("async.stage", registry=registry)
+        async def f():
+            await asyncio.sleep(0.01)
+            return 5
+
+        assert asyncio.run(f()) == 5
+        assert registry.as_dict()["async.stage"]["max_s"] >= 0.01
+
+    def test_record_buckets_by_power_of_two(self, registry):
+        registry.record("x", 1000)   # 2**9 < 1000 < 2**10
+        registry.record("x", 1023)
+        registry.record("x", 1024)
+        hist = registry.as_dict()["x"]["histogram"]
+        assert hist == {1024 / 1e9: 2, 2048 / 1e9: 1}
+
+    def test_prometheus_output(self, registry):
+        registry.record("xtool.df.lookup", 1000)
+        registry.record("xtool.df.lookup", 5000)
+        text = registry.to_prometheus()
+        assert "# TYPE xpytools_call_duration_seconds histogram" in text
+        assert 'xpytools_call_duration_seconds_bucket{name="xtool.df.lookup",le="+Inf"} 2' in text
+        assert 'xpytools_call_duration_seconds_count{name="xtool.df.lookup"} 2' in text
+        buckets = [line for line in text.splitlines() if "_bucket" in line]
+        counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+        assert counts == sorted(counts)  # cumulative
+
+    def test_xtool_entry_points_are_instrumented(self, monkeypatch):
+        pd = pytest.importorskip("pandas")
+        from xpytools import xtool
+        from xpytools.xdeco import metrics
+
+        monkeypatch.setattr(metrics, "enabled", True)
+        metrics.reset()
+        xtool.df.replace_none_like(pd.DataFrame({"a": ["x", "null"]}))
+        assert metrics.as_dict()["xtool.df.replace_none_like"]["count"] == 1
+        metrics.reset()
+
+
+class TestProfiled:
+    """Tests for @profiled"""
+
+    def test_collects_profile(self, registry):
+        from xpytools.xdeco import profiled
+
+        def inner(n):
+            return sum(range(n))
+
+        @profiled("heavy", registry=registry)
+        def heavy():
+            return inner(1000)
+
+        heavy()
+        heavy()
+        assert registry.as_dict()["heavy"]["count"] == 2
+        assert "inner" in registry.profile_report("heavy")
+
+    def test_async_functions(self, registry):
+        from xpytools.xdeco import profiled
+
+        def inner(n):
+            return sum(range(n))
+
+        @profiled("async.heavy", registry=registry)
+        async def heavy():
+            await asyncio.sleep(0.01)
+            return inner(1000)
+
+        assert asyncio.run(heavy()) == 499500
+        assert registry.as_dict()["async.heavy"]["max_s"] >= 0.01
+        assert "inner" in registry.profile_report("async.heavy")
+
+    def test_nested_profiled_calls_do_not_fail(self, registry):
+        from xpytools.xdeco import profiled
+
+        @profiled("inner", registry=registry)
+        def inner():
+            return 1
+
+        @profiled("outer", registry=registry)
+        def outer():
+            return inner() + 1
+
+        assert outer() == 2
+        assert registry.as_dict()["inner"]["count"] == 1
+        assert registry.profile_stats("inner") is None
@@ -0,0 +1,176 @@
+import threading
+import time
+
+
+class TestTTLCache:
+    """Tests for @ttlCache decorator"""
+
+    def test_caches_results(self):
+        from xpytools.xdeco import ttlCache
+
+        calls = []
+
+        @ttlCache(ttl=5)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert calls == [3]
+        assert square.cache_info() == (1, 1, 128, 1)
+
+    def test_bare_decorator_and_metadata(self):
+        from xpytools.xdeco import ttlCache
+
+        @ttlCache
+        def my_func():
+            """Test docstring"""
+            return object()
+
+        assert my_func() is my_func()
+        assert my_func.__name__ == "my_func"
+        assert my_func.__doc__ == "Test docstring"
+
+    def test_entries_expire(self):
+        from xpytools.xdeco import ttlCache
+
+        @ttlCache(ttl=0.2)
+        def now():
+            return time.monotonic()
+
+        first = now()
+        assert now() == first
+        time.sleep(0.3)
+        assert now() != first
+
+    def test_currsize_excludes_expired(self):
+        from xpytools.xdeco import ttlCache
+
+        @ttlCache(ttl=0.2)
+        def echo(x):
+            return x
+
+        echo(1)
+        echo(2)
+        assert echo.cache_info().currsize == 2
+        time.sleep(0.3)
+        assert echo.cache_info().currsize == 0
+
+    def test_keyword_and_positional_keys_differ(self):
+        from xpytools.xdeco import ttlCache
+
+        @ttlCache(ttl=5)
+        def describe(*args, **kwargs):
+            return args, kwargs
+
+        assert describe("a", b=1) == (("a",), {"b": 1})
+        assert describe(("a",), (("b", 1),)) == ((("a",), (("b", 1),)), {})
+        assert describe.cache_info().misses == 2
+
+    def test_unhashable_arguments(self):
+        from xpytools.xdeco import ttlCache
+
+        calls = []
+
+        @ttlCache(ttl=5)
+        def total(payload, factors=None):
+            calls.append(1)
+            return sum(payload["values"]) * sum(factors or [1])
+
+        assert total({"values": [1, 2]}, factors=[2]) == 6
+        assert total({"values": [1, 2]}, factors=[2]) == 6
+        assert total({"values": [1, 3]}, factors=[2]) == 8
+        assert len(calls) == 2
+
+    def test_bypass_invalidate_and_clear(self):
+        from xpytools.xdeco import ttlCache
+
+        calls = []
+
+        @ttlCache(ttl=5)
+        def ident(x):
+            calls.append(x)
+            return x
+
+        ident(1)
+        ident.bypass(1)
+        assert calls == [1, 1]
+        assert ident.cache_info().hits == 0
+
+        ident.invalidate(1)
+        ident(1)
+        assert calls == [1, 1, 1]
+
+        ident.cache_clear()
+        assert ident.cache_info() == (0, 0, 128, 0)
+
+    def test_exceptions_are_not_cached(self):
+        from xpytools.xdeco import ttlCache
+
+        attempts = []
+
+        @ttlCache(ttl=5)
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return "ok"
+
+        try:
+            flaky()
+        except RuntimeError:
+            pass
+        assert flaky() == "ok"
+        assert flaky() == "ok"
+        assert len(attempts) == 2
+
+    def test_maxsize_bounds_memory(self):
+        from xpytools.xdeco import ttlCache
+
+        @ttlCache(ttl=5, maxsize=4)
+        def ident(x):
+            return x
+
+        for i in range(50):
+            ident(i)
+        assert ident.cache_info().currsize == 4
+
+    def test_thread_safety(self):
+        from xpytools.xdeco import ttlCache
+
+        @ttlCache(ttl=5, maxsize=16)
+        def ident(x):
+            return x
+
+        errors = []
+
+        def worker():
+            try:
+                for i in range(200):
+                    assert ident(i % 20) == i % 20
+            except Exception as exc:  # pragma: no cover
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors
+
+    def test_dataframe_arguments(self):
+        import pytest
+        pd = pytest.importorskip("pandas")
+        from xpytools.xdeco import ttlCache
+
+        calls = []
+
+        @ttlCache(ttl=5)
+        def row_count(df):
+            calls.append(1)
+            return len(df)
+
+        assert row_count(pd.DataFrame({"a": [1, 2]})) == 2
+        assert row_count(pd.DataFrame({"a": [1, 2]})) == 2
+        assert len(calls) == 1
@@ -0,0 +1,85 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools._lazy
+--------------
+Internal access point for optional dependencies.
+
+Every optional import in the package goes through a `LazyModule` proxy:
+
+    np = LazyModule("numpy")
+
+    if np:                  # installed? (cached find_spec, does not import)
+        ...
+    if np.loaded:           # already imported by someone? (never imports)
+        isinstance(x, np.generic)
+    np.asarray(values)      # first attribute access imports and caches numpy
+
+`loaded` is the cheap guard for type checks: an object cannot be a pandas
+DataFrame unless pandas has been imported, so `is_df` & co. never pull in
+heavy libraries just to answer "no".
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from importlib.util import find_spec
+from types import ModuleType
+from typing import Any, Optional
+
+# Process-wide cache: module name -> importable?
+_AVAILABLE: dict[str, bool] = {}
+
+
+def _module_available(name: str) -> bool:
+    """Return True if `name` can be imported (cached per process, never imports it)."""
+    available = _AVAILABLE.get(name)
+    if available is None:
+        if name in sys.modules:
+            available = sys.modules[name] is not None
+        else:
+            try:
+                available = find_spec(name) is not None
+            except (ImportError, ValueError):  # e.g. missing parent package
+                available = False
+        _AVAILABLE[name] = available
+    return available
+
+
+class LazyModule:
+    """
+    Proxy that imports module `name` on first attribute access.
+
+    Truthiness reports whether the module is installed, without importing it.
+    """
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    @property
+    def loaded(self) -> bool:
+        """True if the module has already been imported (by anyone)."""
+        return self._module is not None or self._name in sys.modules
+
+    def _load(self) -> ModuleType:
+        module = self._module
+        if module is None:
+            module = importlib.import_module(self._name)
+            self._module = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __bool__(self) -> bool:
+        return _module_available(self._name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
@@ -10,10 +10,27 @@ Lightweight decorators for runtime safety and object management.
 
 from __future__ import annotations
 
+from .asMultiton import asMultiton
 from .asSingleton import asSingleton
+from .batched import batched
+from .parallel import ItemError, parallel, parallel_map
 from .requireModules import requireModules
+from .singleFlight import singleFlight
+from .timed import MetricsRegistry, metrics, profiled, timed
+from .ttlCache import ttlCache
 
 __all__ = [
         "requireModules",
         "asSingleton",
+        "asMultiton",
+        "ttlCache",
+        "batched",
+        "singleFlight",
+        "parallel",
+        "parallel_map",
+        "ItemError",
+        "timed",
+        "profiled",
+        "metrics",
+        "MetricsRegistry",
         ]
@@ -0,0 +1,42 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools.xdeco._keys
+--------------------
+Argument-key builder shared by the caching / deduplicating decorators.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Hashable
+
+# Separates positional from keyword arguments, as in `functools._make_key`,
+# so ``f(a, b=1)`` and ``f(a, ("b", 1))`` get different keys.
+_KWD_MARK = object()
+
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable:
+    """
+    Build a hashable cache key from call arguments.
+
+    Hashable arguments are used as-is (fast path). Calls with unhashable
+    arguments (dicts, lists, DataFrames, ...) fall back to a canonical JSON
+    string of their `to_primitives` form, so equal contents map to equal keys.
+    """
+    key = args + (_KWD_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        return _canonical_key(args, kwargs)
+
+
+def _canonical_key(args: tuple, kwargs: dict) -> str:
+    """Canonical JSON form of `(args, kwargs)` via `to_primitives`."""
+    from ..xtype.xcast.to_primitives import to_primitives
+
+    payload: Any = [to_primitives(list(args)), to_primitives(kwargs)]
+    return json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
@@ -0,0 +1,148 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any, Callable, Hashable, Optional, Type, TypeVar, Union, overload
+
+from ._keys import _make_key
+
+C = TypeVar("C", bound=type)
+
+
+@overload
+def asMultiton(cls: C) -> C: ...
+
+
+@overload
+def asMultiton(
+        cls: None = None,
+        *,
+        key: Optional[Callable[..., Hashable]] = None,
+        weak: bool = False,
+        ) -> Callable[[C], C]: ...
+
+
+# noinspection PyPep8Naming
+def asMultiton(
+        cls: Optional[C] = None,
+        *,
+        key: Optional[Callable[..., Hashable]] = None,
+        weak: bool = False,
+        ) -> Union[C, Callable[[C], C]]:
+    """
+    Keep one instance per constructor-argument key.
+
+    The keyed sibling of `asSingleton`: ``Pool("dsn-a")`` always returns the
+    same object, ``Pool("dsn-b")`` a different one. Each instance's
+    `__init__` runs exactly once, also under concurrent first use. Instances
+    with different keys are built in parallel; only callers asking for the
+    same key wait for each other.
+
+    Parameters
+    ----------
+    cls : type, optional
+        Class to decorate (allows bare ``@asMultiton`` usage).
+    key : Callable, optional
+        ``key(*args, **kwargs) -> Hashable`` mapping constructor arguments to
+        the instance key. Defaults to the raw arguments (unhashable ones are
+        keyed on their canonical `to_primitives` form). Note that by default
+        ``Pool("a")`` and ``Pool(dsn="a")`` are different keys; pass a `key`
+        function to normalise them.
+    weak : bool, default=False
+        Hold instances through weak references, so an instance is dropped
+        (and rebuilt on next use) once nothing else references it.
+
+    Returns
+    -------
+    A multiton-enforcing subclass of the original class with extra methods:
+
+    - ``instances()`` → dict snapshot of ``key -> instance``
+    - ``clear_instances()`` → forget all cached instances
+
+    Examples
+    --------
+    >>> @asMultiton(key=lambda dsn, **_: dsn)
+    ... class ConnectionPool:
+    ...     def __init__(self, dsn: str, size: int = 10):
+    ...         self.pool = create_pool(dsn, size)
+    >>> ConnectionPool("postgres://a") is ConnectionPool("postgres://a", size=5)
+    True
+    """
+
+    def decorator(klass: C) -> C:
+        if "__new__" in klass.__dict__:
+            raise _MultitonViolationException(klass)
+
+        key_fn = key if key is not None else (lambda *args, **kwargs: _make_key(args, kwargs))
+        registry: Union[dict, weakref.WeakValueDictionary] = (
+                weakref.WeakValueDictionary() if weak else {}
+        )
+        registry_lock = threading.Lock()
+        # key -> init lock for instances whose __init__ has not completed yet.
+        # Kept off the instance so __slots__ classes and custom __eq__ work.
+        pending: dict = {}
+
+        class MultitonWrapper(klass):
+
+            def __new__(cls_, *args, **kwargs):
+                k = key_fn(*args, **kwargs)
+                instance = registry.get(k)
+                if instance is None:
+                    with registry_lock:
+                        instance = registry.get(k)
+                        if instance is None:
+                            instance = super(MultitonWrapper, cls_).__new__(cls_)
+                            # Per-key lock: different keys initialise concurrently.
+                            pending[k] = threading.RLock()
+                            registry[k] = instance
+                return instance
+
+            def __init__(self, *args, **kwargs):
+                k = key_fn(*args, **kwargs)
+                lock = pending.get(k)
+                if lock is None:
+                    return
+                with lock:
+                    if pending.get(k) is lock:
+                        super(MultitonWrapper, self).__init__(*args, **kwargs)
+                        pending.pop(k, None)
+
+            @classmethod
+            def instances(cls_) -> dict:
+                with registry_lock:
+                    return dict(registry.items())
+
+            @classmethod
+            def clear_instances(cls_) -> None:
+                with registry_lock:
+                    registry.clear()
+                    pending.clear()
+
+        MultitonWrapper.__name__ = klass.__name__
+        MultitonWrapper.__qualname__ = klass.__qualname__
+        MultitonWrapper.__doc__ = klass.__doc__
+        MultitonWrapper.__module__ = klass.__module__
+        return MultitonWrapper  # type: ignore[return-value]
+
+    if cls is not None:
+        return decorator(cls)
+    return decorator
+
+
+class _MultitonViolationException(Exception):
+    """
+    Raised when a class using @asMultiton defines its own __new__ method.
+    """
+
+    def __init__(self, cls: Type[Any] = None) -> None:
+        cls_name = getattr(cls, "__name__", "<unknown class>")
+        msg = (
+                f"Multiton violation in '{cls_name}':\n"
+                f"  Classes decorated with @asMultiton must not override the '__new__' method.\n"
+                f"\n  ➤ Fix: Remove the '__new__' method or do not use the @asMultiton decorator.\n"
+        )
+        super().__init__(msg)
@@ -2,6 +2,7 @@
 #  Author: Willem van der Schans.
 #  Licensed under the MIT License (https://opensource.org/license/mit).
 
+import threading
 from typing import Type, Any
 
 
@@ -13,6 +14,10 @@ def asSingleton(cls: type) -> type:
     Prevents the user-defined class from defining its own `__new__`, which would
     conflict with the singleton logic.
 
+    Construction is thread-safe: concurrent first calls create exactly one
+    instance and run `__init__` exactly once (double-checked locking, so
+    later calls never touch the lock).
+
     :param cls: The class to wrap
     :return: A singleton-enforcing subclass of the original
     """
@@ -24,16 +29,23 @@ def asSingleton(cls: type) -> type:
 
     class SingletonWrapper(cls):
         __cls_instance = None
+        # Reentrant: __init__ may itself reference the singleton.
+        __cls_lock = threading.RLock()
 
         def __new__(cls_, *args, **kwargs):
             if cls_.__cls_instance is None:
-                cls_.__cls_instance = super(SingletonWrapper, cls_).__new__(cls_)
+                with cls_.__cls_lock:
+                    if cls_.__cls_instance is None:
+                        cls_.__cls_instance = super(SingletonWrapper, cls_).__new__(cls_)
             return cls_.__cls_instance
 
         def __init__(self, *args, **kwargs):
-            if not getattr(self, '__singleton_initialized__', False):
-                super(SingletonWrapper, self).__init__(*args, **kwargs)
-                setattr(self, '__singleton_initialized__', True)
+            if getattr(self, '__singleton_initialized__', False):
+                return
+            with self.__cls_lock:
+                if not getattr(self, '__singleton_initialized__', False):
+                    super(SingletonWrapper, self).__init__(*args, **kwargs)
+                    setattr(self, '__singleton_initialized__', True)
 
     SingletonWrapper.__name__ = cls.__name__
     SingletonWrapper.__qualname__ = cls.__qualname__
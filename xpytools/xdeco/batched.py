@@ -0,0 +1,196 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools.xdeco.batched
+----------------------
+Request-coalescing decorator (the "dataloader" pattern).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import weakref
+from collections.abc import Mapping
+from concurrent.futures import Future
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class _Batch:
+    """Keys collected for one backend call, each with the futures waiting on it."""
+
+    __slots__ = ("waiters", "closed")
+
+    def __init__(self) -> None:
+        self.waiters: Dict[Hashable, List[Any]] = {}
+        self.closed = False
+
+
+def _distribute(batch: _Batch, results: Any) -> None:
+    """Hand every waiter its own result (or exception) from one backend call."""
+    keys = list(batch.waiters)
+    if isinstance(results, Mapping):
+        lookup = results
+    else:
+        results = list(results)
+        if len(results) != len(keys):
+            raise ValueError(
+                    f"Batched function returned {len(results)} results for {len(keys)} keys"
+                    )
+        lookup = dict(zip(keys, results))
+
+    for key, futures in batch.waiters.items():
+        if key in lookup:
+            value, exc = lookup[key], None
+            if isinstance(value, BaseException):
+                value, exc = None, value
+        else:
+            value, exc = None, KeyError(key)
+        for fut in futures:
+            if fut.done():  # cancelled asyncio waiter
+                continue
+            if exc is not None:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(value)
+
+
+def _fail(batch: _Batch, exc: BaseException) -> None:
+    for futures in batch.waiters.values():
+        for fut in futures:
+            if not fut.done():
+                fut.set_exception(exc)
+
+
+def batched(max_size: int = 64, max_wait_ms: float = 5.0) -> Callable[[Callable], Callable]:
+    """
+    Turn a function of a *list of keys* into a function of a *single key*
+    that transparently collects concurrent calls into batches.
+
+    The first caller of a batch waits up to `max_wait_ms` for more keys (or
+    until `max_size` distinct keys are collected), then one backend call is
+    made for the whole batch and each caller receives its own result.
+    Duplicate keys in a batch are sent to the backend once.
+
+    Works for threads (decorate a regular function) and for asyncio
+    (decorate an ``async def`` function; batches are collected per event loop).
+
+    The decorated function must accept a list of hashable keys and return
+    either a list of results in the same order, or a mapping ``key -> result``
+    (keys missing from the mapping raise `KeyError` for their callers).
+    A result that is an exception instance is raised for that caller only;
+    an exception raised by the function itself fails the whole batch.
+
+    Parameters
+    ----------
+    max_size : int, default=64
+        Maximum number of distinct keys per backend call.
+    max_wait_ms : float, default=5.0
+        Maximum time the first caller of a batch waits for more keys.
+
+    Returns
+    -------
+    Decorator producing a single-key function with a ``batch_fn`` attribute
+    (the original list-based function).
+
+    Examples
+    --------
+    >>> @batched(max_size=100, max_wait_ms=2)
+    ... def resolve_users(ids: list[str]) -> dict[str, dict]:
+    ...     return {row["id"]: row for row in db.fetch_users(ids)}
+    >>> resolve_users("u-42")          # from many threads at once
+    {'id': 'u-42', ...}
+    """
+    if max_size < 1:
+        raise ValueError(f"max_size must be positive, got {max_size!r}")
+    max_wait = max(0.0, max_wait_ms / 1000.0)
+
+    def decorator(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+            wrapper = _async_batched(fn, max_size, max_wait)
+        else:
+            wrapper = _sync_batched(fn, max_size, max_wait)
+        wrapper.batch_fn = fn
+        return wrapper
+
+    return decorator
+
+
+def _sync_batched(fn: Callable, max_size: int, max_wait: float) -> Callable:
+    cond = threading.Condition()
+    current: List[Optional[_Batch]] = [None]
+
+    def run(batch: _Batch) -> None:
+        try:
+            results = fn(list(batch.waiters))
+            _distribute(batch, results)
+        except BaseException as e:
+            _fail(batch, e)
+
+    @wraps(fn)
+    def wrapper(key: Hashable) -> Any:
+        fut: Future = Future()
+        run_now = False
+        with cond:
+            batch = current[0]
+            if batch is None:
+                batch = current[0] = _Batch()
+            leader = not batch.waiters
+            batch.waiters.setdefault(key, []).append(fut)
+            if len(batch.waiters) >= max_size:
+                # Full: whoever filled it runs it; wake the leader.
+                batch.closed, current[0], run_now = True, None, True
+                cond.notify_all()
+            elif leader:
+                cond.wait_for(lambda: batch.closed, timeout=max_wait)
+                if not batch.closed:
+                    batch.closed, current[0], run_now = True, None, True
+        if run_now:
+            run(batch)
+        return fut.result()
+
+    return wrapper
+
+
+def _async_batched(fn: Callable, max_size: int, max_wait: float) -> Callable:
+    # Per-loop state: a batch must only hold futures of a single event loop.
+    pending: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Batch]" = (
+            weakref.WeakKeyDictionary()
+    )
+    running: set = set()  # strong refs so in-flight tasks are not garbage collected
+
+    async def run(batch: _Batch) -> None:
+        try:
+            results = await fn(list(batch.waiters))
+            _distribute(batch, results)
+        except BaseException as e:
+            _fail(batch, e)
+
+    def flush(loop: asyncio.AbstractEventLoop, batch: _Batch) -> None:
+        if batch.closed:
+            return
+        batch.closed = True
+        if pending.get(loop) is batch:
+            del pending[loop]
+        task = loop.create_task(run(batch))
+        running.add(task)
+        task.add_done_callback(running.discard)
+
+    @wraps(fn)
+    async def wrapper(key: Hashable) -> Any:
+        loop = asyncio.get_running_loop()
+        batch = pending.get(loop)
+        if batch is None:
+            batch = pending[loop] = _Batch()
+            loop.call_later(max_wait, flush, loop, batch)
+        fut = loop.create_future()
+        batch.waiters.setdefault(key, []).append(fut)
+        if len(batch.waiters) >= max_size:
+            flush(loop, batch)
+        return await fut
+
+    return wrapper
@@ -0,0 +1,272 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools.xdeco.parallel
+-----------------------
+Order-preserving, streaming parallel map over thread or process pools.
+
+Usage
+-----
+from xpytools.xtool import parallel_map
+
+for text in parallel_map(xtool.txt.clean, rows, errors="collect"):
+    ...
+
+@parallel(mode="process", chunksize=500)
+def thumbnail(path): ...
+
+thumbnails = list(thumbnail.map(paths))
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from collections import deque, namedtuple
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from time import perf_counter, process_time
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ..xtype.choice import strChoice
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+ItemError = namedtuple("ItemError", ["index", "item", "error"])
+ItemError.__doc__ = (
+    "Placeholder yielded by `parallel_map(errors='collect')` for an item that raised."
+)
+
+_Mode = strChoice("auto", "thread", "process")
+_Errors = strChoice("raise", "collect", "skip")
+
+# Probe CPU/wall ratio above which "auto" switches to processes.
+_CPU_BOUND_RATIO = 0.5
+# Items "auto" runs in the caller to measure that ratio.
+_PROBE_SIZE = 8
+
+
+def _run_chunk(func: Callable, start: int, chunk: List[Any], errors: str) -> List[Any]:
+    """Apply `func` to one chunk (runs inside the worker)."""
+    if errors == "raise":
+        return [func(item) for item in chunk]
+    out = []
+    for i, item in enumerate(chunk, start):
+        try:
+            out.append(func(item))
+        except Exception as e:
+            if errors == "collect":
+                out.append(ItemError(i, item, e))
+    return out
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _default_chunksize(mode: str, n: Optional[int], workers: int) -> int:
+    """1 for threads; for processes ~4 chunks per worker (max 1000), or 64 if `n` is unknown."""
+    if mode == "thread":
+        return 1
+    return max(1, min(1000, -(-n // (workers * 4)))) if n else 64
+
+
+def _picklable(*objs: Any) -> bool:
+    try:
+        pickle.dumps(objs)
+        return True
+    except Exception:
+        return False
+
+
+def parallel_map(
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        *,
+        mode: str = "auto",
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        errors: str = "raise",
+        ) -> Iterator[Any]:
+    """
+    Apply `func` to every item in parallel, yielding results in input order.
+
+    Items are sent to the pool in chunks to amortize scheduling and IPC cost,
+    and at most `max_in_flight` chunks are pending at any time, so arbitrarily
+    long (lazy) inputs are processed with bounded memory. Results stream out
+    as soon as the next chunk in order is done.
+
+    Parameters
+    ----------
+    func : Callable
+        Single-argument function to apply. Must be picklable (module-level)
+        for process mode.
+    items : Iterable
+        Input items; consumed lazily.
+    mode : {"auto", "thread", "process"}, default="auto"
+        ``"thread"`` for I/O-bound work (HTTP, DB, files), ``"process"`` for
+        CPU-bound pure-Python work. ``"auto"`` runs the first few items in the
+        calling process and measures their CPU/wall-time ratio: mostly CPU →
+        processes, mostly waiting → threads. Unpicklable functions or items
+        always use threads.
+    workers : int, optional
+        Pool size. Defaults to ``os.cpu_count()`` for processes and
+        ``min(32, cpu_count + 4)`` for threads.
+    chunksize : int, optional
+        Items per task. Defaults to 1 for threads, and to a size giving each
+        process worker ~4 chunks (capped at 1000) when `items` has a length.
+        In ``"auto"`` mode the default follows the mode that was picked.
+    max_in_flight : int, optional
+        Maximum number of pending chunks. Defaults to ``2 * workers``.
+    errors : {"raise", "collect", "skip"}, default="raise"
+        What to do when `func` raises for an item: re-raise (remaining work
+        is cancelled), yield an ``ItemError(index, item, error)`` in its
+        place, or drop the item from the output.
+
+    Yields
+    ------
+    Any
+        ``func(item)`` for every item, in input order.
+
+    Examples
+    --------
+    >>> from xpytools.xtool import parallel_map, txt
+    >>> cleaned = list(parallel_map(txt.clean, texts, errors="collect"))
+    >>> failures = [r for r in cleaned if isinstance(r, ItemError)]
+    """
+    mode = _Mode(mode)
+    errors = _Errors(errors)
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be positive, got {workers!r}")
+    cpu = os.cpu_count() or 1
+
+    try:
+        n: Optional[int] = len(items)  # type: ignore[arg-type]
+    except TypeError:
+        n = None
+    it = iter(items)
+
+    # "auto": profile a few items in-process and pick the pool from them.
+    start = 0
+    if mode == "auto":
+        probe = list(islice(it, _PROBE_SIZE))
+        if not probe:
+            return
+        wall, cpu_time = perf_counter(), process_time()
+        results = _run_chunk(func, 0, probe, errors)
+        wall, cpu_time = perf_counter() - wall, process_time() - cpu_time
+        cpu_bound = wall > 0 and cpu_time / wall > _CPU_BOUND_RATIO
+        mode = "process" if cpu_bound and _picklable(func, probe) else "thread"
+        yield from results
+        start = len(probe)
+
+    if workers is None:
+        workers = cpu if mode == "process" else min(32, cpu + 4)
+    if chunksize is None:
+        chunksize = _default_chunksize(mode, None if n is None else n - start, workers)
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+
+    chunks = _chunks(it, chunksize)
+    first = next(chunks, None)
+    if first is None:
+        return
+
+    executor: Executor = (
+            ProcessPoolExecutor(max_workers=workers) if mode == "process"
+            else ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xpytools-parallel")
+    )
+    pending: Deque[Future] = deque()
+    try:
+        pending.append(executor.submit(_run_chunk, func, start, first, errors))
+        start += len(first)
+        for chunk in chunks:
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_run_chunk, func, start, chunk, errors))
+            start += len(chunk)
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+@overload
+def parallel(func: T) -> T: ...
+
+
+@overload
+def parallel(
+        func: None = None,
+        *,
+        mode: str = "auto",
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        errors: str = "raise",
+        ) -> Callable[[T], T]: ...
+
+
+def parallel(
+        func: Optional[T] = None,
+        *,
+        mode: str = "auto",
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        errors: str = "raise",
+        ) -> Union[T, Callable[[T], T]]:
+    """
+    Attach a ``.map(items, **overrides)`` method running `parallel_map`.
+
+    The function itself is returned unchanged (not wrapped), so it keeps its
+    signature and stays picklable for process pools. Options given here are
+    defaults; keyword arguments passed to ``.map`` override them.
+
+    Parameters
+    ----------
+    func : Callable, optional
+        Function to decorate (allows bare ``@parallel`` usage).
+    mode, workers, chunksize, max_in_flight, errors
+        See `parallel_map`.
+
+    Returns
+    -------
+    The original function with a ``map`` attribute.
+
+    Examples
+    --------
+    >>> @parallel(mode="process", errors="skip")
+    ... def score(doc): ...
+    >>> scores = list(score.map(documents))
+    >>> score(documents[0])  # still a plain call
+    """
+    defaults = dict(mode=mode, workers=workers, chunksize=chunksize,
+                    max_in_flight=max_in_flight, errors=errors)
+
+    def decorator(fn: T) -> T:
+        def map_(items: Iterable[Any], **overrides: Any) -> Iterator[Any]:
+            return parallel_map(fn, items, **{**defaults, **overrides})
+
+        fn.map = map_  # type: ignore[attr-defined]
+        return fn
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -16,14 +16,19 @@ def my_df_func(df):
 If `pandas` or `numpy` are missing:
 - The decorator returns None (default behavior)
 - Or raises an ImportError if exc_raise=True
+
+If all modules are present, the function is returned unwrapped, so gated
+functions carry no per-call overhead. Module availability is resolved once
+per process and cached.
 """
 
 from __future__ import annotations
 
 from functools import wraps
-from importlib.util import find_spec
 from typing import Callable, Any, Iterable, TypeVar, cast
 
+from .._lazy import _module_available
+
 T = TypeVar("T", bound=Callable[..., Any])
 
 
@@ -49,6 +54,7 @@ def requireModules(
     Returns
     -------
     Decorated function that gracefully bypasses or raises on missing dependencies.
+    When every module is available, the original function is returned as-is.
 
     Examples
     --------
@@ -60,24 +66,25 @@ def requireModules(
     >>> df_summary(None)  # if pandas missing -> returns None, no crash
     """
     missing: list[str] = [
-            mod for mod in modules if find_spec(mod) is None
+            mod for mod in modules if not _module_available(mod)
             ]
 
     def decorator(func: T) -> T:
+        if not missing:
+            return func
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if missing:
-                msg = (
-                        f"Missing required module(s): {', '.join(missing)} "
-                        f"for function '{func.__name__}'."
-                )
-                if exc_raise:
-                    raise ImportError(msg)
-                if return_none:
-                    return None
-                # If not returning None, fallback to no-op
-                return
-            return func(*args, **kwargs)
+            msg = (
+                    f"Missing required module(s): {', '.join(missing)} "
+                    f"for function '{func.__name__}'."
+            )
+            if exc_raise:
+                raise ImportError(msg)
+            if return_none:
+                return None
+            # If not returning None, fallback to no-op
+            return
 
         return cast(T, wrapper)
 
@@ -0,0 +1,137 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools.xdeco.singleFlight
+---------------------------
+Deduplicate concurrent identical calls (Go's ``singleflight`` pattern).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import weakref
+from concurrent.futures import Future
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar, Union, overload
+
+from ._keys import _make_key
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+
+@overload
+def singleFlight(func: T) -> T: ...
+
+
+@overload
+def singleFlight(
+        func: None = None, *, key: Optional[Callable[..., Hashable]] = None,
+        ) -> Callable[[T], T]: ...
+
+
+# noinspection PyPep8Naming
+def singleFlight(
+        func: Optional[T] = None,
+        *,
+        key: Optional[Callable[..., Hashable]] = None,
+        ) -> Union[T, Callable[[T], T]]:
+    """
+    Collapse concurrent calls with the same arguments into one execution.
+
+    While a call for a given argument key is running, further callers with
+    the same key do not start duplicate work: they wait for the running call
+    and receive its result, or have its exception raised. Once it finishes
+    the key is released, so the next call runs the function again (combine
+    with `ttlCache` to also reuse results over time).
+
+    Works for threads (regular functions) and asyncio (``async def``
+    functions; calls are shared per event loop, and cancelling one waiter
+    does not cancel the shared call).
+
+    Parameters
+    ----------
+    func : Callable, optional
+        Function to decorate (allows bare ``@singleFlight`` usage).
+    key : Callable, optional
+        ``key(*args, **kwargs) -> Hashable`` identifying "the same call".
+        Defaults to the raw arguments (unhashable ones are keyed on their
+        canonical `to_primitives` form).
+
+    Returns
+    -------
+    Decorated function.
+
+    Examples
+    --------
+    >>> @ttlCache(ttl=300)
+    ... @singleFlight
+    ... def fetch_image(url: str) -> bytes:
+    ...     return download(url)
+    >>> # 50 threads hitting an expired entry trigger one download, not 50
+    """
+
+    def decorator(fn: T) -> T:
+        key_fn = key if key is not None else (lambda *args, **kwargs: _make_key(args, kwargs))
+        if inspect.iscoroutinefunction(fn):
+            return _async_single_flight(fn, key_fn)  # type: ignore[return-value]
+        return _sync_single_flight(fn, key_fn)  # type: ignore[return-value]
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+def _sync_single_flight(fn: Callable, key_fn: Callable[..., Hashable]) -> Callable:
+    lock = threading.Lock()
+    in_flight: Dict[Hashable, Future] = {}
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        k = key_fn(*args, **kwargs)
+        with lock:
+            fut = in_flight.get(k)
+            owner = fut is None
+            if owner:
+                fut = in_flight[k] = Future()
+        if not owner:
+            return fut.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            with lock:
+                del in_flight[k]
+
+    return wrapper
+
+
+def _async_single_flight(fn: Callable, key_fn: Callable[..., Hashable]) -> Callable:
+    # Per-loop state: a task can only be awaited from its own event loop.
+    loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+    )
+
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        in_flight = loops.get(loop)
+        if in_flight is None:
+            in_flight = loops[loop] = {}
+        k = key_fn(*args, **kwargs)
+        task = in_flight.get(k)
+        if task is None:
+            task = in_flight[k] = loop.create_task(fn(*args, **kwargs))
+            task.add_done_callback(lambda _t, _k=k: in_flight.pop(_k, None))
+        return await asyncio.shield(task)
+
+    return wrapper
@@ -0,0 +1,361 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools.xdeco.timed
+--------------------
+Low-overhead call timing (`@timed`) and profiling (`@profiled`) decorators
+backed by a process-wide `MetricsRegistry`.
+
+The registry is disabled by default; decorated functions then cost a single
+attribute check per call. Enable it in code (`metrics.enable()`) or by
+setting the ``XPYTOOLS_METRICS`` environment variable to ``1``/``true``.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import inspect
+import io
+import os
+import pstats
+import threading
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Optional, TypeVar, Union, overload
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+# Bucket i counts durations d with d.bit_length() == i, i.e. 2**(i-1) <= d < 2**i ns.
+_N_BUCKETS = 64
+
+
+class _TimerStats:
+    """Aggregated timings for a single metric name."""
+
+    __slots__ = ("count", "total_ns", "max_ns", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * _N_BUCKETS
+
+    def as_dict(self) -> dict:
+        histogram = {}
+        for i, n in enumerate(self.buckets):
+            if n:
+                histogram[(1 << i) / 1e9] = n
+        return {
+                "count"    : self.count,
+                "total_s"  : self.total_ns / 1e9,
+                "mean_s"   : self.total_ns / self.count / 1e9 if self.count else 0.0,
+                "max_s"    : self.max_ns / 1e9,
+                "histogram": histogram,
+                }
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of per-name call timings.
+
+    Every recorded duration updates a call count, total and maximum, and a
+    histogram with power-of-two nanosecond buckets (≈ 1ns … 292 years in 64
+    buckets, each twice as wide as the previous one).
+
+    Parameters
+    ----------
+    enabled : bool, default=False
+        Start recording immediately.
+
+    Example
+    -------
+    ```python
+    from xpytools.xdeco import metrics
+
+    metrics.enable()
+    run_pipeline()
+    print(metrics.to_prometheus())
+    ```
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._timers: Dict[str, _TimerStats] = {}
+        self._profiles: Dict[str, pstats.Stats] = {}
+
+    def enable(self) -> None:
+        """Start recording."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording (collected data is kept)."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Drop all collected timings and profiles."""
+        with self._lock:
+            self._timers.clear()
+            self._profiles.clear()
+
+    def record(self, name: str, duration_ns: int) -> None:
+        """Record one call of `name` that took `duration_ns` nanoseconds."""
+        with self._lock:
+            st = self._timers.get(name)
+            if st is None:
+                st = self._timers[name] = _TimerStats()
+            st.count += 1
+            st.total_ns += duration_ns
+            if duration_ns > st.max_ns:
+                st.max_ns = duration_ns
+            st.buckets[min(duration_ns.bit_length(), _N_BUCKETS - 1)] += 1
+
+    def as_dict(self) -> Dict[str, dict]:
+        """
+        Snapshot of all timings.
+
+        Returns
+        -------
+        dict
+            ``name -> {"count", "total_s", "mean_s", "max_s", "histogram"}``,
+            where ``histogram`` maps each non-empty bucket's upper bound in
+            seconds to its (non-cumulative) call count.
+        """
+        with self._lock:
+            return {name: st.as_dict() for name, st in sorted(self._timers.items())}
+
+    def to_prometheus(self, metric: str = "xpytools_call_duration_seconds") -> str:
+        """
+        Render all timings in the Prometheus text exposition format.
+
+        Each name becomes a ``name`` label on one histogram metric, with
+        cumulative ``le`` buckets up to the slowest observed call.
+        """
+        lines = [
+                f"# HELP {metric} Wall-clock duration of instrumented calls.",
+                f"# TYPE {metric} histogram",
+                ]
+        with self._lock:
+            timers = sorted(self._timers.items())
+            for name, st in timers:
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                cumulative = 0
+                top = max(i for i, n in enumerate(st.buckets) if n)
+                for i in range(top + 1):
+                    cumulative += st.buckets[i]
+                    le = f"{(1 << i) / 1e9:.9g}"
+                    lines.append(f'{metric}_bucket{{name="{label}",le="{le}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{name="{label}",le="+Inf"}} {st.count}')
+                lines.append(f'{metric}_sum{{name="{label}"}} {st.total_ns / 1e9:.9g}')
+                lines.append(f'{metric}_count{{name="{label}"}} {st.count}')
+        return "\n".join(lines) + "\n"
+
+    # -----------------------------------------------------------------------
+    # Profiles (@profiled)
+    # -----------------------------------------------------------------------
+    def _add_profile(self, name: str, profile: cProfile.Profile) -> None:
+        with self._lock:
+            stats = self._profiles.get(name)
+            if stats is None:
+                self._profiles[name] = pstats.Stats(profile, stream=io.StringIO())
+            else:
+                stats.add(profile)
+
+    def profile_stats(self, name: str) -> Optional[pstats.Stats]:
+        """Aggregated `pstats.Stats` collected by `@profiled(name)`, if any."""
+        with self._lock:
+            return self._profiles.get(name)
+
+    def profile_report(self, name: str, sort: str = "cumulative", limit: int = 25) -> str:
+        """Text report (like ``python -m cProfile``) for `@profiled(name)`."""
+        with self._lock:
+            stats = self._profiles.get(name)
+            if stats is None:
+                return ""
+            out = io.StringIO()
+            stats.stream = out
+            stats.sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+
+def _env_enabled() -> bool:
+    return os.environ.get("XPYTOOLS_METRICS", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+#: Process-wide default registry used by `@timed` / `@profiled`.
+metrics = MetricsRegistry(enabled=_env_enabled())
+
+
+def _metric_name(fn: Callable) -> str:
+    return f"{fn.__module__}.{fn.__qualname__}"
+
+
+@overload
+def timed(name: T) -> T: ...
+
+
+@overload
+def timed(
+        name: Optional[str] = None, *, registry: Optional[MetricsRegistry] = None,
+        ) -> Callable[[T], T]: ...
+
+
+def timed(
+        name: Union[str, T, None] = None,
+        *,
+        registry: Optional[MetricsRegistry] = None,
+        ) -> Union[T, Callable[[T], T]]:
+    """
+    Record the wall-clock duration of every call into a `MetricsRegistry`.
+
+    While the registry is disabled the wrapper only checks one flag and calls
+    straight through. Calls that raise are recorded too. Coroutine functions
+    are timed until the awaited result is available.
+
+    Parameters
+    ----------
+    name : str, optional
+        Metric name. Defaults to ``"<module>.<qualname>"`` of the function.
+        Allows bare ``@timed`` usage.
+    registry : MetricsRegistry, optional
+        Target registry. Defaults to the process-wide `metrics`.
+
+    Returns
+    -------
+    Decorated function.
+
+    Examples
+    --------
+    >>> @timed("pipeline.load")
+    ... def load_batch(path): ...
+    >>> metrics.enable()
+    >>> load_batch("a.csv")
+    >>> metrics.as_dict()["pipeline.load"]["count"]
+    1
+    """
+    reg = registry if registry is not None else metrics
+
+    def decorator(fn: T) -> T:
+        metric = name if isinstance(name, str) else _metric_name(fn)
+
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not reg.enabled:
+                    return await fn(*args, **kwargs)
+                start = perf_counter_ns()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    reg.record(metric, perf_counter_ns() - start)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not reg.enabled:
+                return fn(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                reg.record(metric, perf_counter_ns() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    if callable(name):
+        return decorator(name)
+    return decorator
+
+
+# Only one cProfile profiler can be active per interpreter at a time.
+_profile_lock = threading.Lock()
+
+
+@overload
+def profiled(name: T) -> T: ...
+
+
+@overload
+def profiled(
+        name: Optional[str] = None, *, registry: Optional[MetricsRegistry] = None,
+        ) -> Callable[[T], T]: ...
+
+
+def profiled(
+        name: Union[str, T, None] = None,
+        *,
+        registry: Optional[MetricsRegistry] = None,
+        ) -> Union[T, Callable[[T], T]]:
+    """
+    Like `timed`, but also run each call under `cProfile` and aggregate the
+    results per name (see `MetricsRegistry.profile_report`).
+
+    Profiling is expensive; use it to investigate a slow stage, not in
+    steady-state production. Calls that start while another profiled call is
+    running (nested or on another thread) are only timed, not profiled. For
+    coroutine functions the profile spans every await, so it also includes
+    whatever else the event loop runs until the call completes.
+
+    Parameters
+    ----------
+    name : str, optional
+        Metric name. Defaults to ``"<module>.<qualname>"`` of the function.
+    registry : MetricsRegistry, optional
+        Target registry. Defaults to the process-wide `metrics`.
+
+    Returns
+    -------
+    Decorated function.
+    """
+    reg = registry if registry is not None else metrics
+
+    def decorator(fn: T) -> T:
+        metric = name if isinstance(name, str) else _metric_name(fn)
+
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not reg.enabled:
+                    return await fn(*args, **kwargs)
+                profile = cProfile.Profile() if _profile_lock.acquire(blocking=False) else None
+                start = perf_counter_ns()
+                try:
+                    if profile is None:
+                        return await fn(*args, **kwargs)
+                    profile.enable()
+                    try:
+                        return await fn(*args, **kwargs)
+                    finally:
+                        profile.disable()
+                finally:
+                    reg.record(metric, perf_counter_ns() - start)
+                    if profile is not None:
+                        _profile_lock.release()
+                        reg._add_profile(metric, profile)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not reg.enabled:
+                return fn(*args, **kwargs)
+            profile = cProfile.Profile() if _profile_lock.acquire(blocking=False) else None
+            start = perf_counter_ns()
+            try:
+                if profile is None:
+                    return fn(*args, **kwargs)
+                return profile.runcall(fn, *args, **kwargs)
+            finally:
+                reg.record(metric, perf_counter_ns() - start)
+                if profile is not None:
+                    _profile_lock.release()
+                    reg._add_profile(metric, profile)
+
+        return wrapper  # type: ignore[return-value]
+
+    if callable(name):
+        return decorator(name)
+    return decorator
@@ -0,0 +1,167 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools.xdeco.ttlCache
+-----------------------
+Memoization decorator with per-entry time-to-live, built on `TTLSet`.
+
+Usage
+-----
+@ttlCache(ttl=300, maxsize=1024)
+def fetch_user(user_id):
+    ...
+
+fetch_user(1)                 # computed
+fetch_user(1)                 # served from cache for 5 minutes
+fetch_user.bypass(1)          # computed, cache untouched
+fetch_user.invalidate(1)      # drop one entry
+fetch_user.cache_info()       # CacheInfo(hits=1, misses=1, maxsize=1024, currsize=0)
+"""
+
+from __future__ import annotations
+
+from collections import namedtuple
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional, TypeVar, Union, cast, overload
+
+from ..xtype.TTLSet import TTLSet
+from ._keys import _make_key
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+
+
+class _TTLValueStore(TTLSet):
+    """
+    `TTLSet` that also carries a value per key.
+
+    Expiry, eviction and statistics are handled entirely by `TTLSet`; values
+    live in a side dict that is pruned of keys the set has dropped whenever it
+    grows past twice `maxsize`.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        super().__init__(ttl=ttl, maxsize=maxsize, stats=True)
+        self._values: dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if self.contains(key):
+                return self._values.get(key, default)
+        return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._values[key] = value
+            self.add(key)
+            if len(self._values) > 2 * self._maxsize:
+                cache = self._cache
+                self._values = {k: v for k, v in self._values.items() if k in cache}
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._cache.pop(key, None)
+            self._values.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+            self._values.clear()
+
+
+@overload
+def ttlCache(func: T) -> T: ...
+
+
+@overload
+def ttlCache(func: None = None, *, ttl: float = 600, maxsize: int = 128) -> Callable[[T], T]: ...
+
+
+# noinspection PyPep8Naming
+def ttlCache(
+        func: Optional[T] = None,
+        *,
+        ttl: float = 600,
+        maxsize: int = 128,
+        ) -> Union[T, Callable[[T], T]]:
+    """
+    Memoize a function's results for `ttl` seconds.
+
+    Works like `functools.lru_cache`, but entries also expire after `ttl`
+    seconds and arguments do not have to be hashable: calls with dicts,
+    lists or DataFrames are keyed on a canonical `to_primitives` form of
+    their arguments. Exceptions are never cached. Thread-safe; the wrapped
+    function itself runs outside the cache lock.
+
+    Parameters
+    ----------
+    func : Callable, optional
+        Function to decorate (allows bare ``@ttlCache`` usage).
+    ttl : float, default=600
+        Seconds a cached result stays valid.
+    maxsize : int, default=128
+        Maximum number of cached results; oldest entries are evicted first.
+
+    Returns
+    -------
+    Decorated function with extra attributes:
+
+    - ``bypass(*args, **kwargs)`` → call the function without reading or writing the cache
+    - ``invalidate(*args, **kwargs)`` → drop the entry for these arguments
+    - ``cache_clear()`` → drop all entries and reset the statistics
+    - ``cache_info()`` → ``CacheInfo(hits, misses, maxsize, currsize)``; `currsize`
+      counts unexpired entries only
+
+    Examples
+    --------
+    >>> @ttlCache(ttl=60)
+    ... def lookup_rate(currency: str, opts: dict) -> float:
+    ...     return expensive_call(currency, **opts)
+    >>> lookup_rate("EUR", {"source": "ecb"})  # computed
+    >>> lookup_rate("EUR", {"source": "ecb"})  # cached, despite the dict argument
+    >>> lookup_rate.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+    """
+
+    def decorator(fn: T) -> T:
+        store = _TTLValueStore(ttl=ttl, maxsize=maxsize)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            value = store.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            value = fn(*args, **kwargs)
+            store.put(key, value)
+            return value
+
+        def bypass(*args, **kwargs):
+            return fn(*args, **kwargs)
+
+        def invalidate(*args, **kwargs) -> None:
+            store.discard(_make_key(args, kwargs))
+
+        def cache_info() -> CacheInfo:
+            store.sweep()  # currsize counts live entries only
+            st = store.stats()
+            return CacheInfo(st["hits"], st["misses"], maxsize, st["size"])
+
+        def cache_clear() -> None:
+            store.clear()
+            store.stats(reset=True)
+
+        wrapper.bypass = bypass
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cache_info
+        return cast(T, wrapper)
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -14,6 +14,9 @@ Provides internal modules re-exported via `xpytools.xtool`:
     • sql      → SQL / DataFrame bridging
     • pydantic → Pydantic extensions
 
+plus `parallel_map` (from `xpytools.xdeco.parallel`) for applying any of
+them across many items.
+
 Access pattern (public):
     from xpytools import xtool
     xtool.txt.pad("...")
@@ -22,6 +25,15 @@ Access pattern (public):
 from __future__ import annotations
 
 # Import internal modules without aliasing to avoid circular exposure
-from . import txt, df, img, sql, xpyt_pydantic
+from . import txt, df, img, sql
+from ..xdeco.parallel import parallel_map
+
+__all__: list[str] = ["txt", "df", "img", "sql", "xpyt_pydantic", "parallel_map"]
+
 
-__all__: list[str] = ["txt", "df", "img", "sql", "xpyt_pydantic"]
+def __getattr__(name: str):
+    # xpyt_pydantic needs Pydantic at class-definition time; load it on first access
+    if name == "xpyt_pydantic":
+        import importlib
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
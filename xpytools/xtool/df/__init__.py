@@ -11,8 +11,23 @@ Utilities for robust Pandas DataFrame handling.
 from __future__ import annotations
 
 from .lookup import lookup
-from .merge_fill import merge_fill
+from .lookup_index import LookupIndex, clear_lookup_cache
+from .map_unique import map_unique
+from .merge_fill import iter_merge_fill, merge_fill, merge_fill_many
 from .normalize_column_names import normalize_column_names
-from .replace_none_like import replace_none_like
+from .read_csv_clean import read_csv_clean
+from .replace_none_like import iter_replace_none_like, replace_none_like
 
-__all__: list[str] = ['lookup', 'merge_fill', 'normalize_column_names', 'replace_none_like']
+__all__: list[str] = [
+        'lookup',
+        'LookupIndex',
+        'clear_lookup_cache',
+        'map_unique',
+        'merge_fill',
+        'merge_fill_many',
+        'iter_merge_fill',
+        'normalize_column_names',
+        'read_csv_clean',
+        'replace_none_like',
+        'iter_replace_none_like',
+        ]
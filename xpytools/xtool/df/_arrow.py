@@ -0,0 +1,178 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools.xtool.df._arrow
+------------------------
+PyArrow implementations of the `xtool.df` / `xtool.sql` helpers.
+
+The public functions dispatch here when given a `pyarrow.Table` or
+`pyarrow.RecordBatch`. Work runs through `pyarrow.compute` kernels, and
+only columns whose values actually change are rebuilt: every other column
+keeps its original buffers, and an input with nothing to change is
+returned as the very same object.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Optional, Union
+
+from ..._lazy import LazyModule
+from ...xtype.xcheck.null import _NULL_LIKE
+
+if TYPE_CHECKING:
+    from pyarrow import RecordBatch as paRecordBatch
+    from pyarrow import Table as paTable
+
+    ArrowFrame = Union[paTable, paRecordBatch]
+
+pa = LazyModule("pyarrow")
+pc = LazyModule("pyarrow.compute")
+
+
+def _is_string(dtype: Any) -> bool:
+    types = pa.types
+    return types.is_string(dtype) or types.is_large_string(dtype) or types.is_string_view(dtype)
+
+
+def _is_list(dtype: Any) -> bool:
+    types = pa.types
+    return types.is_list(dtype) or types.is_large_list(dtype) or types.is_fixed_size_list(dtype)
+
+
+def _has_any(mask: Any) -> bool:
+    return bool(pc.any(mask).as_py())
+
+
+def _with_columns(frame: "ArrowFrame", changed: dict) -> "ArrowFrame":
+    """Rebuild `frame` with the columns in `changed` replaced (others zero-copy)."""
+    if not changed:
+        return frame
+    arrays, fields = [], []
+    for i, field in enumerate(frame.schema):
+        column = changed.get(i)
+        if column is None:
+            arrays.append(frame.column(i))
+            fields.append(field)
+        else:
+            arrays.append(column)
+            fields.append(field.with_type(column.type))
+    schema = pa.schema(fields, metadata=frame.schema.metadata)
+    return type(frame).from_arrays(arrays, schema=schema)
+
+
+# ---------------------------------------------------------------------------
+# normalize_column_names
+# ---------------------------------------------------------------------------
+def rename(frame: "ArrowFrame", names: List[str]) -> "ArrowFrame":
+    """Apply normalized column names (metadata-only; buffers are shared)."""
+    return frame.rename_columns(names)
+
+
+# ---------------------------------------------------------------------------
+# replace_none_like
+# ---------------------------------------------------------------------------
+def _null_like(column: Any) -> Any:
+    """Boolean mask: True where a string column holds a null-like token (see `is_none`)."""
+    tokens = pa.array(sorted(_NULL_LIKE), type=column.type)
+    lowered = pc.utf8_lower(pc.utf8_trim_whitespace(column))
+    compact = pc.replace_substring_regex(lowered, pattern=r"[ .\-]", replacement="")
+    return pc.or_(pc.is_in(lowered, value_set=tokens), pc.is_in(compact, value_set=tokens))
+
+
+def _clean_column(column: Any) -> Optional[Any]:
+    """Column with null-like values set to null, or None if nothing changes."""
+    dtype = column.type
+    if pa.types.is_dictionary(dtype) and _is_string(dtype.value_type):
+        # Scan the (small) dictionary first; decode only if a token occurs.
+        dictionaries = [chunk.dictionary for chunk in getattr(column, "chunks", [column])]
+        if not any(_has_any(_null_like(d)) for d in dictionaries):
+            return None
+        cleaned = _clean_column(column.cast(dtype.value_type))
+        return None if cleaned is None else cleaned.cast(dtype)
+    if _is_string(dtype):
+        mask = _null_like(column)
+        if not _has_any(mask):
+            return None
+        return pc.if_else(mask, pa.scalar(None, type=dtype), column)
+    if pa.types.is_floating(dtype):
+        mask = pc.is_nan(column)
+        if not _has_any(mask):
+            return None
+        return pc.if_else(mask, pa.scalar(None, type=dtype), column)
+    return None
+
+
+def replace_none_like(frame: "ArrowFrame") -> "ArrowFrame":
+    """
+    Turn null-like strings ('', 'null', 'N/A', ...) and float NaN into nulls.
+
+    Only string (plain or dictionary-encoded) and float columns can hold
+    such values. Columns without any match are passed through zero-copy.
+    """
+    changed = {}
+    for i in range(frame.num_columns):
+        cleaned = _clean_column(frame.column(i))
+        if cleaned is not None:
+            changed[i] = cleaned
+    return _with_columns(frame, changed)
+
+
+# ---------------------------------------------------------------------------
+# prepare_dataframe
+# ---------------------------------------------------------------------------
+def _pg_array(column: Any) -> Any:
+    """List column → PostgreSQL array literals ('{1,2}'), nulls preserved."""
+    items = column.cast(pa.list_(pa.string()))
+    return pc.binary_join_element_wise("{", pc.binary_join(items, ","), "}", "")
+
+
+def _temporal_str(column: Any) -> Any:
+    """
+    Dates, timestamps and times as Python's `str()` renders them: fractional
+    seconds only when non-zero, UTC offset as ``+HH:MM``.
+    """
+    dtype = column.type
+    if pa.types.is_date(dtype):
+        return column.cast(pa.string())
+    if pa.types.is_timestamp(dtype):
+        seconds = pc.floor_temporal(column, unit="second").cast(pa.timestamp("s", tz=dtype.tz))
+        text = pc.strftime(seconds, format="%Y-%m-%d %H:%M:%S")
+    else:
+        seconds = column.cast(pa.time32("s"), safe=False)
+        text = pc.strftime(seconds, format="%H:%M:%S")
+    micros = pc.add(pc.multiply(pc.millisecond(column), 1000), pc.microsecond(column))
+    fraction = pc.utf8_lpad(micros.cast(pa.string()), width=6, padding="0")
+    text = pc.if_else(pc.equal(micros, 0), text, pc.binary_join_element_wise(text, fraction, "."))
+    if pa.types.is_timestamp(dtype) and dtype.tz is not None:
+        offset = pc.replace_substring_regex(
+                pc.strftime(seconds, format="%z"), pattern=r"(\d\d)$", replacement=r":\1")
+        text = pc.binary_join_element_wise(text, offset, "")
+    return text
+
+
+def prepare_dataframe(frame: "ArrowFrame") -> "ArrowFrame":
+    """
+    PyArrow counterpart of `xtool.sql.prepare_dataframe`.
+
+    List columns become PostgreSQL array literals, date, timestamp, time and
+    decimal columns become strings (as `to_primitives` renders them), and
+    null-like values become nulls. Duration columns are kept as durations.
+    """
+    changed = {}
+    for i in range(frame.num_columns):
+        column = original = frame.column(i)
+        dtype = column.type
+        if _is_list(dtype):
+            column = _pg_array(column)
+        elif pa.types.is_date(dtype) or pa.types.is_timestamp(dtype) or pa.types.is_time(dtype):
+            column = _temporal_str(column)
+        elif pa.types.is_decimal(dtype):
+            column = column.cast(pa.string())
+        cleaned = _clean_column(column)
+        if cleaned is not None:
+            column = cleaned
+        if column is not original:
+            changed[i] = column
+    return _with_columns(frame, changed)
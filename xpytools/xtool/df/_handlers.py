@@ -1,6 +1,7 @@
 from typing import Optional
 
 from ...xtype.xcheck import is_df, is_empty
+from ...xtype.xcheck.dataframe import _is_arrow
 
 
 def _is_not_df(df, name: Optional[str] = None):
@@ -9,6 +10,9 @@ def _is_not_df(df, name: Optional[str] = None):
             raise ValueError(f"{name} is not a DataFrame")
         else:
             raise ValueError("Not a DataFrame")
+    if _is_arrow(df):
+        raise ValueError(f"{name or 'DataFrame'} is a pyarrow table, which is not supported here; "
+                         f"convert it with .to_pandas() or polars.from_arrow() first")
 
 
 def _is_empty_df(df, name: Optional[str] = None):
@@ -0,0 +1,206 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools.xtool.df._polars
+-------------------------
+Polars implementations of the `xtool.df` / `xtool.sql` helpers.
+
+The public functions dispatch here when given a `polars.DataFrame` or
+`polars.LazyFrame`. Everything is written as polars expressions, so eager
+frames run on polars' multithreaded engine and lazy frames stay lazy (the
+work becomes part of the query plan and is optimized with it).
+
+Missing values are polars nulls; float NaN is treated as missing by
+`replace_none_like`, as in the pandas implementation.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Optional, Union
+
+from ..._lazy import LazyModule
+from ...xtype.xcheck.dataframe import _is_polars
+from ...xtype.xcheck.null import _NULL_LIKE
+
+if TYPE_CHECKING:
+    from polars import DataFrame as plDataFrame
+    from polars import LazyFrame as plLazyFrame
+
+    PolarsFrame = Union[plDataFrame, plLazyFrame]
+
+pl = LazyModule("polars")
+
+# pandas merge `how` → polars join `how`
+_JOIN_HOW = {"left": "left", "right": "right", "outer": "full", "inner": "inner"}
+_SUFFIX = "_right"
+
+
+def _is_lazy(df: Any) -> bool:
+    return pl.loaded and isinstance(df, pl.LazyFrame)
+
+
+def _columns(df: "PolarsFrame") -> List[str]:
+    return df.collect_schema().names() if _is_lazy(df) else df.columns
+
+
+def _require_polars(df: Any, name: str) -> None:
+    if not _is_polars(df):
+        raise ValueError(
+                f"{name} must be a polars DataFrame/LazyFrame to merge with a polars frame")
+
+
+# ---------------------------------------------------------------------------
+# lookup
+# ---------------------------------------------------------------------------
+def lookup(
+        df: "PolarsFrame",
+        filter_col: str,
+        filter_val: Any,
+        target_col: str,
+        index: int = 0,
+        ) -> Optional[Any]:
+    """Value of `target_col` in the `index`-th row where `filter_col == filter_val`."""
+    if filter_val is None:  # null never compares equal, like `df[col] == None` in pandas
+        return None
+    matches = df.lazy().filter(pl.col(filter_col) == filter_val).select(target_col)
+    if index >= 0:
+        values = matches.slice(index, 1).collect().to_series()
+        if not values.is_empty():
+            return values[0]
+        if matches.select(pl.len()).collect().item() == 0:
+            return None
+        raise IndexError(
+                f"index {index} is out of bounds for the rows matching "
+                f"{filter_col} == {filter_val!r}")
+    values = matches.collect().to_series()
+    if values.is_empty():
+        return None
+    return values[index]
+
+
+# ---------------------------------------------------------------------------
+# merge_fill
+# ---------------------------------------------------------------------------
+def merge_fill(
+        left: "PolarsFrame",
+        right: "PolarsFrame",
+        keys: List[str],
+        how: str,
+        prefer_right: bool,
+        fill_only_if_none: bool,
+        ) -> "PolarsFrame":
+    """Join `right` onto `left` and fill overlapping columns in one projection."""
+    _require_polars(left, "Left")
+    _require_polars(right, "Right")
+    lazy = _is_lazy(left) or _is_lazy(right)
+    if lazy:
+        left, right = left.lazy(), right.lazy()
+
+    left_cols = _columns(left)
+    right_cols = _columns(right)
+    overlap = [c for c in right_cols if c not in keys and c in left_cols]
+    new = [c for c in right_cols if c not in keys and c not in left_cols]
+
+    joined = left.join(right, on=keys, how=_JOIN_HOW[how], suffix=_SUFFIX, coalesce=True)
+
+    exprs = []
+    for col in left_cols:
+        if col not in overlap or not prefer_right:
+            exprs.append(pl.col(col))
+        elif fill_only_if_none:
+            exprs.append(pl.coalesce(col, f"{col}{_SUFFIX}").alias(col))
+        else:
+            exprs.append(pl.col(f"{col}{_SUFFIX}").alias(col))
+    exprs.extend(pl.col(c) for c in new)
+    return joined.select(exprs)
+
+
+# ---------------------------------------------------------------------------
+# normalize_column_names
+# ---------------------------------------------------------------------------
+def rename(df: "PolarsFrame", names: List[str], inplace: bool) -> "PolarsFrame":
+    """Apply normalized column names (in place for eager frames when asked)."""
+    if _is_lazy(df):
+        return df.rename(dict(zip(_columns(df), names)))
+    target = df if inplace else df.clone()
+    target.columns = names
+    return target
+
+
+# ---------------------------------------------------------------------------
+# replace_none_like
+# ---------------------------------------------------------------------------
+def _null_like(col: "pl.Expr") -> "pl.Expr":
+    """True where a string column holds a null-like token (see `is_none`)."""
+    tokens = sorted(_NULL_LIKE)
+    lowered = col.str.strip_chars().str.to_lowercase()
+    compact = lowered.str.replace_all(r"[ .\-]", "")
+    return lowered.is_in(tokens) | compact.is_in(tokens)
+
+
+def replace_none_like(df: "PolarsFrame") -> "PolarsFrame":
+    """
+    Turn null-like strings ('', 'null', 'N/A', ...) and float NaN into nulls.
+
+    Only string, categorical and float columns can hold such values; other
+    columns are passed through untouched.
+    """
+    schema = df.collect_schema()
+    exprs = []
+    for name, dtype in schema.items():
+        col = pl.col(name)
+        if dtype == pl.String:
+            exprs.append(pl.when(_null_like(col)).then(None).otherwise(col).alias(name))
+        elif isinstance(dtype, (pl.Categorical, pl.Enum)):
+            text = col.cast(pl.String)
+            exprs.append(pl.when(_null_like(text)).then(None).otherwise(text).alias(name))
+        elif dtype.is_float():
+            exprs.append(col.fill_nan(None))
+    return df.with_columns(exprs) if exprs else df
+
+
+# ---------------------------------------------------------------------------
+# prepare_dataframe
+# ---------------------------------------------------------------------------
+def _temporal_str(col: "pl.Expr", dtype: Any) -> "pl.Expr":
+    """
+    Dates, datetimes and times as Python's `str()` renders them: fractional
+    seconds only when non-zero, UTC offset as ``+HH:MM``.
+    """
+    if dtype == pl.Date:
+        return col.cast(pl.String)
+    text = col.dt.strftime("%H:%M:%S" if dtype == pl.Time else "%Y-%m-%d %H:%M:%S")
+    micros = col.dt.microsecond()
+    text = pl.when(micros == 0).then(text).otherwise(
+            pl.concat_str(text, pl.lit("."), micros.cast(pl.String).str.zfill(6)))
+    if isinstance(dtype, pl.Datetime) and dtype.time_zone is not None:
+        text = pl.concat_str(text, col.dt.strftime("%:z"))
+    return text
+
+
+def prepare_dataframe(df: "PolarsFrame") -> "PolarsFrame":
+    """
+    Polars counterpart of `xtool.sql.prepare_dataframe`.
+
+    List/array columns become PostgreSQL array literals, date, datetime,
+    time and decimal columns become strings (as `to_primitives` renders
+    them), and null-like values become nulls. Duration columns are kept
+    as durations.
+    """
+    schema = df.collect_schema()
+    exprs = []
+    for name, dtype in schema.items():
+        col = pl.col(name)
+        if isinstance(dtype, (pl.List, pl.Array)):
+            items = (col.arr.to_list() if isinstance(dtype, pl.Array) else col).list.eval(
+                    pl.element().cast(pl.String))
+            exprs.append(pl.concat_str(pl.lit("{"), items.list.join(","), pl.lit("}")).alias(name))
+        elif dtype.is_temporal() and not isinstance(dtype, pl.Duration):
+            exprs.append(_temporal_str(col, dtype).alias(name))
+        elif isinstance(dtype, pl.Decimal):
+            exprs.append(col.cast(pl.String))
+    if exprs:
+        df = df.with_columns(exprs)
+    return replace_none_like(df)
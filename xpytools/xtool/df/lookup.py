@@ -23,10 +23,14 @@ from typing_extensions import TYPE_CHECKING
 if TYPE_CHECKING:
     from pandas import DataFrame as pdDataFrame
 
-from ...xdeco import requireModules
+from ...xdeco import requireModules, timed
+from ...xtype.xcheck.dataframe import _is_polars
+from . import _polars
 from ._handlers import _check_df
+from .lookup_index import _cached_index
 
 
+@timed("xtool.df.lookup")
 @requireModules(["pandas"], exc_raise=True)
 def lookup(
         df: "pdDataFrame",
@@ -34,18 +38,36 @@ def lookup(
         filter_val: Any,
         target_col: str,
         index: int = 0,
-        safe: bool = False
+        safe: bool = False,
+        cached: bool = False,
         ) -> Optional[Any]:
     """
     Safely get a value from a DataFrame filtered by condition.
 
+    Each call scans the whole `filter_col`. For many lookups against the same
+    frame pass ``cached=True``: a hash index (`LookupIndex`) is built on the
+    first call and reused while the frame is unchanged. It is rebuilt
+    automatically when rows or columns are added/removed or the filter column
+    is replaced; after editing filter-column cells in place, call
+    `clear_lookup_cache(df)`.
+
+    Polars DataFrames and LazyFrames are filtered natively (`cached` does
+    not apply to them).
+
     Example
     -------
     >>> lookup(df, "user_id", 123, "email")
     'user@example.com'
+    >>> for uid in user_ids:                        # O(1) per lookup
+    ...     lookup(df, "user_id", uid, "email", cached=True)
     """
     try:
         _check_df(df)
+        if _is_polars(df):
+            return _polars.lookup(df, filter_col, filter_val, target_col, index)
+        if cached:
+            pos = _cached_index(df, filter_col).position(filter_val, index)
+            return None if pos is None else df[target_col].iat[pos]
         subset = df.loc[df[filter_col] == filter_val, target_col]
         if subset.empty:
             return None
@@ -0,0 +1,276 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools.xtool.df.lookup_index
+------------------------------
+Hash index over one or more key columns for repeated DataFrame lookups.
+
+`lookup()` scans the whole frame for every call; `LookupIndex` hashes the key
+column(s) once, after which each lookup is O(1) and batches of keys are
+resolved in one vectorized `get_indexer` call.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from ..._lazy import LazyModule
+from ._handlers import _check_df
+
+if TYPE_CHECKING:
+    from pandas import DataFrame as pdDataFrame
+    from pandas import Series as pdSeries
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+KeyCols = Union[str, Sequence[str]]
+
+
+class LookupIndex:
+    """
+    Hash index from key column(s) to row positions of a DataFrame.
+
+    Building the index costs one pass over the key column(s); afterwards
+    `get` is a hash lookup and `get_many` resolves any number of keys in a
+    single vectorized call, instead of one full-column comparison per lookup.
+
+    The index references (does not copy) the frame. It reflects the frame
+    as it was when built: rebuild it after modifying the key column(s).
+
+    Parameters
+    ----------
+    df : DataFrame
+        Frame to index.
+    key_col : str | list[str]
+        Key column, or several columns for a composite key (keys are then
+        tuples in column order).
+
+    Examples
+    --------
+    >>> users = LookupIndex(users_df, "user_id")
+    >>> users.get(123, "email")
+    'user@example.com'
+    >>> users.get_many([1, 2, 999], "email").tolist()
+    ['a@x.com', 'b@x.com', nan]
+    >>> LookupIndex(df, ["country", "year"]).get(("NL", 2024), "gdp")
+    """
+
+    def __init__(self, df: "pdDataFrame", key_col: KeyCols):
+        _check_df(df)
+        self._df = df
+        self._single = isinstance(key_col, str)
+        self._key_cols: List[str] = [key_col] if self._single else list(key_col)
+        if self._single:
+            keys = pd.Index(df[key_col])
+        else:
+            keys = pd.MultiIndex.from_frame(df[self._key_cols])
+
+        # Unique keys → position of their first row (lookups return the first match)
+        duplicated = keys.duplicated(keep="first")
+        if duplicated.any():
+            self._unique = keys[~duplicated]
+            self._first: Optional[Any] = np.flatnonzero(~duplicated)
+        else:
+            self._unique = keys
+            self._first = None
+        self._groups: Optional[Dict[Hashable, Any]] = None
+        self._columns: Dict[str, "pdSeries"] = {}
+
+    # -----------------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------------
+    @property
+    def key_cols(self) -> List[str]:
+        """Indexed column name(s)."""
+        return list(self._key_cols)
+
+    def __len__(self) -> int:
+        """Number of distinct keys."""
+        return len(self._unique)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.position(key) is not None
+
+    def position(self, key: Any, n: int = 0) -> Optional[int]:
+        """
+        Row position of the `n`-th row matching `key` (negative `n` counts
+        from the last match), or None if no row matches.
+
+        Raises
+        ------
+        IndexError
+            If the key matches fewer than ``n + 1`` rows.
+        """
+        if _is_missing(key):  # None/NaN never compare equal, matching `df[col] == key`
+            return None
+        if n == 0:
+            try:
+                loc = self._unique.get_loc(key)
+            except (KeyError, TypeError, pd.errors.InvalidIndexError):
+                return None
+            return int(loc if self._first is None else self._first[loc])
+        positions = self._group_positions().get(key)
+        if positions is None:
+            return None
+        return int(positions[n])
+
+    def get(self, key: Any, target_col: str, n: int = 0, default: Any = None) -> Any:
+        """
+        Value of `target_col` in the `n`-th row matching `key`.
+
+        Parameters
+        ----------
+        key : Any
+            Key value (a tuple for composite keys).
+        target_col : str
+            Column to read.
+        n : int, default=0
+            Which match to return when the key occurs more than once.
+        default : Any, default=None
+            Returned when the key (or its `n`-th match) does not exist.
+        """
+        try:
+            pos = self.position(key, n)
+        except IndexError:
+            return default
+        if pos is None:
+            return default
+        return self._column(target_col).iat[pos]
+
+    def get_many(
+            self,
+            keys: Any,
+            target_col: Union[str, Sequence[str]],
+            ) -> Union["pdSeries", "pdDataFrame"]:
+        """
+        Vectorized lookup of many keys at once (first match per key).
+
+        Parameters
+        ----------
+        keys : list-like | Series | DataFrame
+            Keys to resolve. For composite keys: a list of tuples, or a
+            DataFrame holding the key columns.
+        target_col : str | list[str]
+            Column(s) to read.
+
+        Returns
+        -------
+        Series | DataFrame
+            One row per key, in input order (positional index). Keys without
+            a match yield missing values (NaN / None, upcasting as pandas does).
+        """
+        positions = self.positions(keys)
+        frame = self._df[[target_col] if isinstance(target_col, str) else list(target_col)]
+        result = frame.set_axis(pd.RangeIndex(len(frame)), axis=0).reindex(positions)
+        result.index = pd.RangeIndex(len(positions))
+        return result[target_col] if isinstance(target_col, str) else result
+
+    def positions(self, keys: Any) -> Any:
+        """Row positions of the first match for each key (-1 where no row matches)."""
+        if self._single:
+            wanted = pd.Index(keys)
+        elif isinstance(keys, pd.DataFrame):
+            wanted = pd.MultiIndex.from_frame(keys[self._key_cols])
+        else:
+            wanted = pd.MultiIndex.from_tuples(list(keys), names=self._key_cols)
+        loc = self._unique.get_indexer(wanted)
+        if self._first is not None:
+            loc = np.where(loc >= 0, self._first[loc], -1)
+        if self._single and wanted.hasnans:
+            loc = np.where(wanted.isna(), -1, loc)
+        return loc
+
+    # -----------------------------------------------------------------------
+    # Internal helpers
+    # -----------------------------------------------------------------------
+    def _column(self, name: str) -> "pdSeries":
+        col = self._columns.get(name)
+        if col is None:
+            col = self._columns[name] = self._df[name]
+        return col
+
+    def _group_positions(self) -> Dict[Hashable, Any]:
+        """Key → positions of all matching rows (built on first nth-match lookup)."""
+        if self._groups is None:
+            by = self._key_cols[0] if self._single else self._key_cols
+            self._groups = self._df.groupby(by, sort=False, dropna=True).indices
+        return self._groups
+
+
+def _is_missing(key: Any) -> bool:
+    if key is None:
+        return True
+    try:
+        return bool(key != key)
+    except (TypeError, ValueError):
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Cached indexes for lookup(..., cached=True)
+# ---------------------------------------------------------------------------
+# id(df) -> (weakref to df, {key_cols: (signature, LookupIndex)})
+_CACHE: Dict[int, Tuple["weakref.ref", Dict[Tuple[str, ...], Tuple[tuple, LookupIndex]]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _buffer_id(series: "pdSeries") -> int:
+    """Identity of a column's backing data (changes when the column is replaced or reallocated)."""
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy(copy=False).__array_interface__["data"][0]
+    return id(series.array)
+
+
+def _signature(df: "pdDataFrame", key_cols: Tuple[str, ...]) -> tuple:
+    return (df.shape, id(df.columns), tuple(_buffer_id(df[c]) for c in key_cols))
+
+
+def _cached_index(df: "pdDataFrame", key_col: KeyCols) -> LookupIndex:
+    """
+    Return a `LookupIndex` for `df`/`key_col`, reusing the previous one while
+    the frame's shape, columns and key-column buffers are unchanged.
+    """
+    cols = (key_col,) if isinstance(key_col, str) else tuple(key_col)
+    sig = _signature(df, cols)
+    with _CACHE_LOCK:
+        entry = _CACHE.get(id(df))
+        if entry is not None and entry[0]() is df:
+            hit = entry[1].get(cols)
+            if hit is not None and hit[0] == sig:
+                return hit[1]
+
+    index = LookupIndex(df, key_col)
+    with _CACHE_LOCK:
+        entry = _CACHE.get(id(df))
+        if entry is None or entry[0]() is not df:
+            key = id(df)
+            ref = weakref.ref(df, lambda _r, _k=key: _drop_entry(_k, _r))
+            entry = _CACHE[key] = (ref, {})
+        entry[1][cols] = (sig, index)
+    return index
+
+
+def _drop_entry(key: int, ref: "weakref.ref") -> None:
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+        if entry is not None and entry[0] is ref:
+            del _CACHE[key]
+
+
+def clear_lookup_cache(df: Optional["pdDataFrame"] = None) -> None:
+    """
+    Drop cached lookup indexes, for one frame or all frames.
+
+    Needed only after editing key-column cells in place (e.g.
+    ``df.loc[i, "user_id"] = ...``), which the cache cannot detect.
+    """
+    with _CACHE_LOCK:
+        if df is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(id(df), None)
@@ -1,20 +1,32 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Sequence, Union
 
-from ._handlers import _check_df
+from ..._lazy import LazyModule
 from ...xtype.choice import strChoice
+from ...xtype.xcheck.dataframe import _is_polars
+from . import _polars
+from ._handlers import _check_df, _is_not_df
 
 if TYPE_CHECKING:
     from pandas import DataFrame as pdDataFrame
-from ...xdeco import requireModules
+    from pandas import Index as pdIndex
+from ...xdeco import requireModules, timed
 
+pd = LazyModule("pandas")
 
+_mergetype = strChoice('left', 'right', 'outer', 'inner')
+_streamtype = strChoice('left', 'inner')
+
+_SUFFIX = "_right"
+
+
+@timed("xtool.df.merge_fill")
 @requireModules(["pandas"], exc_raise=True)
 def merge_fill(
         left: "pdDataFrame",
         right: "pdDataFrame",
-        on: str,
+        on: Union[str, Sequence[str]],
         how: str = "left",
         prefer_right: bool = True,
         fill_only_if_none: bool = True,
@@ -24,13 +36,14 @@ def merge_fill(
 
     This performs a normal merge, but instead of generating
     `col_x` and `col_y`, values from `right` fill in `None` cells
-    in `left` (if `fill_only_if_none=True`).
+    in `left` (if `fill_only_if_none=True`). All overlapping columns are
+    filled in one vectorized pass and the helper columns dropped at once.
 
     Parameters
     ----------
     left, right : DataFrame
-    on : str
-        Column to merge on.
+    on : str | list[str]
+        Column(s) to merge on.
     how : str
         Merge type ('left', 'inner', 'outer', etc.)
     prefer_right : bool
@@ -41,29 +54,259 @@ def merge_fill(
     Returns
     -------
     DataFrame | None
-    """
-    _mergetype = strChoice('left', 'right', 'outer', 'inner')
 
+    Notes
+    -----
+    Polars inputs (both frames) are joined natively and filled with
+    `coalesce`; if either is a LazyFrame the result is a LazyFrame. Row
+    order of ``outer``/``right`` joins follows polars.
+    """
     _check_df(left, 'Left')
 
     _check_df(right, 'Right')
 
-    try:
-        import pandas as pd
-        how = _mergetype(how)
-        merged = pd.merge(left, right, on=on, how=how, suffixes=("", "_right"))
-        for col in right.columns:
-            if col == on or f"{col}_right" not in merged.columns:
-                continue
+    if _is_polars(left) or _is_polars(right):
+        return _polars.merge_fill(
+                left, right, _keys(on), _mergetype(how), prefer_right, fill_only_if_none)
+    return _merge_fill(left, right, _keys(on), _mergetype(how), prefer_right, fill_only_if_none)
 
-            if prefer_right:
-                if fill_only_if_none:
-                    merged[col] = merged[col].combine_first(merged[f"{col}_right"])
-                else:
-                    merged[col] = merged[f"{col}_right"]
 
-            merged.drop(columns=[f"{col}_right"], inplace=True, errors="ignore")
+@timed("xtool.df.merge_fill_many")
+@requireModules(["pandas"], exc_raise=True)
+def merge_fill_many(
+        left: "pdDataFrame",
+        rights: Sequence["pdDataFrame"],
+        on: Union[str, Sequence[str]],
+        how: str = "left",
+        prefer_right: bool = True,
+        fill_only_if_none: bool = True,
+        ) -> Optional["pdDataFrame"]:
+    """
+    Enrich `left` from several right frames, as if chaining `merge_fill`.
+
+    ``merge_fill_many(left, [a, b], on="id")`` returns the same frame as
+    ``merge_fill(merge_fill(left, a, on="id"), b, on="id")``: earlier sources
+    fill missing values first, later ones fill what is still missing (or, with
+    ``fill_only_if_none=False``, the last source wins).
+
+    For the common enrichment case (``how="left"``, unique keys in every
+    right frame, matching key dtypes) no intermediate merges are built: each
+    source is hash-aligned to the left rows once and all columns are filled
+    in a single pass. Other cases fall back to chained merges.
+
+    Parameters
+    ----------
+    left : DataFrame
+    rights : list[DataFrame]
+        Enrichment sources, in priority order.
+    on : str | list[str]
+        Column(s) to merge on (present in every frame).
+    how, prefer_right, fill_only_if_none
+        As in `merge_fill`.
 
+    Returns
+    -------
+    DataFrame | None
+    """
+    _check_df(left, 'Left')
+    for i, right in enumerate(rights):
+        _check_df(right, f'Right[{i}]')
+
+    keys = _keys(on)
+    how = _mergetype(how)
+    if _is_polars(left):
+        merged = left
+        for right in rights:
+            merged = _polars.merge_fill(merged, right, keys, how, prefer_right, fill_only_if_none)
         return merged
-    except Exception:
-        raise
+    if how == "left" and all(_RightIndex.usable(left, right, keys) for right in rights):
+        merged = left.reset_index(drop=True)
+        for right in rights:
+            incoming = _RightIndex(right, keys).align(merged)
+            _fill_from(merged, incoming, prefer_right, fill_only_if_none)
+        return merged
+
+    merged = left
+    for right in rights:
+        merged = _merge_fill(merged, right, keys, how, prefer_right, fill_only_if_none)
+    return merged
+
+
+@requireModules(["pandas"], exc_raise=True)
+def iter_merge_fill(
+        left_chunks: Iterable["pdDataFrame"],
+        right: "pdDataFrame",
+        on: Union[str, Sequence[str]],
+        how: str = "left",
+        prefer_right: bool = True,
+        fill_only_if_none: bool = True,
+        ) -> Iterator["pdDataFrame"]:
+    """
+    Streaming `merge_fill` for left tables that do not fit in memory.
+
+    The right frame (e.g. a dimension table) is hash-indexed once; every left
+    chunk is then aligned against that index and yielded before the next one
+    is read, so peak memory is set by the chunk size, not the input size.
+
+    Parameters
+    ----------
+    left_chunks : Iterable[DataFrame]
+        Left-hand chunks, e.g. ``pd.read_csv(path, chunksize=100_000)`` or
+        ``(rg.to_pandas() for rg in parquet_row_groups)``.
+    right : DataFrame
+        Right-hand frame, held in memory.
+    on : str | list[str]
+        Column(s) to merge on.
+    how : {"left", "inner"}, default="left"
+        Join type. Only joins that can be decided chunk by chunk are supported.
+    prefer_right, fill_only_if_none
+        As in `merge_fill`.
+
+    Yields
+    ------
+    DataFrame
+        One merged chunk per input chunk. Rows keep the index of their input
+        chunk (``inner`` drops unmatched rows).
+
+    Notes
+    -----
+    Right frames with duplicate keys (which multiply left rows) are merged
+    per chunk with `pandas.merge`: the right side is then re-hashed for
+    every chunk and output chunks get a fresh ``RangeIndex``.
+
+    Example
+    -------
+    >>> chunks = pd.read_csv("events.csv", chunksize=200_000)
+    >>> for part in iter_merge_fill(chunks, users, on="user_id"):
+    ...     part.to_parquet(out_dir / f"part-{part.index[0]}.parquet")
+    """
+    _check_df(right, 'Right')
+    keys = _keys(on)
+    how = _streamtype(how)
+    if _is_polars(right):
+        for chunk in left_chunks:
+            _is_not_df(chunk, 'Left chunk')
+            yield _polars.merge_fill(chunk, right, keys, how, prefer_right, fill_only_if_none)
+        return
+    index = None if right.duplicated(subset=keys).any() else _RightIndex(right, keys)
+
+    for chunk in left_chunks:
+        _is_not_df(chunk, 'Left chunk')
+        if index is None or any(chunk[k].dtype != right[k].dtype for k in keys):
+            merged = _merge_fill(chunk, right, keys, how, prefer_right, fill_only_if_none)
+            if how == "left" and index is not None:  # unique right keys: one row per left row
+                merged.index = chunk.index
+            yield merged
+            continue
+
+        positions = index.positions(chunk)
+        if how == "inner":
+            matched = positions >= 0
+            out = chunk[matched]
+            positions = positions[matched]
+        else:
+            out = chunk.copy()
+        # Fill by position: chunk labels may repeat, which label alignment rejects.
+        labels = out.index
+        out.index = pd.RangeIndex(len(out))
+        _fill_from(out, index.take(positions, out.index), prefer_right, fill_only_if_none)
+        out.index = labels
+        yield out
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+def _keys(on: Union[str, Sequence[str]]) -> List[str]:
+    return [on] if isinstance(on, str) else list(on)
+
+
+def _merge_fill(
+        left: "pdDataFrame",
+        right: "pdDataFrame",
+        keys: List[str],
+        how: str,
+        prefer_right: bool,
+        fill_only_if_none: bool,
+        ) -> "pdDataFrame":
+    merged = pd.merge(left, right, on=keys, how=how, suffixes=("", _SUFFIX))
+    overlap = [c for c in right.columns if c not in keys and f"{c}{_SUFFIX}" in merged.columns]
+    if overlap:
+        helpers = [f"{c}{_SUFFIX}" for c in overlap]
+        if prefer_right:
+            incoming = merged[helpers].set_axis(overlap, axis=1)
+            _fill_from(merged, incoming, prefer_right, fill_only_if_none, overlap)
+        merged.drop(columns=helpers, inplace=True)
+    return merged
+
+
+def _fill_from(
+        target: "pdDataFrame",
+        incoming: "pdDataFrame",
+        prefer_right: bool,
+        fill_only_if_none: bool,
+        overlap: Optional[List[str]] = None,
+        ) -> None:
+    """
+    Merge the columns of `incoming` (same index as `target`) into `target`
+    in place: overlapping columns are filled/overwritten, new ones added.
+    """
+    if overlap is None:
+        overlap = [c for c in incoming.columns if c in target.columns]
+        new = [c for c in incoming.columns if c not in target.columns]
+        if new:
+            target[new] = incoming[new]
+    if not overlap or not prefer_right:
+        return
+    if not fill_only_if_none:
+        target[overlap] = incoming[overlap]
+        return
+
+    # Same-dtype columns: one block-wise `where`. Mixed dtypes keep
+    # Series.combine_first's upcasting rules, column by column.
+    same = [c for c in overlap if target[c].dtype == incoming[c].dtype]
+    if same:
+        block = target[same]
+        target[same] = block.where(block.notna(), incoming[same])
+    for col in overlap:
+        if target[col].dtype != incoming[col].dtype:
+            target[col] = target[col].combine_first(incoming[col])
+
+
+class _RightIndex:
+    """
+    A right frame indexed once by its join keys, used to align any number of
+    left frames (or left chunks) against it without re-merging.
+    """
+
+    def __init__(self, right: "pdDataFrame", keys: List[str]):
+        self.keys = keys
+        self.frame = right.set_index(keys[0] if len(keys) == 1 else keys)
+        self._rows: Optional["pdDataFrame"] = None
+
+    @staticmethod
+    def usable(left: "pdDataFrame", right: "pdDataFrame", keys: List[str]) -> bool:
+        """True if a left join can use hash alignment (unique right keys, same key dtypes)."""
+        if any(left[k].dtype != right[k].dtype for k in keys):
+            return False
+        return not right.duplicated(subset=keys).any()
+
+    def positions(self, left: "pdDataFrame") -> Any:
+        """Right-hand row position for every row of `left` (-1 where unmatched)."""
+        if len(self.keys) == 1:
+            wanted = pd.Index(left[self.keys[0]])
+        else:
+            wanted = pd.MultiIndex.from_frame(left[self.keys])
+        return self.frame.index.get_indexer(wanted)
+
+    def take(self, positions: Any, index: "pdIndex") -> "pdDataFrame":
+        """Right-hand rows at `positions` (-1 → missing values), labelled with `index`."""
+        if self._rows is None:
+            self._rows = self.frame.set_axis(pd.RangeIndex(len(self.frame)), axis=0)
+        values = self._rows.reindex(positions)
+        values.index = index
+        return values
+
+    def align(self, left: "pdDataFrame") -> "pdDataFrame":
+        """Right-hand values for every row of `left` (missing where unmatched), on left's index."""
+        return self.take(self.positions(left), left.index)
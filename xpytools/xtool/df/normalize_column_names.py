@@ -1,13 +1,17 @@
 import re
-from typing import Optional, TYPE_CHECKING
+from functools import lru_cache
+from typing import Optional, Tuple, TYPE_CHECKING
 
+from . import _arrow, _polars
 from ...xtype.xcheck import is_df
+from ...xtype.xcheck.dataframe import _is_arrow, _is_polars
 
 if TYPE_CHECKING:
     from pandas import DataFrame as pdDataFrame
-from ...xdeco import requireModules
+from ...xdeco import requireModules, timed
 
 
+@timed("xtool.df.normalize_column_names")
 @requireModules(["pandas"], exc_raise=True)
 def normalize_column_names(df: "pdDataFrame", inplace: bool = True) -> Optional["pdDataFrame"]:
     """
@@ -21,6 +25,15 @@ def normalize_column_names(df: "pdDataFrame", inplace: bool = True) -> Optional[
     - Ensure unique column names (adds numeric suffixes if needed)
     - Converts `:` and `.` to `_` (except trailing digits)
 
+    Normalized names are cached per schema (the tuple of original column
+    names), so repeated frames with the same columns are renamed without
+    re-running the rules.
+
+    Polars DataFrames are renamed in place too (unless ``inplace=False``);
+    LazyFrames are immutable, so a renamed LazyFrame is returned.
+    pyarrow Tables/RecordBatches are immutable too: a renamed table sharing
+    the original buffers is returned.
+
     Parameters
     ----------
     df : Any
@@ -42,53 +55,78 @@ def normalize_column_names(df: "pdDataFrame", inplace: bool = True) -> Optional[
     >>> list(df.columns)
     ['user_id', 'email_address', 'score_1', 'score_1_1']
     """
-    try:
-        import pandas as pd
-    except ImportError:
-        return None
-
     if not is_df(df):
         return None
 
+    if _is_polars(df):
+        names = _normalize_columns(tuple(_polars._columns(df)))
+        return _polars.rename(df, list(names), inplace)
+
+    if _is_arrow(df):
+        return _arrow.rename(df, list(_normalize_columns(tuple(df.schema.names))))
+
     target_df = df if inplace else df.copy()
+    target_df.columns = list(_normalize_columns(tuple(map(str, target_df.columns))))
+    return target_df
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+_END_DIGITS_RE = re.compile(r'\.(\d+)$')
+_SEPARATORS_RE = re.compile(r'[ /\\\-]+')
+_BRACKETS_RE = re.compile(r'[(){}\[\]]+')
+_INVALID_RE = re.compile(r'[^0-9a-zA-Z_]+')
+
+
+@lru_cache(maxsize=512)
+def _normalize_columns(columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Normalized, de-duplicated names for one schema.
 
-    original_cols = list(target_df.columns)
+    Cached on the full column tuple: files sharing a schema are normalized once.
+    """
     cleaned_cols: list[str] = []
     seen: set[str] = set()
+    next_suffix: dict[str, int] = {}
+
+    for col in columns:
+        base = _normalize_name(col)
 
-    for col in original_cols:
-        if not isinstance(col, str):
-            col = str(col)
-
-        new_col = col.lower()
-
-        # Preserve ".digits" suffix
-        match = re.search(r'\.(\d+)$', new_col)
-        end_digits = match.group(0) if match else ""
-        if end_digits:
-            new_col = new_col[:-len(end_digits)]
-
-        # Replace and clean
-        new_col = new_col.replace(':', '_')
-        new_col = new_col.replace('.', '_')
-        new_col = re.sub(r'[ /\\\-]+', '_', new_col)
-        new_col = re.sub(r'[(){}\[\]]+', '', new_col)
-        new_col = re.sub(r'[^0-9a-zA-Z_]+', '', new_col)
-        new_col = new_col.strip('_')
-
-        # Re-add numeric suffix if it existed
-        if end_digits:
-            new_col = f"{new_col}_{end_digits.strip('.')}"
-
-        # Ensure uniqueness
-        base = new_col
-        suffix = 1
+        # Ensure uniqueness. Candidates rejected for a base stay taken, so
+        # each base resumes from its last suffix instead of counting from 1.
+        suffix = next_suffix.get(base, 0)
+        new_col = f"{base}_{suffix}" if suffix else base
         while new_col in seen:
-            new_col = f"{base}_{suffix}"
             suffix += 1
+            new_col = f"{base}_{suffix}"
+        next_suffix[base] = suffix + 1
 
         seen.add(new_col)
         cleaned_cols.append(new_col)
 
-    target_df.columns = cleaned_cols
-    return target_df
+    return tuple(cleaned_cols)
+
+
+@lru_cache(maxsize=16384)
+def _normalize_name(col: str) -> str:
+    new_col = col.lower()
+
+    # Preserve ".digits" suffix
+    match = _END_DIGITS_RE.search(new_col)
+    end_digits = match.group(0) if match else ""
+    if end_digits:
+        new_col = new_col[:-len(end_digits)]
+
+    # Replace and clean
+    new_col = new_col.replace(':', '_')
+    new_col = new_col.replace('.', '_')
+    new_col = _SEPARATORS_RE.sub('_', new_col)
+    new_col = _BRACKETS_RE.sub('', new_col)
+    new_col = _INVALID_RE.sub('', new_col)
+    new_col = new_col.strip('_')
+
+    # Re-add numeric suffix if it existed
+    if end_digits:
+        new_col = f"{new_col}_{end_digits.strip('.')}"
+    return new_col
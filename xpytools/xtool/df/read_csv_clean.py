@@ -0,0 +1,139 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+"""
+xpytools.xtool.df.read_csv_clean
+--------------------------------
+CSV reader that recognises null-like tokens while parsing.
+
+`pd.read_csv` followed by `replace_none_like` makes a second, per-cell Python
+pass over the whole frame. Handing the same token vocabulary to the C parser
+(`na_values`) makes null detection part of parsing instead, and lets numeric
+columns containing "N/A" & co. come out numeric straight away.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import lru_cache
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, FrozenSet, Iterable, Iterator, Optional, Union
+
+from ..._lazy import LazyModule
+from ...xdeco import metrics, requireModules, timed
+from ...xtype.xcheck.null import _NULL_LIKE
+from .normalize_column_names import normalize_column_names
+
+if TYPE_CHECKING:
+    from pandas import DataFrame as pdDataFrame
+
+pd = LazyModule("pandas")
+
+_CHUNK_METRIC = "xtool.df.read_csv_clean.chunk"
+
+
+@lru_cache(maxsize=1)
+def _null_tokens() -> FrozenSet[str]:
+    """The `is_none` vocabulary in lower, upper, title and capitalized case."""
+    tokens = set()
+    for token in _NULL_LIKE:
+        tokens.update((token, token.upper(), token.title(), token.capitalize()))
+    return frozenset(tokens)
+
+
+@requireModules(["pandas"], exc_raise=True)
+def read_csv_clean(
+        filepath_or_buffer: Any,
+        *,
+        normalize_columns: bool = False,
+        na_values: Optional[Union[str, Iterable[str]]] = None,
+        keep_default_na: bool = False,
+        chunksize: Optional[int] = None,
+        **kwargs: Any,
+        ) -> Union["pdDataFrame", Iterator["pdDataFrame"]]:
+    """
+    Read a CSV with null-like tokens ('null', 'N/A', 'missing', ...) parsed as
+    missing values by pandas' C parser, instead of a `replace_none_like` pass
+    afterwards.
+
+    Parameters
+    ----------
+    filepath_or_buffer : str | path | file-like
+        Passed to `pandas.read_csv`.
+    normalize_columns : bool, default=False
+        Apply `normalize_column_names` to the header (data is not touched).
+    na_values : str | list[str], optional
+        Extra tokens to treat as missing, on top of the `is_none` vocabulary
+        ('', 'null', 'none', 'nan', 'n/a', 'missing', ...) in lower, upper,
+        title and capitalized case. They apply to every column; pandas'
+        per-column dict form is not supported, since with it pandas applies
+        tokens only to the listed columns.
+    keep_default_na : bool, default=False
+        Also keep pandas' own default NA strings ('#N/A', '-NaN', '1.#IND', ...).
+        Off by default so exactly the `is_none` vocabulary applies.
+    chunksize : int, optional
+        Read in chunks of this many rows and return an iterator of DataFrames.
+    **kwargs
+        Any other `pandas.read_csv` argument.
+
+    Returns
+    -------
+    DataFrame | Iterator[DataFrame]
+        Missing cells are NaN (as with `read_csv`); use
+        ``replace_none_like(df, force=True)`` if literal None is needed.
+
+    Raises
+    ------
+    TypeError
+        If `na_values` is a dict.
+
+    Notes
+    -----
+    Tokens are matched exactly, so padded values (' null') are only caught
+    with ``skipinitialspace=True`` or a later `replace_none_like` pass.
+
+    Whole-file reads are timed as ``xtool.df.read_csv_clean``; chunked reads
+    record one ``xtool.df.read_csv_clean.chunk`` sample per chunk consumed.
+
+    Examples
+    --------
+    >>> df = read_csv_clean("export.csv", normalize_columns=True)
+    >>> for chunk in read_csv_clean("big.csv", chunksize=500_000):
+    ...     ...
+    """
+    if isinstance(na_values, Mapping):
+        raise TypeError(
+                "read_csv_clean does not support per-column na_values; "
+                "pass a str or list of tokens")
+    tokens = set(_null_tokens())
+    if na_values is not None:
+        tokens.update([na_values] if isinstance(na_values, str) else na_values)
+
+    kwargs.update(na_values=sorted(tokens), keep_default_na=keep_default_na)
+    if chunksize is None and not kwargs.get("iterator", False):
+        return _read_frame(filepath_or_buffer, normalize_columns, **kwargs)
+    reader = pd.read_csv(filepath_or_buffer, chunksize=chunksize, **kwargs)
+    return _timed_chunks(reader, normalize_columns)
+
+
+@timed("xtool.df.read_csv_clean")
+def _read_frame(filepath_or_buffer: Any, normalize_columns: bool, **kwargs: Any) -> "pdDataFrame":
+    df = pd.read_csv(filepath_or_buffer, **kwargs)
+    return normalize_column_names(df) if normalize_columns else df
+
+
+def _timed_chunks(reader: Any, normalize_columns: bool) -> Iterator["pdDataFrame"]:
+    """Yield the reader's chunks, timing each read (and normalization) into `metrics`."""
+    with reader:
+        while True:
+            start = perf_counter_ns() if metrics.enabled else None
+            try:
+                chunk = next(reader)
+            except StopIteration:
+                return
+            if normalize_columns:
+                chunk = normalize_column_names(chunk)
+            if start is not None:
+                metrics.record(_CHUNK_METRIC, perf_counter_ns() - start)
+            yield chunk
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
+from ..._lazy import LazyModule
 from ...xtype.xcast import as_none
 from ...xtype.xcheck import is_df, is_empty
+from ...xtype.xcheck.dataframe import _is_arrow, _is_polars
+from . import _arrow, _polars
+from .map_unique import map_unique
 
 if TYPE_CHECKING:
     from pandas import DataFrame as pdDataFrame
-from ...xdeco import requireModules
+    from pandas import Series as pdSeries
+from ...xdeco import requireModules, timed
 
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
 
+
+@timed("xtool.df.replace_none_like")
 @requireModules(["pandas"], exc_raise=True)
 def replace_none_like(
         df: "pdDataFrame",
@@ -32,8 +41,27 @@ def replace_none_like(
     -------
     DataFrame | None
         Cleaned DataFrame or None if not a valid DataFrame.
+
+    Notes
+    -----
+    Polars DataFrames/LazyFrames are cleaned with native expressions (string,
+    categorical and float columns only; other dtypes cannot hold such values).
+    Polars stores missing values as null, which already exports as None, so
+    `force` has no further effect there. LazyFrames are returned lazy.
+
+    pyarrow Tables/RecordBatches are cleaned with `pyarrow.compute` kernels.
+    Only columns containing null-like values are rebuilt; all others share
+    the input's buffers, and an input without any is returned unchanged.
     """
-    import pandas as pd
+    if _is_polars(df):
+        if is_empty(df):
+            raise ValueError("Invalid DataFrame")
+        return _polars.replace_none_like(df)
+
+    if _is_arrow(df):
+        if is_empty(df):
+            raise ValueError("Invalid DataFrame")
+        return _arrow.replace_none_like(df)
 
     if force:
         df = df.astype(object)
@@ -41,16 +69,85 @@ def replace_none_like(
     if not is_df(df) or is_empty(df):
         raise ValueError("Invalid DataFrame")
 
-    # first pass – textual / exotic normalization
-    cleaned = df.map(as_none)
+    # first pass – textual / exotic normalization (once per distinct value)
+    cleaned = map_unique(df, as_none)
     cleaned = cleaned.replace(pd.NA, None)
 
     if force:
         # this is the correct modern idiom
-        try:
-            import numpy as np
-            cleaned = cleaned.replace(np.nan, None)
-        except ImportError:
-            cleaned = cleaned.reaplce(float('nan'), None)
+        cleaned = cleaned.replace(np.nan if np else float('nan'), None)
 
     return cleaned
+
+
+def iter_replace_none_like(chunks: Iterable[Any], force: bool = False) -> Iterator[Any]:
+    """
+    Chunked `replace_none_like`: clean an iterable of DataFrames one at a time.
+
+    Peak memory is set by the chunk size instead of the full frame (plus
+    `replace_none_like`'s intermediate copies). Every chunk must have the
+    columns of the first one.
+
+    Output dtypes are fixed by the first chunk, so chunks concatenate and
+    serialize consistently. A later column is cast to that dtype when the
+    cast is lossless (e.g. int → float, or an all-null column). Otherwise it
+    is returned as object with None, e.g. when nulls appear in a column that
+    was integer in the first chunk. Empty chunks are passed through.
+
+    Parameters
+    ----------
+    chunks : Iterable[DataFrame]
+        pandas, polars or pyarrow frames.
+    force : bool, default=False
+        See `replace_none_like`.
+
+    Yields
+    ------
+    DataFrame
+        One cleaned chunk per input chunk.
+
+    Example
+    -------
+    >>> chunks = pd.read_csv("export.csv", chunksize=500_000, dtype=str)
+    >>> for chunk in iter_replace_none_like(chunks):
+    ...     chunk.to_parquet(...)
+    """
+    columns = dtypes = None
+    for n, chunk in enumerate(chunks):
+        if not is_df(chunk):
+            raise ValueError(f"Chunk {n} is not a DataFrame")
+        if is_empty(chunk):
+            yield chunk
+            continue
+        cleaned = replace_none_like(chunk, force=force)
+        if _is_polars(chunk) or _is_arrow(chunk):
+            yield cleaned
+            continue
+
+        if columns is None:
+            columns, dtypes = cleaned.columns, list(cleaned.dtypes)
+        elif not cleaned.columns.equals(columns):
+            raise ValueError(f"Chunk {n} columns {list(cleaned.columns)} differ from "
+                             f"the first chunk's {list(columns)}")
+        else:
+            for i, dtype in enumerate(dtypes):
+                col = cleaned.iloc[:, i]
+                if col.dtype != dtype:
+                    cleaned.isetitem(i, _as_dtype(col, dtype))
+        yield cleaned
+
+
+def _as_dtype(col: "pdSeries", dtype: Any) -> "pdSeries":
+    """`col` cast to `dtype` if lossless, else as object with None for missing values."""
+    if not pd.api.types.is_object_dtype(dtype):
+        lossless = col.isna().all() or (
+                isinstance(col.dtype, np.dtype) and isinstance(dtype, np.dtype)
+                and np.can_cast(col.dtype, dtype, casting="safe")
+        )
+        if lossless:
+            try:
+                return col.astype(dtype)
+            except (TypeError, ValueError):
+                pass
+    return col.astype(object).where(col.notna(), None)
+
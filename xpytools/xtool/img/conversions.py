@@ -4,9 +4,10 @@ import base64
 from io import BytesIO
 
 from .load import Image, _load_from_base64
-from ...xdeco import requireModules
+from ...xdeco import requireModules, timed
 
 
+@timed("xtool.img.to_bytes")
 @requireModules(["PIL"], exc_raise=True)
 def to_bytes(img: "Image.Image", format: str = "PNG") -> bytes:
     buf = BytesIO()
@@ -14,16 +15,19 @@ def to_bytes(img: "Image.Image", format: str = "PNG") -> bytes:
     return buf.getvalue()
 
 
+@timed("xtool.img.from_bytes")
 @requireModules(["PIL"], exc_raise=True)
 def from_bytes(data: bytes) -> "Image.Image":
     return Image.open(BytesIO(data))
 
 
+@timed("xtool.img.from_base64")
 @requireModules(["PIL"], exc_raise=True)
 def from_base64(b64_str: str) -> "Image.Image":
     return from_bytes(_load_from_base64(b64_str))
 
 
+@timed("xtool.img.to_base64")
 @requireModules(["PIL"], exc_raise=True)
 def to_base64(img: "Image.Image", format: str = "PNG") -> str:
     return base64.b64encode(to_bytes(img, format)).decode("utf-8")
@@ -18,18 +18,12 @@ import base64
 from pathlib import Path
 from typing import Union, Literal
 
-from ...xdeco import requireModules
+from ..._lazy import LazyModule
+from ...xdeco import requireModules, timed
 from ...xtype.xcheck import is_base64
 
-try:
-    import requests
-except ImportError:
-    requests = None
-
-try:
-    from PIL import Image
-except ImportError:
-    Image = None
+requests = LazyModule("requests")
+Image = LazyModule("PIL.Image")
 
 
 # ---------------------------------------------------------------------------
@@ -59,6 +53,7 @@ def _load_from_base64(data: str) -> bytes:
     return base64.b64decode(data)
 
 
+@timed("xtool.img.load")
 @requireModules(["PIL"], exc_raise=False)
 def load(
         src: Union[str, Path, bytes],
@@ -3,16 +3,13 @@ from __future__ import annotations
 from io import BytesIO
 from typing import Optional
 
-from ...xdeco import requireModules
+from ..._lazy import LazyModule
+from ...xdeco import requireModules, timed
 
-try:
-    from PIL import Image
-    from PIL.Image import Resampling
-except ImportError:
-    Image = None
-    Resampling = None
+Image = LazyModule("PIL.Image")
 
 
+@timed("xtool.img.create_thumbnail")
 @requireModules(['PIL'], exc_raise=True)
 def create_thumbnail(
         image_data: bytes,
@@ -30,12 +27,13 @@ def create_thumbnail(
     if image.mode != "RGB":
         image = image.convert("RGB")
 
-    image.thumbnail(size, Resampling.LANCZOS)
+    image.thumbnail(size, Image.Resampling.LANCZOS)
     buffer = BytesIO()
     image.save(buffer, format=format)
     return buffer.getvalue()
 
 
+@timed("xtool.img.resize")
 @requireModules(['PIL'], exc_raise=True)
 def resize(
         image_data: bytes,
@@ -54,9 +52,9 @@ def resize(
         img = img.convert("RGB")
 
     if keep_aspect:
-        img.thumbnail(size, Resampling.LANCZOS)
+        img.thumbnail(size, Image.Resampling.LANCZOS)
     else:
-        img = img.resize(size, Resampling.LANCZOS)
+        img = img.resize(size, Image.Resampling.LANCZOS)
 
     buf = BytesIO()
     fmt = format or img.format or "PNG"
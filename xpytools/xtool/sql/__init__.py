@@ -10,7 +10,7 @@ SQL-related utility functions.
 
 from __future__ import annotations
 
-from .prepare_dataframe import prepare_dataframe
+from .prepare_dataframe import iter_prepare_dataframe, prepare_dataframe
 from .to_pg_array import to_pg_array
 
-__all__: list[str] = ['prepare_dataframe', 'to_pg_array']
+__all__: list[str] = ['prepare_dataframe', 'iter_prepare_dataframe', 'to_pg_array']
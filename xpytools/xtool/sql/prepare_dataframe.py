@@ -1,18 +1,24 @@
 from __future__ import annotations, annotations
 
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, List, Optional, Set, TYPE_CHECKING
 
 from .to_pg_array import to_pg_array
 from ..df.replace_none_like import replace_none_like
+from ..._lazy import LazyModule
+from ...xdeco import timed
 from ...xtype.xcast import to_primitives
+from ..df import _arrow, _polars
+from ..df.map_unique import map_unique
 from ...xtype.xcheck import is_df
+from ...xtype.xcheck.dataframe import _is_arrow, _is_polars
 
-try:
+if TYPE_CHECKING:
     import pandas as pd
-except ImportError:  # pragma: no cover
-    pd = None  # type: ignore
 
+np = LazyModule("numpy")
 
+
+@timed("xtool.sql.prepare_dataframe")
 def prepare_dataframe(df: Any) -> Optional["pd.DataFrame"]:
     """
     Clean a DataFrame for safe SQL export or insertion.
@@ -22,9 +28,14 @@ def prepare_dataframe(df: Any) -> Optional["pd.DataFrame"]:
     - Replaces NaN / NA / None-like values with None.
     - Returns a sanitized copy of the DataFrame.
 
+    Polars DataFrames/LazyFrames are prepared with native expressions and
+    returned as the same kind of frame (lazy stays lazy). pyarrow
+    Tables/RecordBatches are prepared with `pyarrow.compute` kernels; columns
+    that need no change keep their buffers (no copy).
+
     Parameters
     ----------
-    df : pandas.DataFrame | Any
+    df : pandas.DataFrame | polars.DataFrame | polars.LazyFrame | pyarrow.Table | Any
         Input DataFrame-like object. Non-DataFrame values are returned unchanged.
 
     Returns
@@ -45,15 +56,102 @@ def prepare_dataframe(df: Any) -> Optional["pd.DataFrame"]:
     if not is_df(df):
         return None
 
+    if _is_polars(df):
+        return _polars.prepare_dataframe(df)
+
+    if _is_arrow(df):
+        return _arrow.prepare_dataframe(df)
+
+    return _prepare(df, [i for i in _object_positions(df) if _has_arrays(df.iloc[:, i])])
+
+
+def iter_prepare_dataframe(chunks: Iterable[Any]) -> Iterator[Any]:
+    """
+    Chunked `prepare_dataframe`: clean an iterable of DataFrames one at a time.
+
+    Peak memory is set by the chunk size, so exports far larger than memory
+    can be prepared (e.g. ``pd.read_csv(path, chunksize=...)``). Every chunk
+    must have the columns of the first one.
+
+    Object columns are scanned for arrays in every chunk; once a column has
+    held arrays it is converted to PostgreSQL array literals in all later
+    chunks too, so it stays one kind of column. All other cleaning is
+    identical to `prepare_dataframe`.
+
+    Parameters
+    ----------
+    chunks : Iterable[DataFrame]
+        pandas, polars or pyarrow frames.
+
+    Yields
+    ------
+    DataFrame
+        One prepared chunk per input chunk.
+
+    Example
+    -------
+    >>> for chunk in iter_prepare_dataframe(pd.read_csv("export.csv", chunksize=500_000)):
+    ...     chunk.to_sql("events", engine, if_exists="append", index=False)
+    """
+    columns = None
+    arrays: Set[int] = set()
+    for n, chunk in enumerate(chunks):
+        if not is_df(chunk):
+            raise ValueError(f"Chunk {n} is not a DataFrame")
+        if _is_polars(chunk) or _is_arrow(chunk):
+            yield prepare_dataframe(chunk)
+            continue
+
+        if columns is None:
+            columns = chunk.columns
+        elif not chunk.columns.equals(columns):
+            raise ValueError(f"Chunk {n} columns {list(chunk.columns)} differ from "
+                             f"the first chunk's {list(columns)}")
+
+        # A column may first receive arrays in a later chunk; never let raw lists through.
+        arrays.update(i for i in _object_positions(chunk)
+                      if i not in arrays and _has_arrays(chunk.iloc[:, i]))
+        yield _prepare(chunk, sorted(arrays))
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+def _object_positions(df: "pd.DataFrame") -> List[int]:
+    """Positions of object-dtype columns (the only ones that can hold arrays)."""
+    return [i for i, dtype in enumerate(df.dtypes)
+            if isinstance(dtype, np.dtype) and dtype.kind == "O"]
+
+
+def _has_arrays(col: "pd.Series") -> bool:
+    return any(isinstance(v, (list, tuple, set)) for v in col.array)
+
+
+def _converts(dtype: Any) -> bool:
+    """False for plain numpy numeric/bool dtypes, for which `to_primitives` is a no-op per cell."""
+    return not (isinstance(dtype, np.dtype) and dtype.kind in "iufb")
+
+
+def _prepare(df: "pd.DataFrame", arrays: List[int]) -> "pd.DataFrame":
+    """
+    `prepare_dataframe` for a pandas frame whose array columns (positions)
+    are known: only those are mapped through `to_pg_array`, and plain
+    numeric columns skip the per-cell `to_primitives` pass.
+    """
     df = df.copy()
 
     # Normalize to PostgreSQL array literals where applicable
-    df = df.map(to_pg_array)
+    if arrays:
+        literals = map_unique(df.iloc[:, arrays], to_pg_array)
+        for j, i in enumerate(arrays):
+            df.isetitem(i, literals.iloc[:, j])
 
     # Convert nested types, NaNs, dataclasses, Enums, etc. into primitives
-    df = df.map(to_primitives)
+    convert = [i for i, dtype in enumerate(df.dtypes) if _converts(dtype)]
+    if convert:
+        primitives = map_unique(df.iloc[:, convert], to_primitives)
+        for j, i in enumerate(convert):
+            df.isetitem(i, primitives.iloc[:, j])
 
     # Ensure all NA values are None (for psycopg/sqlalchemy compatibility)
-    df = replace_none_like(df, force=True)
-
-    return df
+    return replace_none_like(df, force=True)
@@ -6,6 +6,10 @@
 xpytools.xtool.txt
 -------------------
 Text-processing utilities.
+
+`clean`, `pad`, `strip_ascii`, `strip_html` and `truncate` also accept a
+pandas Series: it is processed element-wise, calling the helper once per
+distinct value (see `xtool.df.map_unique`).
 """
 
 from __future__ import annotations
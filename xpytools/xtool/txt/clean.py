@@ -5,9 +5,15 @@ from typing import Any
 
 import unicodedata
 
-from ...xdeco import requireModules
+from ..._lazy import LazyModule
+from ...xdeco import requireModules, timed
+from ..df.map_unique import map_unique
 
+cleantext = LazyModule("cleantext")
+pd = LazyModule("pandas")
 
+
+@timed("xtool.txt.clean")
 @requireModules(["cleantext"], exc_raise=False)
 def clean(text: Any, *, lowercase: bool = False) -> str | None:
     """
@@ -19,22 +25,27 @@ def clean(text: Any, *, lowercase: bool = False) -> str | None:
     Parameters
     ----------
     text : Any
-        Input txt (converted to str).
+        Input txt (converted to str), or a pandas Series.
     lowercase : bool, default=False
         Whether to lowercase output.
 
     Returns
     -------
     str | None
-        Cleaned string, or None if txt is empty/None.
+        Cleaned string, or None if txt is empty/None (a Series for Series input).
     """
+    if pd.loaded and isinstance(text, pd.Series):
+        return map_unique(text, _clean, lowercase=lowercase)
+    return _clean(text, lowercase)
+
+
+def _clean(text: Any, lowercase: bool) -> str | None:
     if text is None:
         return None
     text = str(text)
 
     try:
-        from cleantext import clean  # noqa
-        return clean(
+        return cleantext.clean(
                 text,
                 fix_unicode=True,
                 to_ascii=False,
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from ..._lazy import LazyModule
+from ..df.map_unique import map_unique
+
+pd = LazyModule("pandas")
+
 
 def pad(
         text: str,
@@ -14,7 +19,7 @@ def pad(
     Parameters
     ----------
     text : str
-        Input string to pad.
+        Input string to pad, or a pandas Series.
     width : int, default=20
         Desired total width of the output.
     align : {"left", "right", "center"}, default="left"
@@ -29,6 +34,8 @@ def pad(
     str
         Padded (and possibly truncated) string.
     """
+    if pd.loaded and isinstance(text, pd.Series):
+        return map_unique(text, pad, width=width, align=align, fillchar=fillchar, truncate=truncate)
     if not isinstance(text, str):
         text = str(text or "")
 
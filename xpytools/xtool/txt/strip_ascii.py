@@ -2,6 +2,11 @@ from __future__ import annotations
 
 import re
 
+from ..._lazy import LazyModule
+from ..df.map_unique import map_unique
+
+pd = LazyModule("pandas")
+
 
 def strip_ascii(text: str, keep_basic_symbols: bool = True) -> str:
     """
@@ -10,7 +15,7 @@ def strip_ascii(text: str, keep_basic_symbols: bool = True) -> str:
     Parameters
     ----------
     text : str
-        Input string.
+        Input string, or a pandas Series.
     keep_basic_symbols : bool, default=True
         If False, removes everything outside [A-Za-z0-9 ].
 
@@ -19,6 +24,8 @@ def strip_ascii(text: str, keep_basic_symbols: bool = True) -> str:
     str
         ASCII-only txt.
     """
+    if pd.loaded and isinstance(text, pd.Series):
+        return map_unique(text, strip_ascii, keep_basic_symbols=keep_basic_symbols)
     if not isinstance(text, str):
         return str(text or "")
     if keep_basic_symbols:
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 import re
 
+from ..._lazy import LazyModule
+from ..df.map_unique import map_unique
+
+pd = LazyModule("pandas")
+
 _TAG_RE = re.compile(r"<[^>]+>")
 
 
@@ -12,12 +17,15 @@ def strip_html(text: str) -> str:
     Parameters
     ----------
     text : str
+        Input string, or a pandas Series.
 
     Returns
     -------
     str
         Text with all HTML tags removed.
     """
+    if pd.loaded and isinstance(text, pd.Series):
+        return map_unique(text, strip_html)
     if not text:
         return ""
     # Remove tags
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from ..._lazy import LazyModule
+from ..df.map_unique import map_unique
+
+pd = LazyModule("pandas")
+
 
 def truncate(text: str, limit: int = 120, suffix: str = "…") -> str:
     """
@@ -8,7 +13,7 @@ def truncate(text: str, limit: int = 120, suffix: str = "…") -> str:
     Parameters
     ----------
     text : str
-        Input string.
+        Input string, or a pandas Series.
     limit : int, default=120
         Maximum length before truncation.
     suffix : str, default="…"
@@ -19,6 +24,8 @@ def truncate(text: str, limit: int = 120, suffix: str = "…") -> str:
     str
         Possibly truncated string.
     """
+    if pd.loaded and isinstance(text, pd.Series):
+        return map_unique(text, truncate, limit=limit, suffix=suffix)
     if text is None:
         return ""
     text = str(text)
@@ -44,12 +44,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-try:
-    from pydantic import BaseModel, model_validator
-except ImportError:
-    BaseModel = None
-    model_validator = None
-
+from ..._lazy import LazyModule
 from ...xtype.xcast import (
     as_str,
     as_datetime_str,
@@ -57,6 +52,12 @@ from ...xtype.xcast import (
 from ...xtype.xcast.to_primitives import to_primitives
 from ...xtype.xcheck import is_none, is_list_like, is_dict
 
+pydantic = LazyModule("pydantic")
+
+# The validator hook must exist at class-definition time; without Pydantic the
+# mixin still imports (as a plain class) instead of breaking the whole package.
+model_validator = pydantic.model_validator if pydantic else (lambda **_: (lambda fn: fn))
+
 
 class TypeSafeAccessMixin:
     """
@@ -140,7 +141,7 @@ class TypeSafeAccessMixin:
                 return None
 
             # Pydantic model
-            if isinstance(value, BaseModel):
+            if pydantic.loaded and isinstance(value, pydantic.BaseModel):
                 return value.model_dump()
 
             # Enum
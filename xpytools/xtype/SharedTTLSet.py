@@ -0,0 +1,267 @@
+#  Copyright (c) 2025.
+#  Author: Willem van der Schans.
+#  Licensed under the MIT License (https://opensource.org/license/mit).
+
+from __future__ import annotations
+
+import multiprocessing
+import struct
+from hashlib import blake2b
+from multiprocessing import shared_memory
+from time import monotonic
+from typing import Any, Optional, Union
+
+# Segment layout:
+#   header : magic, version, slot count, ttl (padded to 32 bytes)
+#   slots  : [expiry float64 | key digest 16 bytes] * slot count
+_MAGIC = b"XSTS"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIQd8x")
+_SLOT = struct.Struct("<d16s")
+_EMPTY = bytes(16)
+_MAX_PROBE = 32
+
+
+class SharedTTLSet:
+    """
+    Cross-process TTL set backed by `multiprocessing.shared_memory`.
+
+    All processes attached to the same segment see one shared set, so a key
+    added by one gunicorn worker or pool process is visible to every other
+    one on the host. It mirrors the `TTLSet` API (`add`, `in`, `clear`).
+
+    Keys are stored as 128-bit BLAKE2b digests in a fixed-size open-addressing
+    table of `maxsize` slots. Lookups probe at most 32 neighbouring slots;
+    when all of them hold live keys, the one closest to expiry is evicted.
+    All slot access happens under a process-shared `multiprocessing.Lock`.
+
+    Parameters
+    ----------
+    ttl : float, default=600
+        Time-to-live in seconds for each entry.
+    maxsize : int, default=4096
+        Number of slots in the table. Keep it comfortably above the expected
+        number of live keys (≈2x) to keep probe chains short.
+    name : str, optional
+        Shared-memory segment name. Generated when omitted.
+    create : bool, default=True
+        Create a new segment. With ``False``, attach to the existing segment
+        `name` (ttl and maxsize are then read from the segment).
+    lock : multiprocessing.Lock, optional
+        Lock guarding the table. Created automatically with a new segment;
+        when attaching, pass the creator's lock (inherited through fork, or
+        passed as a `Process`/`Pool` argument).
+
+    Example
+    -------
+    ```python
+    from multiprocessing import Pool
+    from xpytools.xtype import SharedTTLSet
+
+    seen = SharedTTLSet(ttl=300, maxsize=100_000)
+
+    def handle(job_id):
+        if not seen.add(job_id):
+            return  # another worker already took it
+        ...
+
+    with Pool(8) as pool:
+        pool.map(handle, job_ids)
+    seen.unlink()
+    ```
+
+    Notes
+    -----
+    - Expiries use `time.monotonic`, which is host-wide on Linux, macOS and
+      Windows, so all processes on one machine agree on them.
+    - `add` returns True only for the caller that actually inserted the key,
+      which makes it usable as an atomic "claim" across processes.
+    - Instances pickle by segment name, so they can be handed to child processes.
+    """
+
+    def __init__(
+            self,
+            ttl: float = 600,
+            maxsize: int = 4096,
+            *,
+            name: Optional[str] = None,
+            create: bool = True,
+            lock: Optional[Any] = None,
+            ):
+        if create:
+            if maxsize < 1:
+                raise ValueError(f"maxsize must be positive, got {maxsize!r}")
+            size = _HEADER.size + maxsize * _SLOT.size
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self._shm.buf[:size] = bytes(size)
+            _HEADER.pack_into(self._shm.buf, 0, _MAGIC, _VERSION, maxsize, float(ttl))
+            self._lock = lock if lock is not None else multiprocessing.Lock()
+        else:
+            if name is None:
+                raise ValueError("name is required when attaching to an existing SharedTTLSet")
+            if lock is None:
+                raise ValueError("lock is required when attaching to an existing SharedTTLSet")
+            self._shm = shared_memory.SharedMemory(name=name, create=False)
+            self._lock = lock
+
+        magic, version, slots, stored_ttl = _HEADER.unpack_from(self._shm.buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._shm.close()
+            raise ValueError(f"Shared memory segment {self._shm.name!r} is not a SharedTTLSet")
+
+        self._owner = create
+        self._slots = slots
+        self._ttl = stored_ttl
+        self._probe = min(_MAX_PROBE, slots)
+
+    # -----------------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------------
+    @property
+    def name(self) -> str:
+        """Name of the underlying shared-memory segment."""
+        return self._shm.name
+
+    def add(self, key: Union[str, bytes]) -> bool:
+        """
+        Add a key to the set, resetting its expiration timestamp.
+
+        Parameters
+        ----------
+        key : str | bytes
+            The key to store.
+
+        Returns
+        -------
+        bool
+            True if the key was not present (or had expired) and this call
+            inserted it; False if it was already live and only refreshed.
+        """
+        digest = self._digest(key)
+        now = monotonic()
+        buf = self._shm.buf
+        with self._lock:
+            slot, expire, free, oldest = self._probe_locked(buf, digest, now)
+            if slot is not None:
+                _SLOT.pack_into(buf, self._offset(slot), now + self._ttl, digest)
+                return expire <= now
+            target = free if free is not None else oldest
+            _SLOT.pack_into(buf, self._offset(target), now + self._ttl, digest)
+            return True
+
+    def __contains__(self, key: Union[str, bytes]) -> bool:
+        """
+        Check if a key exists and is still valid (not expired).
+
+        Parameters
+        ----------
+        key : str | bytes
+            The key to check.
+
+        Returns
+        -------
+        bool
+            True if key exists and is unexpired, False otherwise.
+        """
+        digest = self._digest(key)
+        now = monotonic()
+        with self._lock:
+            slot, expire, _, _ = self._probe_locked(self._shm.buf, digest, now)
+        return slot is not None and expire > now
+
+    def discard(self, key: Union[str, bytes]) -> None:
+        """Remove a key if present (the slot is left as a reusable tombstone)."""
+        digest = self._digest(key)
+        buf = self._shm.buf
+        with self._lock:
+            slot, _, _, _ = self._probe_locked(buf, digest, monotonic())
+            if slot is not None:
+                _SLOT.pack_into(buf, self._offset(slot), 0.0, digest)
+
+    def clear(self) -> None:
+        """Remove all entries from the set immediately."""
+        with self._lock:
+            self._shm.buf[_HEADER.size:_HEADER.size + self._slots * _SLOT.size] = (
+                    bytes(self._slots * _SLOT.size)
+            )
+
+    def __len__(self) -> int:
+        """Number of live (unexpired) keys. Scans the whole table."""
+        now = monotonic()
+        buf = self._shm.buf
+        with self._lock:
+            return sum(
+                    1 for expire, _ in _SLOT.iter_unpack(
+                            buf[_HEADER.size:_HEADER.size + self._slots * _SLOT.size]
+                            )
+                    if expire > now
+                    )
+
+    def close(self) -> None:
+        """Detach this process from the segment (other processes are unaffected)."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Detach and destroy the segment. Call once, from the creating process."""
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedTTLSet":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def __getstate__(self) -> dict:
+        return {"name": self._shm.name, "lock": self._lock}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(name=state["name"], create=False, lock=state["lock"])
+
+    def __repr__(self) -> str:
+        return f"SharedTTLSet(name={self._shm.name!r}, ttl={self._ttl}, maxsize={self._slots})"
+
+    # -----------------------------------------------------------------------
+    # Internal helpers
+    # -----------------------------------------------------------------------
+    @staticmethod
+    def _digest(key: Union[str, bytes]) -> bytes:
+        if isinstance(key, str):
+            key = key.encode("utf-8", "surrogatepass")
+        digest = blake2b(key, digest_size=16).digest()
+        return digest if digest != _EMPTY else b"\x01" + digest[1:]
+
+    @staticmethod
+    def _offset(slot: int) -> int:
+        return _HEADER.size + slot * _SLOT.size
+
+    def _probe_locked(
+            self, buf: memoryview, digest: bytes, now: float
+            ) -> tuple[Optional[int], float, Optional[int], int]:
+        """
+        Walk the probe window of `digest` (assumes lock already held).
+
+        Returns ``(slot, expiry, free, oldest)``: the slot holding `digest` (or
+        None) and its expiry, the first empty/expired slot, and the slot with
+        the earliest expiry in the window (eviction candidate).
+        """
+        slots = self._slots
+        home = int.from_bytes(digest[:8], "little") % slots
+        free: Optional[int] = None
+        oldest, oldest_expire = home, float("inf")
+        for i in range(self._probe):
+            slot = (home + i) % slots
+            expire, stored = _SLOT.unpack_from(buf, _HEADER.size + slot * _SLOT.size)
+            if stored == digest:
+                return slot, expire, free, oldest
+            if stored == _EMPTY:
+                return None, 0.0, slot if free is None else free, oldest
+            if expire <= now:
+                if free is None:
+                    free = slot
+            elif expire < oldest_expire:
+                oldest, oldest_expire = slot, expire
+        return None, 0.0, free, oldest
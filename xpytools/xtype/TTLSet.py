@@ -4,10 +4,32 @@
 
 from __future__ import annotations
 
+import atexit
+import logging
+import mmap
+import os
+import struct
+import sys
 import threading
+import weakref
+from array import array
 from collections import OrderedDict
-from time import monotonic
-from typing import Optional
+from itertools import accumulate, islice
+from operator import itemgetter
+from pathlib import Path
+from time import monotonic, perf_counter
+from typing import Callable, Optional, Union
+
+_log = logging.getLogger(__name__)
+
+# Snapshot layout (see `TTLSet.dump`):
+#   header  : magic, version, byteorder flag, entry count, total key chars
+#   block 1 : float64[count]  remaining TTL per entry (seconds)
+#   block 2 : uint32[count]   key length per entry (characters)
+#   block 3 : utf-8 blob      all keys concatenated
+_SNAPSHOT_MAGIC = b"XTTL"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<4sBB2xQQ")
 
 
 class TTLSet:
@@ -29,6 +51,25 @@ class TTLSet:
         Maximum number of cached entries before oldest entries are evicted.
     sweep_interval : int, default=50
         Number of insertions between automatic sweeps.
+    checkpoint_path : str | Path, optional
+        If given, the set is periodically snapshotted to this path (see `dump`)
+        by a daemon thread, and once more on `close()` / interpreter shutdown.
+    checkpoint_interval : float, default=60.0
+        Seconds between background checkpoints (only used with `checkpoint_path`).
+    background_sweep : float, optional
+        If given, expired keys are purged by a daemon thread every
+        `background_sweep` seconds instead of inline in `add`, so `add` stays
+        O(1) no matter how many keys expire at once.
+    sweep_batch : int, default=256
+        Maximum number of keys the background sweeper removes per lock hold.
+        Must be positive.
+    stats : bool, default=False
+        Record hit/miss/eviction counters and timings, exposed via `stats()`.
+        Counters are updated while the lock is already held; when disabled,
+        nothing is recorded.
+    clock : Callable[[], float], default=time.monotonic
+        Time source (in seconds) used for expiry. Swap it for event time when
+        replaying historical data, or for a fake clock in tests.
 
     Example
     -------
@@ -44,93 +85,524 @@ class TTLSet:
     "file_1" in seen  # False — expired automatically
     ```
 
+    Event-time replay (no sleeping, expiry follows the events):
+
+    ```python
+    seen = TTLSet(ttl=3600, maxsize=1_000_000)
+    for event in events:
+        if seen.contains(event.id, now=event.ts):
+            continue
+        seen.add(event.id, now=event.ts)
+    ```
+
+    Sweeping off the hot path:
+
+    ```python
+    seen = TTLSet(ttl=60, maxsize=1_000_000, background_sweep=1.0)
+    ...
+    seen.close()  # stops the sweeper (also happens at interpreter shutdown)
+    ```
+
+    Warm restart across deploys:
+
+    ```python
+    seen = TTLSet(ttl=3600, maxsize=1_000_000, checkpoint_path="/var/lib/app/seen.ttl")
+    seen.load("/var/lib/app/seen.ttl")  # restore what the previous worker saw
+    ```
+
     Notes
     -----
-    - Uses monotonic time internally (safe against system clock changes).
+    - Uses monotonic time by default (safe against system clock changes).
+    - Explicit ``now=`` values must use the same time base as `clock`; the
+      background sweeper and snapshots always read `clock`.
     - Thread-safe (uses `threading.RLock`).
     - Designed for transient ID tracking or deduplication.
     """
 
-    def __init__(self, ttl: int = 600, maxsize: int = 512, sweep_interval: int = 50):
+    def __init__(
+            self,
+            ttl: int = 600,
+            maxsize: int = 512,
+            sweep_interval: int = 50,
+            checkpoint_path: Optional[Union[str, Path]] = None,
+            checkpoint_interval: float = 60.0,
+            background_sweep: Optional[float] = None,
+            sweep_batch: int = 256,
+            stats: bool = False,
+            clock: Callable[[], float] = monotonic,
+            ):
+        # Validate everything up front so no worker thread starts for a failed init
+        if sweep_batch <= 0:
+            raise ValueError(f"sweep_batch must be positive, got {sweep_batch!r}")
+        if background_sweep is not None and background_sweep <= 0:
+            raise ValueError(f"background_sweep must be positive, got {background_sweep!r}")
+        if checkpoint_path is not None and checkpoint_interval <= 0:
+            raise ValueError(f"checkpoint_interval must be positive, got {checkpoint_interval!r}")
         self._ttl = ttl
         self._maxsize = maxsize
         self._sweep_interval = sweep_interval
         self._insert_count = 0
         self._cache: OrderedDict[str, float] = OrderedDict()
+        # False once an explicit `now=` stores an expiry earlier than the tail's
+        self._ordered = True
         self._lock = threading.RLock()
+        self._clock = clock
+        self._inline_sweep = background_sweep is None
+        self._sweep_batch = sweep_batch
+        self._stats: Optional[_TTLStats] = _TTLStats() if stats else None
+
+        self._checkpoint_path = Path(checkpoint_path) if checkpoint_path is not None else None
+        self._workers: list[_PeriodicWorker] = []
+        self._atexit_hook: Optional[Callable[[], None]] = None
+
+        if background_sweep is not None:
+            self._workers.append(
+                    _PeriodicWorker(self, "_sweep_background", background_sweep, "TTLSet-sweeper")
+                    )
+        if self._checkpoint_path is not None:
+            self._workers.append(
+                    _PeriodicWorker(self, "_checkpoint", checkpoint_interval, "TTLSet-checkpoint")
+                    )
+        if self._workers:
+            self._register_atexit()
 
     # -----------------------------------------------------------------------
     # Public API
     # -----------------------------------------------------------------------
-    def add(self, key: str) -> None:
+    def add(self, key: str, now: Optional[float] = None) -> None:
         """
         Add a key to the set, resetting its expiration timestamp.
 
         If the key already exists, its TTL is refreshed. A cleanup sweep is
-        triggered automatically after every `sweep_interval` insertions.
+        triggered automatically after every `sweep_interval` insertions
+        (unless a background sweeper is running).
 
         Parameters
         ----------
         key : str
             The key to store.
+        now : float, optional
+            Timestamp of the insertion (e.g. an event time). Defaults to `clock()`.
         """
-        now = monotonic()
+        if now is None:
+            now = self._clock()
+        st = self._stats
+        if st is not None:
+            t0 = perf_counter()
         with self._lock:
-            self._cache[key] = now + self._ttl
-            self._cache.move_to_end(key)
+            if st is not None:
+                st.lock_wait_time += perf_counter() - t0
+                prev = self._cache.get(key)
+                if prev is None:
+                    st.inserts += 1
+                elif prev <= now:
+                    st.expirations += 1
+                    st.inserts += 1
+                else:
+                    st.refreshes += 1
+
+            expire = now + self._ttl
+            cache = self._cache
+            if self._ordered and cache and expire < next(reversed(cache.values())):
+                self._ordered = False
+            cache[key] = expire
+            cache.move_to_end(key)
             self._insert_count += 1
 
             # Automatic sweep every N insertions
-            if self._insert_count >= self._sweep_interval:
+            if self._inline_sweep and self._insert_count >= self._sweep_interval:
                 self._insert_count = 0
                 self._sweep_locked(now)
 
             # Enforce maxsize cap
             if len(self._cache) > self._maxsize:
-                self._cache.popitem(last=False)
+                _, expire = self._cache.popitem(last=False)
+                if st is not None:
+                    if expire <= now:
+                        st.expirations += 1
+                    else:
+                        st.evictions += 1
 
-    def __contains__(self, key: str) -> bool:
+    def __contains__(self, key: str, now: Optional[float] = None) -> bool:
         """
         Check if a key exists and is still valid (not expired).
 
-        If the key has expired, it is automatically removed.
+        If the key has expired, it is automatically removed. Use
+        ``contains(key, now=...)`` to check against an explicit timestamp.
 
         Parameters
         ----------
         key : str
             The key to xcheck.
+        now : float, optional
+            Timestamp to evaluate expiry at. Defaults to `clock()`.
 
         Returns
         -------
         bool
             True if key exists and is unexpired, False otherwise.
         """
-        now = monotonic()
+        if now is None:
+            now = self._clock()
+        st = self._stats
+        if st is not None:
+            t0 = perf_counter()
         with self._lock:
+            if st is not None:
+                st.lock_wait_time += perf_counter() - t0
             expire = self._cache.get(key)
             if expire is None:
+                if st is not None:
+                    st.misses += 1
                 return False
             if expire <= now:
                 del self._cache[key]
+                if st is not None:
+                    st.expirations += 1
+                    st.misses += 1
                 return False
+            if st is not None:
+                st.hits += 1
             return True
 
-    def sweep(self) -> None:
-        """Manually remove all expired entries."""
+    contains = __contains__
+
+    def sweep(self, now: Optional[float] = None) -> None:
+        """Manually remove all entries expired at `now` (default: `clock()`)."""
+        st = self._stats
+        if st is not None:
+            t0 = perf_counter()
         with self._lock:
-            self._sweep_locked()
+            if st is not None:
+                st.lock_wait_time += perf_counter() - t0
+            self._sweep_locked(now)
 
     def clear(self) -> None:
         """Remove all entries from the cache immediately."""
         with self._lock:
             self._cache.clear()
+            self._ordered = True
+
+    def stats(self, reset: bool = False) -> Optional[dict[str, float]]:
+        """
+        Return a snapshot of the usage counters (requires ``stats=True``).
+
+        Keys
+        ----
+        hits, misses
+            Outcomes of membership checks.
+        inserts, refreshes
+            `add` calls for new (or expired) keys vs. live keys.
+        expirations
+            Keys removed because their TTL had passed (sweeps, lookups, cap).
+        evictions
+            Live keys dropped by the `maxsize` cap *before* their TTL passed.
+            A non-zero value means the set is undersized and duplicates can
+            slip through downstream.
+        sweeps, sweep_time
+            Number of sweeps and total seconds spent in them.
+        lock_wait_time
+            Total seconds callers spent waiting to acquire the lock.
+        size
+            Current number of stored keys.
+
+        Parameters
+        ----------
+        reset : bool, default=False
+            Zero the counters after taking the snapshot.
+
+        Returns
+        -------
+        dict | None
+            Counter snapshot, or None if statistics are disabled.
+        """
+        st = self._stats
+        if st is None:
+            return None
+        with self._lock:
+            snapshot = {name: getattr(st, name) for name in _TTLStats.__slots__}
+            snapshot["size"] = len(self._cache)
+            if reset:
+                st.reset()
+        return snapshot
+
+    def close(self) -> None:
+        """
+        Stop background threads and write a final checkpoint (if configured).
+
+        Safe to call more than once. The set itself stays usable afterwards,
+        it just no longer sweeps or checkpoints in the background.
+        """
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+        if self._atexit_hook is not None:
+            atexit.unregister(self._atexit_hook)
+            self._atexit_hook = None
+            self._checkpoint()
+
+    def __enter__(self) -> "TTLSet":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -----------------------------------------------------------------------
+    # Persistence
+    # -----------------------------------------------------------------------
+    def dump(self, path: Union[str, Path]) -> int:
+        """
+        Write a compact binary snapshot of all live entries to `path`.
+
+        Expiries are stored as *remaining* TTL relative to the moment of the
+        snapshot (per `clock`), so the file stays meaningful for a process with
+        a different monotonic clock origin. The file is written to a temporary sibling and
+        atomically renamed into place, so readers never see a partial snapshot.
+
+        Parameters
+        ----------
+        path : str | Path
+            Destination file.
+
+        Returns
+        -------
+        int
+            Number of entries written.
+
+        Raises
+        ------
+        TypeError
+            If a stored key is not a string.
+        """
+        with self._lock:
+            now = self._clock()
+            items = list(self._cache.items())
+
+        remaining = array("d")
+        lengths = array("I")
+        keys: list[str] = []
+        for key, expire in items:
+            left = expire - now
+            if left <= 0:
+                continue
+            if not isinstance(key, str):
+                raise TypeError(f"TTLSet.dump() only supports str keys, got {type(key).__name__}")
+            remaining.append(left)
+            lengths.append(len(key))
+            keys.append(key)
+
+        blob = "".join(keys)
+        byteorder = 0 if sys.byteorder == "little" else 1
+        path = Path(path)
+        # Per-thread temp name: a manual dump may race the checkpoint thread
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(_SNAPSHOT_HEADER.pack(
+                        _SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, byteorder, len(keys), len(blob)
+                        ))
+                remaining.tofile(fh)
+                lengths.tofile(fh)
+                fh.write(blob.encode("utf-8", "surrogatepass"))
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return len(keys)
+
+    def load(self, path: Union[str, Path]) -> int:
+        """
+        Restore entries from a snapshot written by `dump`.
+
+        The file is memory-mapped and decoded in bulk, so multi-million entry
+        snapshots reload in well under a second. Each entry expires after its
+        remaining TTL at dump time (capped at this set's `ttl`). Entries already
+        in the set are kept; if a key exists in both, the later expiry wins.
+        `maxsize` is enforced afterwards, evicting the soonest-to-expire keys.
+
+        Parameters
+        ----------
+        path : str | Path
+            Snapshot file to read.
+
+        Returns
+        -------
+        int
+            Number of entries restored from the file.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a valid TTLSet snapshot.
+        """
+        with open(path, "rb") as fh, \
+                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < _SNAPSHOT_HEADER.size:
+                raise ValueError(f"{path!s} is not a TTLSet snapshot (truncated header)")
+            magic, version, byteorder, count, chars = _SNAPSHOT_HEADER.unpack_from(mm, 0)
+            if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+                raise ValueError(f"{path!s} is not a TTLSet snapshot (v{_SNAPSHOT_VERSION})")
+
+            offset = _SNAPSHOT_HEADER.size
+            remaining = array("d")
+            lengths = array("I")
+            end = offset + count * remaining.itemsize
+            remaining.frombytes(mm[offset:end])
+            offset, end = end, end + count * lengths.itemsize
+            lengths.frombytes(mm[offset:end])
+            blob = mm[end:].decode("utf-8", "surrogatepass")
+            if len(blob) != chars or len(lengths) != count:
+                raise ValueError(f"{path!s} is a truncated TTLSet snapshot")
+
+        if byteorder != (0 if sys.byteorder == "little" else 1):
+            remaining.byteswap()
+            lengths.byteswap()
+
+        ends = accumulate(lengths)
+        keys = [blob[end - size:end] for end, size in zip(ends, lengths)]
+        ttl = self._ttl
+        with self._lock:
+            now = self._clock()
+            expiries = [now + (left if left < ttl else ttl) for left in remaining]
+            loaded = OrderedDict(zip(keys, expiries))
+            ordered = all(a <= b for a, b in zip(expiries, islice(expiries, 1, None)))
+
+            if self._cache or not ordered:
+                # Keep the cache ordered by expiry so eviction stays oldest-first
+                for key, expire in self._cache.items():
+                    if loaded.get(key, expire) <= expire:
+                        loaded[key] = expire
+                loaded = OrderedDict(sorted(loaded.items(), key=itemgetter(1)))
+
+            while len(loaded) > self._maxsize:
+                loaded.popitem(last=False)
+            self._cache = loaded
+            self._ordered = True
+
+        return len(keys)
 
     # -----------------------------------------------------------------------
     # Internal helpers
     # -----------------------------------------------------------------------
     def _sweep_locked(self, now: Optional[float] = None) -> None:
         """Internal cleanup (assumes lock already held)."""
-        now = now or monotonic()
+        st = self._stats
+        if st is not None:
+            t0 = perf_counter()
+        if now is None:
+            now = self._clock()
         expired = [k for k, exp in self._cache.items() if exp <= now]
         for k in expired:
             self._cache.pop(k, None)
+        if st is not None:
+            st.sweeps += 1
+            st.expirations += len(expired)
+            st.sweep_time += perf_counter() - t0
+
+    def _sweep_background(self) -> None:
+        """
+        Purge expired keys from the front of the cache in bounded slices.
+
+        Keys are kept in expiry order (every `add` moves its key to the end with
+        the newest expiry), so expired keys form a prefix. The lock is released
+        after every `sweep_batch` removals to let callers interleave.
+
+        An explicit ``add(now=...)`` earlier than the newest expiry breaks that
+        order; the sweeper then falls back to a full `_sweep_locked` scan until
+        the remaining keys are back in expiry order.
+        """
+        if not self._ordered:
+            with self._lock:
+                if not self._ordered:
+                    self._sweep_locked()
+                    values = list(self._cache.values())
+                    self._ordered = all(a <= b for a, b in zip(values, islice(values, 1, None)))
+                    return
+        st = self._stats
+        t0 = perf_counter()
+        while True:
+            with self._lock:
+                cache = self._cache
+                now = self._clock()
+                for _ in range(self._sweep_batch):
+                    if not cache or next(iter(cache.values())) > now:
+                        if st is not None:
+                            st.sweeps += 1
+                            st.sweep_time += perf_counter() - t0
+                        return
+                    cache.popitem(last=False)
+                    if st is not None:
+                        st.expirations += 1
+
+    def _checkpoint(self) -> None:
+        """Write a snapshot to `checkpoint_path` (no-op if not configured)."""
+        if self._checkpoint_path is not None:
+            self.dump(self._checkpoint_path)
+
+    def _register_atexit(self) -> None:
+        """Stop workers (and checkpoint) at interpreter shutdown without pinning `self`."""
+        ref = weakref.ref(self)
+
+        def _hook() -> None:
+            obj = ref()
+            if obj is not None:
+                obj.close()
+
+        self._atexit_hook = _hook
+        atexit.register(_hook)
+
+
+class _TTLStats:
+    """Mutable counters for `TTLSet(stats=True)`; only touched under the set's lock."""
+
+    __slots__ = (
+            "hits", "misses", "inserts", "refreshes", "expirations", "evictions",
+            "sweeps", "sweep_time", "lock_wait_time",
+            )
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+
+class _PeriodicWorker:
+    """
+    Daemon thread that calls `getattr(owner, method)()` every `interval` seconds.
+
+    Holds only a weak reference to the owner, so a forgotten `TTLSet` can still
+    be garbage-collected; the thread exits once the owner is gone or `stop()`
+    is called. Exceptions raised by a call are logged and the worker carries on.
+    """
+
+    def __init__(self, owner: object, method: str, interval: float, name: str):
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval!r}")
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+                target=self._run,
+                args=(weakref.ref(owner), method, interval, self._stop),
+                name=name,
+                daemon=True,
+                )
+        self._thread.start()
+
+    @staticmethod
+    def _run(ref: "weakref.ref", method: str, interval: float, stop: threading.Event) -> None:
+        while not stop.wait(interval):
+            owner = ref()
+            if owner is None:
+                return
+            try:
+                getattr(owner, method)()
+            except Exception:
+                # A failed tick must not kill the worker, but must not go unnoticed.
+                _log.exception("%s.%s failed in background worker", type(owner).__name__, method)
+            del owner
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
@@ -8,18 +8,49 @@ from uuid import UUID
 
 from typing_extensions import Annotated
 
+from .._lazy import LazyModule
 
-def _vUUIDFactory():
+core_schema = LazyModule("pydantic_core.core_schema")
+
+
+def _validate_uuid(val: Any) -> str:
+    if isinstance(val, UUID):
+        return str(val)
+    try:
+        return str(UUID(str(val)))
+    except Exception:
+        raise ValueError(f"{val!r} is not a valid UUID")
+
+
+class _UUIDValidator:
+    """Internal Pydantic integration hooks."""
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, _source_type: Any, handler):
+        if not core_schema:
+            raise NotImplementedError(
+                    "Could not import pydantic_core; install Pydantic v2+"
+                    )
+        return core_schema.no_info_plain_validator_function(_validate_uuid)
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, _core_schema, handler):
+        schema = handler(_core_schema)
+        schema.update({"type": "string", "format": "uuid"})
+        return schema
+
+
+_ANNOTATED = Annotated[str, _UUIDValidator]
+
+
+class _UUIDLike:
     """
-    Create a strict UUID validator type with Pydantic v2 integration.
+    Strict UUID validator type with Pydantic v2 integration.
 
     This behaves like a runtime-checked `str` subtype that only accepts
     valid UUID strings or UUID objects. Invalid inputs raise `ValueError`.
-
-    Returns
-    -------
-    type[str]
-        Callable validator class compatible with Pydantic v2.
+    Module-level and pickled by reference to the shared instance, so models
+    using it can be sent to process pools.
 
     Examples
     --------
@@ -33,54 +64,31 @@ def _vUUIDFactory():
         >>> Model(run_id="550e8400-e29b-41d4-a716-446655440000")
         Model(run_id='550e8400-e29b-41d4-a716-446655440000')
     """
+    __origin__ = _ANNOTATED
+
+    def __call__(self, val: Any) -> str:
+        return _validate_uuid(val)
+
+    def __mro_entries__(self, bases):
+        return (_ANNOTATED,)
+
+    def __reduce__(self):
+        return _vUUIDFactory, ()
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, _source_type: Any, handler):
+        return handler.generate_schema(_ANNOTATED)
+
+    def __repr__(self):
+        return "UUIDLike"
+
+
+_UUID_LIKE = _UUIDLike()
+
 
-    def _validate(val: Any) -> str:
-        if isinstance(val, UUID):
-            return str(val)
-        try:
-            return str(UUID(str(val)))
-        except Exception:
-            raise ValueError(f"{val!r} is not a valid UUID")
-
-    class _Validator:
-        """Internal Pydantic integration hooks."""
-
-        @classmethod
-        def __get_pydantic_core_schema__(cls, _source_type: Any, handler):
-            try:
-                from pydantic_core import core_schema
-                return core_schema.no_info_plain_validator_function(_validate)
-            except ImportError:
-                raise NotImplementedError(
-                        "Could not import pydantic_core; install Pydantic v2+"
-                        )
-
-        @classmethod
-        def __get_pydantic_json_schema__(cls, _core_schema, handler):
-            schema = handler(_core_schema)
-            schema.update({"type": "string", "format": "uuid"})
-            return schema
-
-    annotated = Annotated[str, _Validator]
-
-    class _Wrapper:
-        """Callable + Pydantic-compatible UUID type."""
-        __origin__ = annotated
-
-        def __call__(self, val: Any) -> str:
-            return _validate(val)
-
-        def __mro_entries__(self, bases):
-            return (annotated,)
-
-        @classmethod
-        def __get_pydantic_core_schema__(cls, _source_type: Any, handler):
-            return handler.generate_schema(annotated)
-
-        def __repr__(self):
-            return "UUIDLike"
-
-    return _Wrapper()
+def _vUUIDFactory() -> _UUIDLike:
+    """Return the shared `UUIDLike` instance (also the unpickling hook)."""
+    return _UUID_LIKE
 
 
 UUIDLike = cast(type[str], _vUUIDFactory())
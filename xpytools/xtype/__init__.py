@@ -9,6 +9,7 @@ Runtime-safe extended types and validators.
 
 Includes:
     • TTLSet      → Thread-safe expiring set for in-memory tracking.
+    • SharedTTLSet → Cross-process expiring set on shared memory.
     • UUIDLike    → Pydantic-compatible UUID string validator.
     • literal     → Runtime-constrained pseudo-Literal types.
     • xcheck       → `is_*` validators for runtime-safe type checking.
@@ -18,12 +19,14 @@ Includes:
 from __future__ import annotations
 
 from . import xcheck, xcast, choice
+from .SharedTTLSet import SharedTTLSet
 from .TTLSet import TTLSet
 from .UUIDLike import UUIDLike
 from .choice import strChoice, intChoice, floatChoice, anyChoice
 
 __all__ = [
         "TTLSet",
+        "SharedTTLSet",
         "UUIDLike",
         "strChoice",
         'intChoice',
@@ -1,14 +1,243 @@
 #  Copyright (c) 2025.
 #  Author: Willem van der Schans.
 #  Licensed under the MIT License (https://opensource.org/license/mit).
-from typing import Any
+import threading
+import weakref
+from typing import Any, Dict, FrozenSet, Hashable, Optional, Tuple
 
 from typing_extensions import Annotated, TypeVar
 
+from ..._lazy import LazyModule
+
+core_schema = LazyModule("pydantic_core.core_schema")
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
 T = TypeVar("T")
 
+# Interned choice types, keyed by casefold flag, choices and their types so
+# that e.g. intChoice(1) and floatChoice(1.0) (equal and equal-hashing) stay distinct.
+# Held weakly: choice types built on the fly (e.g. per request) do not pile up.
+_InternKey = Tuple[bool, Tuple[Hashable, ...], Tuple[type, ...]]
+_INTERNED: "weakref.WeakValueDictionary[_InternKey, _LiteralEnum]" = weakref.WeakValueDictionary()
+_INTERN_LOCK = threading.Lock()
+
+_MISSING = object()
+
+
+def _normalize(val: Any, casefold: bool) -> str:
+    """Coercion-index key: the string form of a value, optionally case-folded."""
+    key = val if isinstance(val, str) else str(val)
+    return key.casefold() if casefold else key
+
+
+class _LiteralEnum:
+    """
+    Runtime-validated literal type built by `_LiteralEnumType`.
+
+    Defined at module level and pickled by its choices (`__reduce__`), so
+    choice types and the Pydantic models using them can be sent to process
+    pools; unpickling returns the interned instance of the receiving process.
 
-def _LiteralEnumType(*choices: T):
+    Validation is a frozenset lookup, then a lookup of the value's normalized
+    string form (``"1"`` → ``1``, case-folded with ``casefold=True``); only
+    values missing both fall back to ``base_type(val)`` coercion.
+    """
+
+    __slots__ = (
+        "__choices__", "_base_type", "_casefold", "_members", "_index", "_annotated",
+        "__weakref__",
+    )
+
+    def __init__(self, choices: Tuple[Any, ...], base_type: Any, casefold: bool = False):
+        self.__choices__ = choices
+        self._base_type = base_type
+        self._casefold = casefold
+        try:
+            self._members: Optional[FrozenSet[Any]] = frozenset(choices)
+        except TypeError:  # unhashable choices → tuple scan
+            self._members = None
+
+        # Mixed (Any) choice sets never coerced; only case-folded strings are indexed.
+        index: Dict[str, Any] = {}
+        for c in reversed(choices):  # first choice wins on collisions
+            if base_type is not Any or (casefold and isinstance(c, str)):
+                index[_normalize(c, casefold)] = c
+        self._index = index
+        # Built on first subclassing: typing caches Annotated[...] (and with it
+        # `self`) strongly, which would keep every interned instance alive.
+        self._annotated = None
+
+    def _validate(self, val: Any) -> Any:
+        members = self._members
+        if members is not None:
+            try:
+                if val in members:
+                    return val
+            except TypeError:  # unhashable value
+                pass
+        elif val in self.__choices__:
+            return val
+
+        if self._index:
+            hit = self._index.get(_normalize(val, self._casefold), _MISSING)
+            if hit is not _MISSING:
+                return hit
+
+        # Slow path, kept for compatibility (e.g. " 7" → 7, "1e2" → 100.0).
+        choices = self.__choices__
+        try:
+            coerced = self._base_type(val)
+        except Exception:
+            raise ValueError(f"{val!r} is not one of {choices}")
+        if coerced in choices:
+            return coerced
+        raise ValueError(f"{val!r} is not one of {choices}")
+
+    def __call__(self, val: Any) -> Any:
+        return self._validate(val)
+
+    def __iter__(self):
+        return iter(self.__choices__)
+
+    def __repr__(self):
+        return f"LiteralEnum{self.__choices__}"
+
+    def __mro_entries__(self, bases):
+        if self._annotated is None:
+            self._annotated = Annotated[self._base_type, self]
+        return (self._annotated,)
+
+    def __reduce__(self):
+        return _unpickle, (self.__choices__, self._casefold)
+
+    # -----------------------------------------------------------------------
+    # Column-wise (vectorized) helpers
+    # -----------------------------------------------------------------------
+    def _as_series(self, values: Any, method: str) -> "pd.Series":
+        if not pd:
+            raise ImportError(f"Missing required module(s): pandas for function '{method}'.")
+        if self._members is None:
+            raise TypeError(f"{method} requires hashable choices, got {self.__choices__}")
+        series = values if isinstance(values, pd.Series) else pd.Series(values)
+        if self._casefold and self._index:
+            # Replace case variants by their declared spelling (looked up once per distinct value)
+            known = series.isin(self._members)
+            if not known.all():
+                mapping = {}
+                for v in pd.unique(series[~known].dropna()):
+                    if isinstance(v, str):
+                        hit = self._index.get(v.casefold(), _MISSING)
+                        if hit is not _MISSING:
+                            mapping[v] = hit
+                if mapping:
+                    series = series.mask(series.isin(list(mapping)), series.map(mapping))
+        return series
+
+    def _raise_invalid(self, series: "pd.Series", valid: "pd.Series") -> None:
+        bad = np.flatnonzero(~valid.to_numpy())
+        more = ", ..." if len(bad) > 5 else ""
+        raise ValueError(
+                f"{len(bad)} invalid value(s) at positions {bad[:5].tolist()}{more}: "
+                f"{series.iloc[bad[:5]].tolist()} (allowed: {self.__choices__})"
+                )
+
+    def validate_array(self, values: Any, raise_errors: bool = False) -> Any:
+        """
+        Check a whole column against the choices in one vectorized pass.
+
+        Membership is exact (hash-based `isin`, no per-cell coercion), except
+        that case variants match when the type was built with ``casefold=True``.
+        Missing values are invalid unless ``None`` is one of the choices.
+
+        Parameters
+        ----------
+        values : pandas.Series | numpy.ndarray | list-like
+            Values to check.
+        raise_errors : bool, default=False
+            Raise `ValueError` naming the first invalid positions instead of
+            returning a mask with False entries.
+
+        Returns
+        -------
+        pandas.Series | numpy.ndarray
+            Boolean mask, True where the value is a valid choice. A Series
+            (same index) for Series input, otherwise a numpy array.
+
+        Examples
+        --------
+        >>> Status = strChoice("open", "closed")
+        >>> Status.validate_array(df["status"])            # boolean Series
+        >>> Status.validate_array(df["status"], raise_errors=True)
+        Traceback (most recent call last):
+        ...
+        ValueError: 2 invalid value(s) at positions [3, 7]: ['Open', None]
+            (allowed: ('open', 'closed'))
+        """
+        series = self._as_series(values, "validate_array")
+        mask = series.isin(self._members)
+        if raise_errors and not mask.all():
+            self._raise_invalid(series, mask)
+        return mask if isinstance(values, pd.Series) else mask.to_numpy()
+
+    def to_categorical(self, values: Any, codes: bool = False, raise_errors: bool = True) -> Any:
+        """
+        Dictionary-encode a column using the choices (in declaration order) as categories.
+
+        A categorical column stores each distinct choice once plus a small
+        integer code per row (int8 for up to 127 choices), a fraction of the
+        memory of an object column of strings.
+
+        Parameters
+        ----------
+        values : pandas.Series | numpy.ndarray | list-like
+            Values to encode. Missing values become NaN / code -1.
+        codes : bool, default=False
+            Return the integer codes (the index of each value in the choices)
+            instead of a categorical.
+        raise_errors : bool, default=True
+            Raise `ValueError` on values outside the choices; with False they
+            are encoded as missing.
+
+        Returns
+        -------
+        pandas.Series | pandas.Categorical | numpy.ndarray
+            For Series input a Series (categorical dtype, or integer codes)
+            with the same index and name; otherwise a `pandas.Categorical`,
+            or a numpy array of codes.
+
+        Examples
+        --------
+        >>> Status = strChoice("open", "closed")
+        >>> Status.to_categorical(pd.Series(["closed", "open"]), codes=True).tolist()
+        [1, 0]
+        """
+        series = self._as_series(values, "to_categorical")
+        if raise_errors:
+            valid = series.isin(self._members) | series.isna()
+            if not valid.all():
+                self._raise_invalid(series, valid)
+        categorical = pd.Categorical(series, categories=list(self.__choices__))
+        if isinstance(values, pd.Series):
+            if codes:
+                return pd.Series(categorical.codes, index=values.index, name=values.name)
+            return pd.Series(categorical, index=values.index, name=values.name)
+        return categorical.codes if codes else categorical
+
+    def __get_pydantic_core_schema__(self, _source_type: Any, handler):
+        if not core_schema:
+            raise NotImplementedError(
+                    "Could not import pydantic_core; "
+                    "install Pydantic v2+ for integration."
+                    )
+        return core_schema.no_info_plain_validator_function(self._validate)
+
+
+def _unpickle(choices: Tuple[Any, ...], casefold: bool) -> _LiteralEnum:
+    return _LiteralEnumType(*choices, casefold=casefold)
+
+
+def _LiteralEnumType(*choices: T, casefold: bool = False):
     """
     Create a pseudo-`Literal` type that validates values at runtime.
 
@@ -25,6 +254,9 @@ def _LiteralEnumType(*choices: T):
     *choices : Any
         The allowed values for the literal type.
         Mixing types is allowed, but disables static type inference.
+    casefold : bool, default=False
+        Match string input case-insensitively, returning the choice as
+        declared (``"RED"`` → ``"red"``).
 
     Returns
     -------
@@ -64,10 +296,23 @@ def _LiteralEnumType(*choices: T):
     - If mixed types are supplied, it falls back to `Any`.
     - This is particularly useful when you want to enforce a small set
       of valid values at runtime while keeping normal primitive behavior.
+    - Equal choice tuples return the same (interned) instance, and instances
+      are picklable, so they can be used in models sent to process pools.
     """
     if not choices:
         raise ValueError("Must supply at least one choice")
 
+    choices = tuple(choices)
+    try:
+        key = (casefold, choices, tuple(map(type, choices)))
+        hash(key)
+    except TypeError:  # unhashable choices (e.g. anyChoice({})) are not interned
+        key = None
+    if key is not None:
+        cached = _INTERNED.get(key)
+        if cached is not None:
+            return cached
+
     base_type = type(choices[0])
     for v in choices:
         if type(v) is not type(choices[0]):
@@ -75,55 +320,8 @@ def _LiteralEnumType(*choices: T):
             base_type = Any
             break
 
-    def _validate(val: Any) -> T:
-        if val in choices:
-            return val
-        try:
-            coerced = base_type(val)
-        except Exception:
-            raise ValueError(f"{val!r} is not one of {choices}")
-        if coerced in choices:
-            return coerced
-        raise ValueError(f"{val!r} is not one of {choices}")
-
-    class _Validator:
-        @classmethod
-        def __get_pydantic_core_schema__(cls, _source_type: Any, handler):
-            try:
-                from pydantic_core import core_schema
-                return core_schema.no_info_plain_validator_function(_validate)
-            except ImportError:
-                raise NotImplementedError(
-                        "Could not import pydantic_core; "
-                        "install Pydantic v2+ for integration."
-                        )
-
-    annotated = Annotated[base_type, _Validator]
-
-    class _Wrapper:
-        __choices__ = tuple(choices)
-
-        def __call__(self, val: Any) -> T:
-            return _validate(val)
-
-        def __iter__(self):
-            return iter(self.__choices__)
-
-        def __repr__(self):
-            return f"LiteralEnum{self.__choices__}"
-
-        def __mro_entries__(self, bases):
-            return (annotated,)
-
-        @classmethod
-        def __get_pydantic_core_schema__(cls, _source_type: Any, handler):
-            try:
-                from pydantic_core import core_schema
-                return core_schema.no_info_plain_validator_function(_validate)
-            except ImportError:
-                raise NotImplementedError(
-                        "Could not import pydantic_core; "
-                        "install Pydantic v2+ for integration."
-                        )
-
-    return _Wrapper()
\ No newline at end of file
+    literal = _LiteralEnum(choices, base_type, casefold)
+    if key is None:
+        return literal
+    with _INTERN_LOCK:
+        return _INTERNED.setdefault(key, literal)
@@ -3,7 +3,7 @@ from typing import Any
 from ._LiteralEnumType import _LiteralEnumType
 
 
-def anyChoice(*choices: Any):
+def anyChoice(*choices: Any, casefold: bool = False):
     """
     Constrain a field to a fixed set of **arbitrary values**.
 
@@ -15,6 +15,8 @@ def anyChoice(*choices: Any):
     ----------
     *choices : Any
         Arbitrary allowed values. Typing.Types may differ.
+    casefold : bool, default=False
+        Match string choices case-insensitively.
 
     Returns
     -------
@@ -33,4 +35,4 @@ def anyChoice(*choices: Any):
         ...
         ValueError: 'bar' is not one of ('foo', 1, 2.5, {})
     """
-    return _LiteralEnumType(*choices)
+    return _LiteralEnumType(*choices, casefold=casefold)
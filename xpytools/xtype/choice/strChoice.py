@@ -3,7 +3,7 @@ from typing import cast
 from ._LiteralEnumType import _LiteralEnumType
 
 
-def strChoice(*choices: str) -> type[str]:
+def strChoice(*choices: str, casefold: bool = False) -> type[str]:
     """
     Constrain a string field to a fixed set of allowed values.
 
@@ -15,6 +15,8 @@ def strChoice(*choices: str) -> type[str]:
     ----------
     *choices : str
         Allowed string values.
+    casefold : bool, default=False
+        Accept input in any letter case; the declared spelling is returned.
 
     Returns
     -------
@@ -37,6 +39,11 @@ def strChoice(*choices: str) -> type[str]:
         ...
         ValueError: 'yellow' is not one of ('red', 'green', 'blue')
 
+    Case-insensitive matching:
+        >>> Method = strChoice("GET", "POST", casefold=True)
+        >>> Method("get")
+        'GET'
+
     Integration with Pydantic:
         >>> from xpyt_pydantic import BaseModel
         >>> class Item(BaseModel):
@@ -48,4 +55,4 @@ def strChoice(*choices: str) -> type[str]:
         ...
         pydantic_core._pydantic_core.ValidationError: ...
     """
-    return cast(type[str], _LiteralEnumType(*choices))
+    return cast(type[str], _LiteralEnumType(*choices, casefold=casefold))
@@ -5,21 +5,28 @@ from typing import Optional, Any
 from typing_extensions import TYPE_CHECKING
 
 from .json import as_json
+from ..choice import strChoice
 from ..xcheck import is_df, is_json_like
+from ..._lazy import LazyModule
 
 if TYPE_CHECKING:
     from pandas import DataFrame as pdDataFrame
 
 from ...xdeco import requireModules
 
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+
+_backend = strChoice("pandas", "polars")
+
 
 @requireModules(["pandas"], exc_raise=True)
-def as_df(value: Any, safe: bool = True) -> Optional["pdDataFrame"]:
+def as_df(value: Any, safe: bool = True, backend: str = "pandas") -> Optional["pdDataFrame"]:
     """
-    Safely convert various input types into a pandas DataFrame.
+    Safely convert various input types into a pandas (or polars) DataFrame.
 
     This function supports:
-      - Already a DataFrame → returns as-is
+      - Already a DataFrame (pandas, or polars DataFrame/LazyFrame) → returns as-is
       - Dict, list of dicts, or JSON string → converts via pandas.DataFrame
       - Returns None for invalid or unconvertible inputs
       - Returns None if pandas is not installed (instead of raising ImportError)
@@ -30,11 +37,13 @@ def as_df(value: Any, safe: bool = True) -> Optional["pdDataFrame"]:
         Input value to convert (DataFrame, dict, list, JSON string, etc.)
     safe : bool, default=True
         If True, swallows conversion errors and returns None instead of raising.
+    backend : {"pandas", "polars"}, default="pandas"
+        Library used to build new DataFrames.
 
     Returns
     -------
-    Optional[pandas.DataFrame]
-        A pandas DataFrame if conversion succeeds, otherwise None.
+    Optional[pandas.DataFrame | polars.DataFrame]
+        A DataFrame if conversion succeeds, otherwise None.
 
     Examples
     --------
@@ -54,25 +63,28 @@ def as_df(value: Any, safe: bool = True) -> Optional["pdDataFrame"]:
     2  3
     >>> as_df("bad json") is None
     True
+    >>> as_df({'a': [1, 2]}, backend="polars").shape
+    (2, 1)
     """
+    backend = _backend(backend)
     try:
-        # Import inside function to avoid hard pandas dependency
-        from pandas import DataFrame as pdDataFrame
-
         # Already a DataFrame → return as-is
         if is_df(value):
             return value
 
+        # Inside the try: a missing polars is a conversion failure in safe mode
+        frame = pl.DataFrame if backend == "polars" else pd.DataFrame
+
         # JSON-like (dict, list, or valid JSON string)
         if is_json_like(value):
             parsed = as_json(value)
             if parsed is None:
                 raise ValueError("Invalid JSON value")
-            return pdDataFrame(parsed)
+            return frame(parsed)
 
         # Try generic coercion (lists of tuples, numpy arrays, etc.)
         try:
-            return pdDataFrame(value)
+            return frame(value)
         except Exception:
             raise
 
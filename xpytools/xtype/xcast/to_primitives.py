@@ -31,22 +31,14 @@ from ..xcheck import (
     is_list_like,
     is_dict,
     )
+from ..xcheck.dataframe import _is_arrow, _is_polars
+from ..._lazy import LazyModule
 
-# Optional dependencies (fail gracefully)
-try:
-    import numpy as np
-except ImportError:  # pragma: no cover
-    np = None  # type: ignore
-
-try:
-    import pandas as pd
-except ImportError:  # pragma: no cover
-    pd = None  # type: ignore
-
-try:
-    import pydantic as pyd
-except ImportError:  # pragma: no cover
-    pyd = None  # type: ignore
+# Optional dependencies (imported on first use only)
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+pyd = LazyModule("pydantic")
 
 
 def to_primitives(obj: Any) -> Any:
@@ -59,6 +51,9 @@ def to_primitives(obj: Any) -> Any:
     - Pydantic models → dict (handles both v1 & v2)
     - pandas.DataFrame → list[dict]
     - pandas.Series → list
+    - polars.DataFrame / LazyFrame → list[dict] (lazy frames are collected)
+    - polars.Series → list
+    - pyarrow.Table / RecordBatch → list[dict]
     - NumPy scalars / arrays → native Python types
     - Enum → enum.value
     - NaN / pd.NA / None-like → None
@@ -89,6 +84,18 @@ def to_primitives(obj: Any) -> Any:
     >>> to_primitives(M(a=1, b=float("nan")))
     {'a': 1, 'b': None}
     """
+    # --- polars / pyarrow --------------------------------------------------
+    # Checked before is_none(): a pyarrow table holding NaN is != itself.
+    if _is_polars(obj):
+        frame = obj.collect() if isinstance(obj, pl.LazyFrame) else obj
+        return to_primitives(frame.to_dicts())
+
+    if pl.loaded and isinstance(obj, pl.Series):
+        return to_primitives(obj.drop_nulls().to_list())
+
+    if _is_arrow(obj):
+        return to_primitives(obj.to_pylist())
+
     # --- Null / None-like ---------------------------------------------------
     if is_none(obj):
         return None
@@ -98,7 +105,7 @@ def to_primitives(obj: Any) -> Any:
         return to_primitives(asdict(obj))
 
     # --- Pydantic models ----------------------------------------------------
-    if pyd is not None:
+    if pyd.loaded:
         # Pydantic v1: BaseModel
         if hasattr(obj, "dict") and callable(getattr(obj, "dict", None)):
             try:
@@ -133,13 +140,13 @@ def to_primitives(obj: Any) -> Any:
         except Exception:
             return None
 
-    if pd is not None and isinstance(obj, getattr(pd, "Series", ())):
+    if pd.loaded and isinstance(obj, pd.Series):
         try:
             return to_primitives(obj.dropna().tolist())
         except Exception:
             return None
 
-    if np is not None:
+    if np.loaded:
         # NumPy scalar
         if isinstance(obj, np.generic):
             return obj.item()
@@ -148,15 +155,15 @@ def to_primitives(obj: Any) -> Any:
             try:
                 return to_primitives(
                         np.where(pd.isna(obj), None, obj).tolist()
-                        if pd is not None else obj.tolist()
+                        if pd.loaded else obj.tolist()
                         )
             except Exception:
                 return to_primitives(obj.tolist())
 
     # --- Primitive / fallback ----------------------------------------------
-    if isinstance(obj, float) and np is not None and np.isnan(obj):
+    if isinstance(obj, float) and np.loaded and np.isnan(obj):
         return None
-    if pd is not None and getattr(pd, "isna", None) and pd.isna(obj):
+    if pd.loaded and pd.isna(obj):
         return None
 
     if isinstance(obj, (str, int, float, bool)) or obj is None:
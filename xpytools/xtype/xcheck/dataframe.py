@@ -2,17 +2,29 @@ from __future__ import annotations
 
 from typing import Any
 
-from typing_extensions import TYPE_CHECKING
+from ..._lazy import LazyModule
 
-if TYPE_CHECKING:
-    from pandas import DataFrame as pdDataFrame
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+pa = LazyModule("pyarrow")
 
 
 def is_df(obj: Any) -> bool:
-    """Return True if `obj` looks like a pandas DataFrame."""
-    try:
-        from pandas import DataFrame as pdDataFrame
-    except ImportError:
-        return False
+    """
+    Return True if `obj` is a DataFrame: pandas, polars (DataFrame or
+    LazyFrame) or pyarrow (Table or RecordBatch).
+    """
+    # No import needed to say "no": a DataFrame implies its library is loaded
+    if pd.loaded and isinstance(obj, pd.DataFrame):
+        return True
+    return _is_polars(obj) or _is_arrow(obj)
 
-    return isinstance(obj, pdDataFrame)
+
+def _is_polars(obj: Any) -> bool:
+    """Return True if `obj` is a polars DataFrame or LazyFrame."""
+    return pl.loaded and isinstance(obj, (pl.DataFrame, pl.LazyFrame))
+
+
+def _is_arrow(obj: Any) -> bool:
+    """Return True if `obj` is a pyarrow Table or RecordBatch."""
+    return pa.loaded and isinstance(obj, (pa.Table, pa.RecordBatch))
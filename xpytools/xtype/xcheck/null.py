@@ -2,6 +2,17 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..._lazy import LazyModule
+
+pd = LazyModule("pandas")
+
+# Lower-cased string tokens treated as null (also matched with spaces, '-' and '.' removed)
+_NULL_LIKE = frozenset({
+        "", "none", "null", "nil",
+        "na", "n/a", "n.a", "n a", "n-a",
+        "nan", "nann", "n.a.", "notapplicable", "missing", "void"
+        })
+
 
 def is_none(value: Any) -> bool:
     """
@@ -17,50 +28,27 @@ def is_none(value: Any) -> bool:
     if value is None:
         return True
 
-    # NaN-like
+    # NaN-like (float nan, numpy NaN scalars, pandas.NaT)
     try:
         if value != value:
             return True
     except Exception:
         pass
 
-    # NumPy / pandas
-    try:
-        import numpy as np
-        if value is np.nan:
-            return True
-        if isinstance(value, np.generic):
-            try:
-                if np.isnan(value):
-                    return True
-            except Exception:
-                pass
-    except ImportError:
-        pass
-
-    try:
-        import pandas as pd
-        if getattr(pd, "isna", None):
-            try:
-                if pd.isna(value):
-                    return True
-            except Exception:
-                pass
-    except ImportError:
-        pass
-
     # String null-like
     if isinstance(value, str):
         v = value.strip().lower()
-        compact = v.replace(" ", "").replace("-", "").replace(".", "")
-
-        null_like = {
-                "", "none", "null", "nil",
-                "na", "n/a", "n.a", "n a", "n-a",
-                "nan", "nann", "n.a.", "notapplicable", "missing", "void"
-                }
-
-        if v in null_like or compact in null_like:
+        if v in _NULL_LIKE:
             return True
+        compact = v.replace(" ", "").replace("-", "").replace(".", "")
+        return compact in _NULL_LIKE
+
+    # pandas scalars (pd.NA, ...) can only exist once pandas is imported
+    if pd.loaded:
+        try:
+            if pd.isna(value):
+                return True
+        except Exception:
+            pass
 
     return False